@@ -1,19 +1,67 @@
-import dash
-from dash import html, dcc, Input, Output
-
-import callbacks.core
-import callbacks.lt
-import callbacks.por
-import callbacks.reg
-import callbacks.ui
-
-from layout.layout01_home import home_layout
-from layout.layout02_data import data_layout
-from layout.layout03_core import core_layout
-from layout.layout04_lt import lt_layout
-from layout.layout05_reg import reg_layout
-from layout.layout06_por import por_layout
-from layout.layout07_glossary import glossary_layout
+from utils.profiling import profile_section, finish_startup_profile
+
+# --- Imports (mit --profile-startup bzw. OPENOA_PROFILE_STARTUP=1 einzeln gemessen) ---
+with profile_section("import", "dash"):
+    import dash
+    from dash import html, dcc, Input, Output
+
+with profile_section("config", "data.config"):
+    import data.config
+
+# --- Prüfen, ob data/processed zum Stand der Rohdaten passt ---
+with profile_section("config", "check_build_state"):
+    from utils.build_pipeline import check_build_state
+
+    stale_artifacts = check_build_state(
+        data.config.BUILD_MANIFEST, data.config.BUILD_DIRS, data.config.BUILD_STATE_PATH
+    )
+    if stale_artifacts:
+        print(
+            f"⚠️  {len(stale_artifacts)} abgeleitete Artefakte fehlen oder sind veraltet "
+            f"({', '.join(stale_artifacts)}). Neu bauen mit: python -m scripts.build_artifacts"
+        )
+
+# --- Optional: alle Datensätze parallel vorladen (OPENOA_LOAD_WORKERS > 0) ---
+# Nur beim direkten Start: Kindprozesse des Prozess-Pools importieren dieses Modul bei
+# "spawn" (macOS/Windows) als __mp_main__ neu und dürfen keinen eigenen Pool starten
+if __name__ == "__main__" and data.config.LOAD_WORKERS > 0:
+    import time
+    from utils.parallel_load import preload_registries, format_load_report
+
+    with profile_section("dataset", "preload_registries"):
+        preload_start = time.perf_counter()
+        load_timings = preload_registries(
+            data.config.DATA_REGISTRIES,
+            max_workers=data.config.LOAD_WORKERS,
+            process_workers=data.config.LOAD_PROCESSES
+        )
+        print(format_load_report(load_timings, time.perf_counter() - preload_start))
+
+with profile_section("callbacks", "callbacks.core"):
+    import callbacks.core
+with profile_section("callbacks", "callbacks.lt"):
+    import callbacks.lt
+with profile_section("callbacks", "callbacks.por"):
+    import callbacks.por
+with profile_section("callbacks", "callbacks.reg"):
+    import callbacks.reg
+with profile_section("callbacks", "callbacks.ui"):
+    import callbacks.ui
+
+with profile_section("layout", "layout.layout01_home"):
+    from layout.layout01_home import home_layout
+with profile_section("layout", "layout.layout02_data"):
+    from layout.layout02_data import data_layout
+with profile_section("layout", "layout.layout03_core"):
+    from layout.layout03_core import core_layout
+with profile_section("layout", "layout.layout04_lt"):
+    from layout.layout04_lt import lt_layout
+with profile_section("layout", "layout.layout05_reg"):
+    from layout.layout05_reg import reg_layout
+with profile_section("layout", "layout.layout06_por"):
+    from layout.layout06_por import por_layout
+with profile_section("layout", "layout.layout07_glossary"):
+    from layout.layout07_glossary import glossary_layout
 
 # --- Dash-Initialisierung ---
 external_stylesheets = [
@@ -209,6 +257,8 @@ def highlight_active_link(pathname):
         get_class("/glossary")
     )
 
+finish_startup_profile()
+
 # --- App starten ---
 if __name__ == '__main__':
     import os
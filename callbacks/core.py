@@ -1,5 +1,5 @@
 from dash import callback, Output, Input
-from data.config import DATAFRAMES
+from data.config import DATAFRAMES, DENSITY_POINT_THRESHOLD, STATS_CATALOGS
 from utils.compute_stats import filter_dataframes_by_labels
 from utils.plot_utils.core import plot_core_aep_iteration_analysis
 
@@ -10,4 +10,6 @@ from utils.plot_utils.core import plot_core_aep_iteration_analysis
 def update_core_aep_iteration_analysis(selected_labels):
     """Callback zur Aktualisierung der iterationsspezifischen Metrikanalyse (Core-Tab)."""
     filtered_dfs = filter_dataframes_by_labels(DATAFRAMES, selected_labels)
-    return plot_core_aep_iteration_analysis(filtered_dfs)
\ No newline at end of file
+    return plot_core_aep_iteration_analysis(
+        filtered_dfs, catalogs=STATS_CATALOGS, density_threshold=DENSITY_POINT_THRESHOLD
+    )
\ No newline at end of file
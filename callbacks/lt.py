@@ -1,5 +1,12 @@
-from dash import callback, Output, Input
-from data.config import LONGTERM_DFS
+from dash import callback, ctx, no_update, Output, Input, State
+from data.config import (
+    DENSITY_POINT_THRESHOLD,
+    LONGTERM_MATRICES,
+    LONGTERM_STATS_CATALOGS,
+    LT_METRIC_TABLES,
+    SCATTER_POINT_BUDGET
+)
+from utils.plot_utils.decimation import relayout_view_ranges
 from utils.plot_utils.lt import (
     plot_lt_energy_evolution,
     plot_lt_energy_slope_comparison
@@ -12,22 +19,42 @@ from utils.plot_utils.lt import (
 )
 def update_lt_energy_evolution_plot(selected_labels, selected_column):
     """Aktualisiert die LT-Metrikentwicklung (z. B. Energie/Wind) im Zeitverlauf."""
-    return plot_lt_energy_evolution(LONGTERM_DFS, selected_labels, column=selected_column)
+    return plot_lt_energy_evolution(
+        LONGTERM_MATRICES, selected_labels, column=selected_column,
+        metric_table=LT_METRIC_TABLES[selected_column]
+    )
 
 
 @callback(
     Output("lt-slope-plot", "figure"),
+    Output("lt-slope-view", "data"),
     Input("lt-years-dropdown", "value"),
     Input("lt-left-dropdown", "value"),
     Input("lt-right-dropdown", "value"),
+    Input("lt-slope-plot", "relayoutData"),
+    State("lt-slope-view", "data")
 )
-def update_lt_energy_slope_comparison(selected_years, selected_left_label, selected_right_label):
+def update_lt_energy_slope_comparison(selected_years, selected_left_label, selected_right_label,
+                                      relayout_data, view_ranges):
     """Vergleicht den Einfluss der Steigung (und Wind) auf Energie für zwei ausgewählte Reanalyse-Produkte."""
-    return plot_lt_energy_slope_comparison(
-        LONGTERM_DFS[selected_left_label],
-        LONGTERM_DFS[selected_right_label],
+    if ctx.triggered_id == "lt-slope-plot":
+        # Zoom/Pan: Ausschnitt in voller Auflösung nachladen (andere Layout-Ereignisse ignorieren)
+        view_ranges = relayout_view_ranges(relayout_data, view_ranges)
+        if view_ranges is None:
+            return no_update, no_update
+    else:
+        view_ranges = {}
+
+    fig = plot_lt_energy_slope_comparison(
+        LONGTERM_MATRICES[selected_left_label],
+        LONGTERM_MATRICES[selected_right_label],
         selected_years,
         selected_left_label,
-        selected_right_label
+        selected_right_label,
+        left_stats=LONGTERM_STATS_CATALOGS[selected_left_label],
+        right_stats=LONGTERM_STATS_CATALOGS[selected_right_label],
+        point_budget=SCATTER_POINT_BUDGET,
+        view_ranges=view_ranges,
+        density_threshold=DENSITY_POINT_THRESHOLD
     )
-
+    return fig, view_ranges
@@ -1,5 +1,17 @@
 from dash import callback, Output, Input
-from data.config import DATAFRAMES, POR_SCATTERFRAMES, POR_DATAFRAMES, GROSS_POR_OBSERVED
+from data.config import (
+    DATAFRAMES,
+    POR_SCATTERFRAMES,
+    POR_DATAFRAMES,
+    POR_ITERATION_INDEXES,
+    POR_SCATTER_INDEXES,
+    STATS_CATALOGS,
+    VIOLIN_MODE,
+    VIOLIN_SUMMARIES,
+    ITERATION_METHOD_OPTIONS,
+    GROSS_POR_OBSERVED
+)
+from utils.rank_index import NAMED_QUANTILES, format_percentile
 from utils.plot_utils.por import (
     plot_por_energy_distribution,
     plot_por_regression_analysis,
@@ -16,7 +28,12 @@ def update_por_energy_distribution_plot(label1, label2, options):
     """Verteilung der modellierten Jahresenergie (Histogramm & Violinplot, POR-Tab)."""
     df1 = DATAFRAMES[label1]
     df2 = DATAFRAMES[label2]
-    return plot_por_energy_distribution(df1, df2, label1, label2, GROSS_POR_OBSERVED, options)
+    return plot_por_energy_distribution(
+        df1, df2, label1, label2, GROSS_POR_OBSERVED, options,
+        stats1=STATS_CATALOGS[label1], stats2=STATS_CATALOGS[label2],
+        violins1=VIOLIN_SUMMARIES[label1] if VIOLIN_MODE == "kde" else None,
+        violins2=VIOLIN_SUMMARIES[label2] if VIOLIN_MODE == "kde" else None
+    )
 
 
 @callback(
@@ -30,7 +47,10 @@ def update_por_regression_plot(label1, label2, reg_metric, metric_value):
     """Regressionsanalyse der besten Iteration (POR-Tab)."""
     df1 = POR_SCATTERFRAMES[label1]
     df2 = POR_SCATTERFRAMES[label2]
-    return plot_por_regression_analysis(df1, df2, reg_metric, metric_value, label1, label2)
+    return plot_por_regression_analysis(
+        df1, df2, reg_metric, metric_value, label1, label2,
+        index1=POR_SCATTER_INDEXES[label1], index2=POR_SCATTER_INDEXES[label2]
+    )
 
 
 @callback(
@@ -41,4 +61,45 @@ def update_por_regression_plot(label1, label2, reg_metric, metric_value):
 )
 def update_por_energy_timeseries_plot(selected_labels, metric, method):
     """Modellierte Zeitreihe der monatlichen Energie im POR-Zeitraum."""
-    return plot_por_energy_timeseries(POR_DATAFRAMES, selected_labels, metric=metric, method=method)
\ No newline at end of file
+    return plot_por_energy_timeseries(
+        POR_DATAFRAMES, selected_labels, metric=metric, method=method, indexes=POR_ITERATION_INDEXES
+    )
+
+
+def iteration_method_options(search_value, value):
+    """Feste Auswahl plus eingetipptes bzw. gewähltes Perzentil (z. B. "p97.5")."""
+    options = list(ITERATION_METHOD_OPTIONS)
+    known = {option["value"] for option in options}
+
+    for candidate in (value, search_value):
+        if not candidate or candidate.strip().lower() in NAMED_QUANTILES:
+            continue
+        try:
+            option_value, option_label = format_percentile(candidate)
+        except ValueError:
+            continue
+        if option_value not in known:
+            options.append({"label": option_label, "value": option_value})
+            known.add(option_value)
+
+    return options
+
+
+@callback(
+    Output("por-metric-value-dropdown", "options"),
+    Input("por-metric-value-dropdown", "search_value"),
+    Input("por-metric-value-dropdown", "value")
+)
+def update_por_metric_value_options(search_value, value):
+    """Ergänzt die Wert-Auswahl des Regressionsplots um eingetippte Perzentile."""
+    return iteration_method_options(search_value, value)
+
+
+@callback(
+    Output("timeseries-metric-method-dropdown", "options"),
+    Input("timeseries-metric-method-dropdown", "search_value"),
+    Input("timeseries-metric-method-dropdown", "value")
+)
+def update_timeseries_method_options(search_value, value):
+    """Ergänzt die Wert-Auswahl der Zeitreihe um eingetippte Perzentile."""
+    return iteration_method_options(search_value, value)
\ No newline at end of file
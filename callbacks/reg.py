@@ -1,13 +1,20 @@
-from dash import callback, Output, Input
-from data.config import DATAFRAMES
+from dash import callback, ctx, no_update, Output, Input, State
+from data.config import (
+    DATAFRAMES,
+    STATS_CATALOGS,
+    CORRELATION_MATRICES,
+    CORRELATION_DEFAULT_METRICS,
+    SCATTER_POINT_BUDGET,
+    VIOLIN_MODE,
+    VIOLIN_SUMMARIES
+)
+from utils.plot_utils.decimation import relayout_view_ranges
 from utils.plot_utils.reg import (
     plot_reg_model_distribution,
     plot_reg_model_metric_scatter,
     plot_reg_model_correlation_matrix
 )
 
-METRICS_FOR_CORRELATION = ["slope", "intercept", "mse", "r2", "iav", "aep", "aep_final"]
-
 @callback(
     Output("model-comparison-plot", "figure"),
     Input("metric-dropdown", "value"),
@@ -18,32 +25,63 @@ def update_reg_model_distribution(metric, label1, label2):
     """Vergleicht Modellmetriken mit Histogramm & Violinplot (Reg-Tab)."""
     df1 = DATAFRAMES[label1]
     df2 = DATAFRAMES[label2]
-    return plot_reg_model_distribution(df1, df2, metric, label1, label2)
+    return plot_reg_model_distribution(
+        df1, df2, metric, label1, label2,
+        stats1=STATS_CATALOGS[label1], stats2=STATS_CATALOGS[label2],
+        violins1=VIOLIN_SUMMARIES[label1] if VIOLIN_MODE == "kde" else None,
+        violins2=VIOLIN_SUMMARIES[label2] if VIOLIN_MODE == "kde" else None
+    )
 
 
 @callback(
     Output("modell-scatterplot", "figure"),
+    Output("modell-scatter-view", "data"),
     Input("x-metric-dropdown", "value"),
     Input("y-metric-dropdown", "value"),
     Input("z-metric-dropdown", "value"),
     Input("size-metric-dropdown", "value"),  # <--- NEU
     Input("scatter-label-1-dropdown", "value"),
-    Input("scatter-label-2-dropdown", "value")
+    Input("scatter-label-2-dropdown", "value"),
+    Input("modell-scatterplot", "relayoutData"),
+    State("modell-scatter-view", "data")
 )
-def update_reg_model_metric_scatter(x_metric, y_metric, z_metric, size_metric, label1, label2):
+def update_reg_model_metric_scatter(x_metric, y_metric, z_metric, size_metric, label1, label2,
+                                    relayout_data, view_ranges):
     """Scatterplot dreier Modellmetriken mit Farbcodierung (Reg-Tab)."""
+    if ctx.triggered_id == "modell-scatterplot":
+        # Zoom/Pan: Ausschnitt in voller Auflösung nachladen (andere Layout-Ereignisse ignorieren)
+        view_ranges = relayout_view_ranges(relayout_data, view_ranges)
+        if view_ranges is None:
+            return no_update, no_update
+    else:
+        view_ranges = {}
+
     df1 = DATAFRAMES[label1]
     df2 = DATAFRAMES[label2]
-    return plot_reg_model_metric_scatter(df1, df2, x_metric, y_metric, z_metric, size_metric, label1, label2)
+    fig = plot_reg_model_metric_scatter(
+        df1, df2, x_metric, y_metric, z_metric, size_metric, label1, label2,
+        stats1=STATS_CATALOGS[label1], stats2=STATS_CATALOGS[label2],
+        point_budget=SCATTER_POINT_BUDGET, view_ranges=view_ranges
+    )
+    return fig, view_ranges
 
 
 @callback(
     Output("correlation-matrix", "figure"),
     Input("corr-left-label-dropdown", "value"),
-    Input("corr-right-label-dropdown", "value")
+    Input("corr-right-label-dropdown", "value"),
+    Input("corr-metrics-dropdown", "value"),
+    Input("corr-method-radio", "value"),
+    Input("corr-options", "value")
 )
-def update_reg_model_correlation_matrix(left_label, right_label):
+def update_reg_model_correlation_matrix(left_label, right_label, metrics, method, options):
     """Zeigt Korrelationen zwischen Modellmetriken für zwei Produkte (Reg-Tab)."""
-    df_left = DATAFRAMES[left_label]
-    df_right = DATAFRAMES[right_label]
-    return plot_reg_model_correlation_matrix(df_left, df_right, left_label, right_label, METRICS_FOR_CORRELATION)
\ No newline at end of file
+    return plot_reg_model_correlation_matrix(
+        CORRELATION_MATRICES[left_label],
+        CORRELATION_MATRICES[right_label],
+        left_label,
+        right_label,
+        metrics or CORRELATION_DEFAULT_METRICS,
+        method=method,
+        cluster="cluster" in (options or [])
+    )
@@ -1,11 +1,63 @@
 import os
-import pandas as pd
+from functools import partial
+
+from utils.cache import read_csv_cached
+from utils.correlation import load_correlation_matrices
+from utils.kde import load_violin_summaries
+from utils.lt_metrics import compute_lt_metric_table
+from utils.lt_store import load_lt_matrix_cached
+from utils.memory import compact_dataframe
+from utils.nested_columns import NestedColumnStore, read_csv_without_nested
+from utils.por_model import load_por_model
+from utils.rank_index import load_iteration_index
+from utils.registry import DatasetRegistry, MemoryBudget
+from utils.stats_catalog import load_stats_catalog
 
 
 
 RAW_DIR = os.path.join("data", "raw")
-PROCESSED_POR_DIR = os.path.join("data", "processed", "por")
 PROCESSED_SCATTER_DIR = os.path.join("data", "processed", "scatter")
+PROCESSED_BOOTSTRAP_DIR = os.path.join("data", "processed", "bootstrap")
+PROCESSED_STATS_DIR = os.path.join("data", "processed", "stats")
+
+# Binärer Spalten-Cache (Feather) für alle eingelesenen CSV-Dateien
+CACHE_DIR = os.path.join("data", "cache")
+
+# Gemeinsames Speicherbudget aller Datensatz-Registries in MB (leer = unbegrenzt);
+# verdrängt wird registry-übergreifend der am längsten nicht genutzte Datensatz
+DATA_MEMORY_BUDGET_MB = (
+    float(os.environ["OPENOA_MEMORY_BUDGET_MB"])
+    if os.environ.get("OPENOA_MEMORY_BUDGET_MB") else None
+)
+DATA_MEMORY_BUDGET = MemoryBudget(DATA_MEMORY_BUDGET_MB)
+
+# Opt-in: kompakte Datentypen (float32, kleine Ganzzahlen, category/Arrow-Strings)
+COMPACT_DTYPES = os.environ.get("OPENOA_COMPACT_DTYPES", "0") == "1"
+COMPACT_POSTPROCESS = compact_dataframe if COMPACT_DTYPES else None
+
+# CSV-Parser beim (Neu-)Aufbau des Caches: "pandas" oder "pyarrow" (multithreaded)
+CSV_ENGINE = os.environ.get("OPENOA_CSV_ENGINE", "pandas")
+
+# Violinen: "kde" = vorberechnete Dichtekurven/Quartile (VIOLIN_SUMMARIES) und höchstens
+# VIOLIN_POINTS_MAX zufällige Punkte; "raw" = alle Werte an Plotly übergeben
+VIOLIN_MODE = os.environ.get("OPENOA_VIOLIN_MODE", "kde")
+VIOLIN_POINTS_MAX = int(os.environ.get("OPENOA_VIOLIN_POINTS", "100"))
+
+# Punktbudget je Scatter-Panel (LT-Steigung, Reg-Metriken): darüber wird geschichtet
+# ausgedünnt, beim Zoomen der Ausschnitt in voller Auflösung nachgeladen; 0 = alle Punkte
+SCATTER_POINT_BUDGET = int(os.environ.get("OPENOA_SCATTER_POINT_BUDGET", "5000"))
+
+# Scatter-Traces mit mehr Punkten werden per WebGL (go.Scattergl) statt SVG gezeichnet;
+# 0 = immer SVG
+WEBGL_POINT_THRESHOLD = int(os.environ.get("OPENOA_WEBGL_THRESHOLD", "1000"))
+
+# Ab dieser Punktzahl je Panel werden Scatter-/Jitterplots als Dichte-Heatmap gerastert
+# (Core: Jitter und IAV-Scatter, LT: Steigung/Energie); 0 = immer Einzelpunkte
+DENSITY_POINT_THRESHOLD = int(os.environ.get("OPENOA_DENSITY_THRESHOLD", "50000"))
+
+# Paralleles Vorladen aller Datensätze beim Start (0 = lazy laden, siehe app.py)
+LOAD_WORKERS = int(os.environ.get("OPENOA_LOAD_WORKERS", "0"))
+LOAD_PROCESSES = int(os.environ.get("OPENOA_LOAD_PROCESSES", "0"))
 
 
 GROSS_POR_OBSERVED = 12.229
@@ -19,8 +71,24 @@ AVAILABLE_DATASETS = {
     "MERRA2 gefiltert": "mc_merra2_true.csv",
 }
 
-DATAFRAMES = {
-    label: pd.read_csv(os.path.join(RAW_DIR, filename))
+# Verschachtelte Textspalten der MC-Ergebnisse: bleiben auf der Platte (NESTED_STORES)
+MC_NESTED_COLUMNS = [
+    "yearly_gross_energy",
+    "yearly_wind_speeds",
+    "bootstrap_data",
+    "non_bootstrap_data",
+]
+
+DATAFRAMES = DatasetRegistry({
+    label: partial(read_csv_without_nested, os.path.join(RAW_DIR, filename), CACHE_DIR, MC_NESTED_COLUMNS, engine=CSV_ENGINE)
+    for label, filename in AVAILABLE_DATASETS.items()
+}, memory_budget=DATA_MEMORY_BUDGET, name="DATAFRAMES", postprocess=COMPACT_POSTPROCESS, sources={
+    label: [os.path.join(RAW_DIR, filename)] for label, filename in AVAILABLE_DATASETS.items()
+})
+
+# Einzelne Iterationen der Textspalten on demand, z. B. NESTED_STORES["ERA5"].get(42, "bootstrap_data")
+NESTED_STORES = {
+    label: NestedColumnStore(os.path.join(RAW_DIR, filename), CACHE_DIR)
     for label, filename in AVAILABLE_DATASETS.items()
 }
 
@@ -30,24 +98,32 @@ TIMESERIES_FILES = {
     "MERRA2": "merra2_timeseries.csv"
 }
 
-TIMESERIES_DATAFRAMES = {
-    label: pd.read_csv(os.path.join(RAW_DIR, filename), parse_dates=["Date"])
+TIMESERIES_DATAFRAMES = DatasetRegistry({
+    label: partial(read_csv_cached, os.path.join(RAW_DIR, filename), CACHE_DIR, engine=CSV_ENGINE, parse_dates=["Date"])
     for label, filename in TIMESERIES_FILES.items()
-    
-}
+}, name="TIMESERIES_DATAFRAMES", postprocess=COMPACT_POSTPROCESS)
 
-# Zeitreihen (für Zeitverlaufsplot)
+# Zeitreihen (für Zeitverlaufsplot): pred_energy wird je Iteration aus slope/intercept
+# der MC-Ergebnisse und der Windspalte des Aggregats berechnet (PORModel)
 POR_DATASETS = {
-    "ERA5": "mc_era5_por.csv",
-    "MERRA2": "mc_merra2_por.csv",
-    "ERA5 gefiltert": "mc_era5_gefiltert_por.csv",
-    "MERRA2 gefiltert": "mc_merra2_gefiltert_por.csv",
+    "ERA5": ("mc_era5", "era5"),
+    "MERRA2": ("mc_merra2", "merra2"),
+    "ERA5 gefiltert": ("mc_era5_true", "era5"),
+    "MERRA2 gefiltert": ("mc_merra2_true", "merra2"),
 }
 
-POR_DATAFRAMES = {
-    label: pd.read_csv(os.path.join(PROCESSED_POR_DIR, filename), parse_dates=["time"])
-    for label, filename in POR_DATASETS.items()
-}
+POR_DATAFRAMES = DatasetRegistry({
+    label: partial(
+        load_por_model,
+        os.path.join(RAW_DIR, f"{base_name}.csv"),
+        os.path.join(RAW_DIR, f"{base_name}_aggregate.csv"),
+        wind_column, CACHE_DIR, name=label, engine=CSV_ENGINE
+    )
+    for label, (base_name, wind_column) in POR_DATASETS.items()
+}, memory_budget=DATA_MEMORY_BUDGET, name="POR_DATAFRAMES", sources={
+    label: [os.path.join(RAW_DIR, f"{base_name}.csv"), os.path.join(RAW_DIR, f"{base_name}_aggregate.csv")]
+    for label, (base_name, _) in POR_DATASETS.items()
+})
 
 # Scatterplot-Daten (für Regressionsplot)
 POR_SCATTERSETS = {
@@ -57,10 +133,41 @@ POR_SCATTERSETS = {
     "MERRA2 gefiltert": "mc_merra2_gefiltert_scatter.csv",
 }
 
-POR_SCATTERFRAMES = {
-    label: pd.read_csv(os.path.join(PROCESSED_SCATTER_DIR, filename), parse_dates=["time"])
+POR_SCATTERFRAMES = DatasetRegistry({
+    label: partial(read_csv_cached, os.path.join(PROCESSED_SCATTER_DIR, filename), CACHE_DIR, engine=CSV_ENGINE, parse_dates=["time"])
     for label, filename in POR_SCATTERSETS.items()
-}
+}, memory_budget=DATA_MEMORY_BUDGET, name="POR_SCATTERFRAMES", postprocess=COMPACT_POSTPROCESS, sources={
+    label: [os.path.join(PROCESSED_SCATTER_DIR, filename)] for label, filename in POR_SCATTERSETS.items()
+})
+
+# Nach Wert sortierte Iterationen je Metrik (get_iteration per binärer Suche statt Scan)
+POR_ITERATION_METRICS = ["slope", "intercept", "r2", "mse", "yearly_bias"]
+
+POR_ITERATION_INDEXES = DatasetRegistry({
+    label: partial(load_iteration_index, POR_DATAFRAMES, label, POR_ITERATION_METRICS)
+    for label in POR_DATASETS
+}, name="POR_ITERATION_INDEXES", sources={
+    label: [os.path.join(RAW_DIR, f"{base_name}.csv")] for label, (base_name, _) in POR_DATASETS.items()
+})
+
+POR_SCATTER_INDEXES = DatasetRegistry({
+    label: partial(load_iteration_index, POR_SCATTERFRAMES, label, POR_ITERATION_METRICS)
+    for label in POR_SCATTERSETS
+}, name="POR_SCATTER_INDEXES", sources={
+    label: [os.path.join(PROCESSED_SCATTER_DIR, filename)] for label, filename in POR_SCATTERSETS.items()
+})
+
+# Auswahl der Iteration in den POR-Dropdowns; weitere Perzentile (z. B. "p97.5") können
+# eingetippt werden (callbacks/por.py)
+ITERATION_METHOD_OPTIONS = [
+    {"label": "Maximum", "value": "max"},
+    {"label": "p95 – 95. Perzentil", "value": "p95"},
+    {"label": "3. Quantil", "value": "q3"},
+    {"label": "Median", "value": "median"},
+    {"label": "1. Quantil", "value": "q1"},
+    {"label": "p5 – 5. Perzentil", "value": "p5"},
+    {"label": "Minimum", "value": "min"},
+]
 
 
 COLOR_MAP = {
@@ -72,6 +179,14 @@ COLOR_MAP = {
 }
 
 
+# Klassenanzahl der serverseitig gebinnten Histogramme (Core-Tab: AEP_HISTOGRAM_BINS)
+HISTOGRAM_BINS = 50
+AEP_HISTOGRAM_BINS = 100
+
+# Rasterauflösung der Dichte-Heatmaps (Zellen je Achse)
+DENSITY_BINS = 100
+
+
 LONGTERM_DIR = os.path.join("data", "processed", "longterm")
 
 LONGTERM_FILES = {
@@ -82,9 +197,61 @@ LONGTERM_FILES = {
     "Kombiniert": "mc_combined_lt.csv"
 }
 
-LONGTERM_DFS = {
-    label: pd.read_csv(os.path.join(LONGTERM_DIR, filename))
+# Quelldateien je Label: geänderte Dateien (z. B. nach scripts.ingest_iterations) werden neu geladen
+LONGTERM_SOURCES = {label: [os.path.join(LONGTERM_DIR, filename)] for label, filename in LONGTERM_FILES.items()}
+
+LONGTERM_DFS = DatasetRegistry({
+    label: partial(read_csv_cached, os.path.join(LONGTERM_DIR, filename), CACHE_DIR, engine=CSV_ENGINE)
+    for label, filename in LONGTERM_FILES.items()
+}, memory_budget=DATA_MEMORY_BUDGET, name="LONGTERM_DFS", postprocess=COMPACT_POSTPROCESS, sources=LONGTERM_SOURCES)
+
+# Dichte Iteration×Jahr-Matrizen (memory-mapped) derselben LT-Daten
+LONGTERM_MATRICES = DatasetRegistry({
+    label: partial(load_lt_matrix_cached, os.path.join(LONGTERM_DIR, filename), CACHE_DIR)
     for label, filename in LONGTERM_FILES.items()
+}, memory_budget=DATA_MEMORY_BUDGET, name="LONGTERM_MATRICES", sources=LONGTERM_SOURCES)
+
+# Jahresmittel, kumulierter Mittelwert und CV aller Labels je LT-Spalte (einmal berechnet;
+# neu bei Änderung einer LT-Datei)
+LT_METRIC_TABLES = DatasetRegistry({
+    column: partial(compute_lt_metric_table, LONGTERM_MATRICES, column)
+    for column in ["energy", "wind"]
+}, name="LT_METRIC_TABLES", sources={
+    column: [path for paths in LONGTERM_SOURCES.values() for path in paths]
+    for column in ["energy", "wind"]
+})
+
+# Build-Manifest: MC-Analysen, deren Rohdaten (data/raw/<basis>.csv, _aggregate.csv,
+# _bootstrap.pkl, _non_bootstrap.pkl) zu LT-, Bootstrap-, Scatter- und Kennzahl-Artefakten
+# verarbeitet werden (python -m scripts.build_artifacts)
+BUILD_MANIFEST = {
+    "mc_era5": {"label": "ERA5", "wind_column": "era5", "lt_name": "era5"},
+    "mc_merra2": {"label": "MERRA2", "wind_column": "merra2", "lt_name": "merra2"},
+    "mc_combined": {"label": "Kombiniert", "wind_column": None, "lt_name": "combined", "por": False},
+    "mc_era5_true": {"label": "ERA5 gefiltert", "wind_column": "era5", "lt_name": "era5_filtered"},
+    "mc_merra2_true": {"label": "MERRA2 gefiltert", "wind_column": "merra2", "lt_name": "merra2_filtered"},
+}
+
+BUILD_DIRS = {
+    "raw": RAW_DIR,
+    "longterm": LONGTERM_DIR,
+    "bootstrap": PROCESSED_BOOTSTRAP_DIR,
+    "scatter": PROCESSED_SCATTER_DIR,
+    "stats": PROCESSED_STATS_DIR,
+}
+
+# Eingabe-Hashes und Fingerprints des letzten Builds
+BUILD_STATE_PATH = os.path.join("data", "processed", "build_manifest.json")
+
+
+# Alle Registries (für paralleles Vorladen und Speicherberichte)
+DATA_REGISTRIES = {
+    "DATAFRAMES": DATAFRAMES,
+    "TIMESERIES_DATAFRAMES": TIMESERIES_DATAFRAMES,
+    "POR_DATAFRAMES": POR_DATAFRAMES,
+    "POR_SCATTERFRAMES": POR_SCATTERFRAMES,
+    "LONGTERM_DFS": LONGTERM_DFS,
+    "LONGTERM_MATRICES": LONGTERM_MATRICES,
 }
 
 
@@ -244,22 +411,47 @@ METRIC_INFO = {
 }
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+# Kennzahl-Katalog je Datensatz (count, min, max, mean, std, Quantile, Histogrammgrenzen
+# aller METRIC_INFO-Metriken), einmal beim Laden berechnet; Plots und Callbacks lesen
+# Achsen- und Farbbereiche sowie Mittelwert/CV nur noch hier nach
+STATS_CATALOGS = DatasetRegistry({
+    label: partial(
+        load_stats_catalog, DATAFRAMES, label, list(METRIC_INFO),
+        stats_path=os.path.join(PROCESSED_STATS_DIR, f"{os.path.splitext(filename)[0]}.json"),
+        source_path=os.path.join(RAW_DIR, filename)
+    )
+    for label, filename in AVAILABLE_DATASETS.items()
+}, name="STATS_CATALOGS", sources={
+    label: [os.path.join(RAW_DIR, filename)] for label, filename in AVAILABLE_DATASETS.items()
+})
+
+LONGTERM_STATS_CATALOGS = DatasetRegistry({
+    label: partial(load_stats_catalog, LONGTERM_MATRICES, label, list(METRIC_INFO))
+    for label in LONGTERM_FILES
+}, name="LONGTERM_STATS_CATALOGS", sources=LONGTERM_SOURCES)
+
+# Metriken der MC-Ergebnisse (ohne die LT-Spalten energy/wind)
+MC_METRICS = [metric for metric in METRIC_INFO if metric not in ("energy", "wind")]
+
+# Voreinstellung der Korrelationsmatrix (Reg-Tab)
+CORRELATION_DEFAULT_METRICS = ["slope", "intercept", "mse", "r2", "iav", "aep", "aep_final"]
+
+# Pearson- und Spearman-Korrelationen aller MC-Metriken je Datensatz (einmal berechnet)
+CORRELATION_MATRICES = DatasetRegistry({
+    label: partial(
+        load_correlation_matrices, DATAFRAMES, label, MC_METRICS,
+        stats_path=os.path.join(PROCESSED_STATS_DIR, f"{os.path.splitext(filename)[0]}.json"),
+        source_path=os.path.join(RAW_DIR, filename)
+    )
+    for label, filename in AVAILABLE_DATASETS.items()
+}, name="CORRELATION_MATRICES", sources={
+    label: [os.path.join(RAW_DIR, filename)] for label, filename in AVAILABLE_DATASETS.items()
+})
+
+# Dichtekurven, Quartile und Mittelwerte aller MC-Metriken je Datensatz (VIOLIN_MODE="kde")
+VIOLIN_SUMMARIES = DatasetRegistry({
+    label: partial(load_violin_summaries, DATAFRAMES, label, MC_METRICS, points_max=VIOLIN_POINTS_MAX)
+    for label in AVAILABLE_DATASETS
+}, name="VIOLIN_SUMMARIES", sources={
+    label: [os.path.join(RAW_DIR, filename)] for label, filename in AVAILABLE_DATASETS.items()
+})
@@ -1,5 +1,5 @@
 from dash import dcc, html
-from data.config import DATAFRAMES
+from data.config import DATAFRAMES, DENSITY_POINT_THRESHOLD, STATS_CATALOGS, VIOLIN_MODE, VIOLIN_SUMMARIES
 from utils.plot_utils.core import plot_aep_comparison
 from utils.compute_stats import get_aep_stats
 
@@ -35,7 +35,11 @@ core_layout = html.Div([
     html.Div([
         dcc.Graph(
             id="aep-barplot",
-            figure=plot_aep_comparison(get_aep_stats(DATAFRAMES), DATAFRAMES)
+            figure=plot_aep_comparison(
+                get_aep_stats(STATS_CATALOGS), DATAFRAMES,
+                violins=VIOLIN_SUMMARIES if VIOLIN_MODE == "kde" else None,
+                density_threshold=DENSITY_POINT_THRESHOLD
+            )
         )
     ], className="plot-container"),
 
@@ -136,6 +136,8 @@ lt_layout = html.Div([
             type="circle",
             fullscreen=False,
             children=dcc.Graph(id="lt-slope-plot")
-        )
+        ),
+        # Zoom-Zustand des Plots (Achsenbereiche) für das Nachladen in voller Auflösung
+        dcc.Store(id="lt-slope-view", data={})
     ], className="plot-container")
 ], className="main-content")
\ No newline at end of file
@@ -1,5 +1,5 @@
 from dash import dcc, html
-from data.config import DATAFRAMES, METRIC_INFO
+from data.config import DATAFRAMES, METRIC_INFO, MC_METRICS, CORRELATION_DEFAULT_METRICS
 
 # ------------------------------------------------------
 # Layout: Regressionsanalyse
@@ -167,7 +167,9 @@ reg_layout = html.Div([
                     id="model-scatter-loading",
                     type="circle",
                     children=dcc.Graph(id="modell-scatterplot")
-                )
+                ),
+                # Zoom-Zustand des Plots (Achsenbereiche) für das Nachladen in voller Auflösung
+                dcc.Store(id="modell-scatter-view", data={})
             ], className="plot-container")
 
         ], style={"flex": "5"})
@@ -207,6 +209,36 @@ reg_layout = html.Div([
         ], style={"flex": "1"})
     ], style={"display": "flex"}, className="plot-dropdown-container"),
 
+    html.Div([
+        html.Div([
+            html.Label("Metriken:"),
+            dcc.Dropdown(
+                id="corr-metrics-dropdown",
+                options=[{"label": METRIC_INFO[m]["metric_en"], "value": m} for m in MC_METRICS],
+                value=CORRELATION_DEFAULT_METRICS,
+                multi=True
+            )
+        ], style={"flex": "3"}),
+
+        html.Div([
+            html.Label("Korrelation:"),
+            dcc.RadioItems(
+                id="corr-method-radio",
+                options=[
+                    {"label": "Pearson", "value": "pearson"},
+                    {"label": "Spearman", "value": "spearman"},
+                ],
+                value="pearson",
+                inline=True
+            ),
+            dcc.Checklist(
+                id="corr-options",
+                options=[{"label": "Nach Clustern sortieren", "value": "cluster"}],
+                value=[]
+            )
+        ], style={"flex": "1"})
+    ], style={"display": "flex"}, className="plot-dropdown-container"),
+
     html.Div([
         dcc.Loading(
             type="circle",
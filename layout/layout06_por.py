@@ -1,5 +1,5 @@
 from dash import dcc, html
-from data.config import DATAFRAMES, POR_DATAFRAMES
+from data.config import DATAFRAMES, ITERATION_METHOD_OPTIONS, POR_DATAFRAMES
 
 por_layout = html.Div([
 
@@ -123,13 +123,7 @@ por_layout = html.Div([
                 html.Label("Wert:", className="home-paragraph"),
                 dcc.Dropdown(
                     id="por-metric-value-dropdown",
-                    options=[
-                        {"label": "Maximum", "value": "max"},
-                        {"label": "3. Quantil", "value": "q3"},
-                        {"label": "Median", "value": "median"},
-                        {"label": "1. Quantil", "value": "q1"},
-                        {"label": "Minimum", "value": "min"},
-                    ],
+                    options=ITERATION_METHOD_OPTIONS,
                     value="max",
                     clearable=False
                 )
@@ -219,13 +213,7 @@ por_layout = html.Div([
                 html.Label("Wert:", className="home-paragraph"),
                 dcc.Dropdown(
                     id="timeseries-metric-method-dropdown",
-                    options=[
-                        {"label": "Maximum", "value": "max"},
-                        {"label": "3. Quantil", "value": "q3"},
-                        {"label": "Median", "value": "median"},
-                        {"label": "1. Quantil", "value": "q1"},
-                        {"label": "Minimum", "value": "min"},
-                    ],
+                    options=ITERATION_METHOD_OPTIONS,
                     value="median",
                     clearable=False
                 )
@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from utils.cache import clear_cache
+
+# Aufruf aus dem Projektverzeichnis: python -m scripts.bench_startup --runs 5 [--cold] [--output bench.jsonl]
+# Misst die Dauer von `import app` in frischen Prozessen (inkl. Startprofil je Abschnitt).
+
+CACHE_DIR = os.path.join("data", "cache")
+
+
+def run_once(cold):
+    if cold:
+        clear_cache(CACHE_DIR)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trace_path = os.path.join(tmp_dir, "trace.json")
+        env = dict(os.environ, OPENOA_PROFILE_STARTUP="1", OPENOA_PROFILE_OUTPUT=trace_path)
+
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", "import app"],
+            env=env, capture_output=True, text=True
+        )
+        wall = time.perf_counter() - start
+
+        if result.returncode != 0:
+            raise RuntimeError(f"`import app` fehlgeschlagen:\n{result.stderr[-2000:]}")
+
+        with open(trace_path, encoding="utf-8") as f:
+            sections = json.load(f)["sections"]
+
+    return wall, sections
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark für die Startzeit (`import app`).")
+    parser.add_argument("--runs", type=int, default=5, help="Anzahl Messläufe")
+    parser.add_argument("--cold", action="store_true", help="Daten-Cache vor jedem Lauf leeren")
+    parser.add_argument("--output", help="Ergebnis als JSON-Zeile an diese Datei anhängen")
+    args = parser.parse_args()
+
+    walls = []
+    per_section = {}
+
+    for run in range(args.runs):
+        wall, sections = run_once(args.cold)
+        walls.append(wall)
+        for section in sections:
+            per_section.setdefault((section["kind"], section["name"]), []).append(section["wall_s"])
+        print(f"Lauf {run + 1}/{args.runs}: {wall:.3f} s")
+
+    medians = sorted(
+        ((kind, name, statistics.median(values)) for (kind, name), values in per_section.items()),
+        key=lambda item: item[2], reverse=True
+    )
+
+    print(f"\n`import app` Median: {statistics.median(walls):.3f} s (min {min(walls):.3f} s, max {max(walls):.3f} s)")
+    print(f"{'Typ':<10} {'Abschnitt':<48} {'Median (s)':>10}")
+    for kind, name, median in medians:
+        print(f"{kind:<10} {name[:48]:<48} {median:>10.3f}")
+
+    if args.output:
+        entry = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": git_revision(),
+            "cold": args.cold,
+            "runs_s": walls,
+            "median_s": statistics.median(walls),
+            "sections_median_s": {f"{kind}:{name}": median for kind, name, median in medians},
+        }
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        print(f"Ergebnis angehängt: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
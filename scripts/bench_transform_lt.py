@@ -0,0 +1,120 @@
+import argparse
+import ast
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.transform_lt import transform_energy_wind_data
+
+# Aufruf aus dem Projektverzeichnis: python -m scripts.bench_transform_lt [--sizes 2000 20000 200000]
+# Vervielfacht eine echte MC-Tabelle auf die gewünschte Iterationszahl und misst die LT-Transformation.
+
+DEFAULT_SOURCE = "data/raw/mc_era5_true.csv"
+LIST_COLUMNS = ["yearly_gross_energy", "yearly_wind_speeds", "slope", "intercept", "yearly_bias"]
+
+
+def transform_energy_wind_data_legacy(df, dataset_name=None):
+    """Bisherige zeilenweise Umsetzung der LT-Transformation; nur als Referenz für Laufzeit und Ergebnisvergleich."""
+    data = []
+
+    for iteration in range(len(df)):
+        try:
+            # Sicheres Parsen
+            energy_raw = df.iloc[iteration]["yearly_gross_energy"]
+            wind_raw = df.iloc[iteration]["yearly_wind_speeds"]
+
+            # Konvertieren, wenn nötig, von String zu Liste
+            if isinstance(energy_raw, str):
+                energy_values = ast.literal_eval(energy_raw)
+            else:
+                energy_values = energy_raw
+
+            if isinstance(wind_raw, str):
+                wind_values = ast.literal_eval(wind_raw)
+            else:
+                wind_values = wind_raw
+
+            wind_values = np.array(wind_values).flatten()
+
+            slope_value = df.iloc[iteration]["slope"]
+            intercept_value = df.iloc[iteration]["intercept"]
+            bias_value = df.iloc[iteration]["yearly_bias"]
+
+            num_years = len(energy_values)
+
+            for year_index in range(num_years):
+                wind_speed = wind_values[num_years - 1 - year_index]
+                if isinstance(wind_speed, (list, np.ndarray)):
+                    wind_speed = wind_speed[0]
+
+                data.append({
+                    "Iteration": iteration,
+                    "year": year_index + 1,
+                    "energy": energy_values[num_years - 1 - year_index],
+                    "wind": float(wind_speed),
+                    "slope": slope_value,
+                    "intercept": intercept_value,
+                    "yearly_bias": bias_value,
+                })
+
+        except Exception as e:
+            print(f"Fehler bei Iteration {iteration}: {e}")
+            continue
+
+    transformed_df = pd.DataFrame(data)
+
+    if dataset_name:
+        print(f"Transformation für {dataset_name} abgeschlossen. {len(transformed_df)} Zeilen erstellt.")
+
+    return transformed_df
+
+
+def scale_iterations(df, n_iterations):
+    repeats = -(-n_iterations // len(df))
+    return pd.concat([df] * repeats, ignore_index=True).iloc[:n_iterations].reset_index(drop=True)
+
+
+def measure(func, df, runs):
+    best = None
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func(df)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark für transform_energy_wind_data.")
+    parser.add_argument("--source", default=DEFAULT_SOURCE, help="MC-Ergebnis-CSV als Vorlage")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 200000], help="Iterationszahlen")
+    parser.add_argument("--runs", type=int, default=3, help="Messläufe je Größe (Bestwert zählt)")
+    parser.add_argument(
+        "--legacy-max", type=int, default=20000,
+        help="Bisherige Schleife nur bis zu dieser Iterationszahl messen und vergleichen"
+    )
+    args = parser.parse_args()
+
+    source_df = pd.read_csv(args.source, usecols=LIST_COLUMNS)
+    print(f"Vorlage: {args.source} ({len(source_df)} Iterationen)")
+    print(f"{'Iterationen':>12} {'Zeilen':>10} {'Vektorisiert (s)':>17} {'Schleife (s)':>13} {'Faktor':>8}  Gleich")
+
+    for size in args.sizes:
+        df = scale_iterations(source_df, size)
+        fast_s, fast_df = measure(transform_energy_wind_data, df, args.runs)
+
+        if size <= args.legacy_max:
+            legacy_s, legacy_df = measure(transform_energy_wind_data_legacy, df, 1)
+            identical = fast_df.equals(legacy_df)
+            legacy_text, factor_text = f"{legacy_s:>13.3f}", f"{legacy_s / fast_s:>7.1f}x"
+        else:
+            identical, legacy_text, factor_text = None, f"{'-':>13}", f"{'-':>8}"
+
+        identical_text = "-" if identical is None else ("ja" if identical else "NEIN")
+        print(f"{size:>12} {len(fast_df):>10} {fast_s:>17.3f} {legacy_text} {factor_text}  {identical_text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import argparse
+
+from data.config import BUILD_MANIFEST, BUILD_DIRS, BUILD_STATE_PATH
+from utils.build_pipeline import ARTIFACT_VERSIONS, run_build
+
+# Aufruf aus dem Projektverzeichnis: python -m scripts.build_artifacts [--dry-run] [--force] [--jobs 4] [--only lt scatter]
+# Baut nur die Artefakte unter data/processed neu, deren Rohdaten sich geändert haben.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inkrementeller Build der abgeleiteten Daten.")
+    parser.add_argument("--force", action="store_true", help="Alle Artefakte neu bauen")
+    parser.add_argument("--dry-run", action="store_true", help="Nur anzeigen, was gebaut würde")
+    parser.add_argument("--jobs", type=int, default=1, help="Anzahl Prozesse")
+    parser.add_argument("--only", nargs="+", choices=sorted(ARTIFACT_VERSIONS), help="Nur diese Artefakt-Arten")
+    args = parser.parse_args()
+
+    results = run_build(
+        BUILD_MANIFEST, BUILD_DIRS, BUILD_STATE_PATH,
+        force=args.force, only=args.only, dry_run=args.dry_run, jobs=args.jobs
+    )
+
+    if results:
+        print(f"\n{'Artefakt':<28} {'Zeit (s)':>9}  Status")
+        for r in results:
+            print(f"{r['name']:<28} {r['seconds']:>9.2f}  {r['error'] or 'ok'}")
+
+
+if __name__ == "__main__":
+    main()
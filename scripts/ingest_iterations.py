@@ -0,0 +1,23 @@
+import argparse
+
+import pandas as pd
+
+from data.config import BUILD_MANIFEST, BUILD_DIRS, BUILD_STATE_PATH
+from utils.ingest import ingest_iterations
+
+# Aufruf aus dem Projektverzeichnis: python -m scripts.ingest_iterations mc_era5_true neue_iterationen.csv
+# Hängt zusätzliche MC-Iterationen an und aktualisiert nur die neuen Zeilen der abgeleiteten Daten.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zusätzliche MC-Iterationen inkrementell übernehmen.")
+    parser.add_argument("base_name", choices=sorted(BUILD_MANIFEST), help="Datensatz aus BUILD_MANIFEST")
+    parser.add_argument("new_csv", help="CSV mit den neuen Iterationen (Spalten wie data/raw/<basis>.csv)")
+    args = parser.parse_args()
+
+    new_rows = pd.read_csv(args.new_csv)
+    ingest_iterations(args.base_name, new_rows, BUILD_MANIFEST, BUILD_DIRS, BUILD_STATE_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import os
+import pickle
+import time
+
+import pandas as pd
+
+from data.config import RAW_DIR, PROCESSED_BOOTSTRAP_DIR
+from utils.bootstrap_store import build_bootstrap_store, build_bootstrap_store_from_texts, save_bootstrap_store
+
+# Aufruf aus dem Projektverzeichnis: python -m scripts.run_convert_bootstrap [--source auto|pickle|csv]
+# Wandelt mc_*_bootstrap.pkl / mc_*_non_bootstrap.pkl (oder die Textspalten bootstrap_data /
+# non_bootstrap_data aus mc_*.csv) in einen flachen .npy-Store um.
+
+datasets = {
+    "mc_era5": "era5",
+    "mc_merra2": "merra2",
+    "mc_era5_true": "era5",
+    "mc_merra2_true": "merra2"
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bootstrap-Punkte in den .npy-Store umwandeln.")
+    parser.add_argument(
+        "--source", choices=["auto", "pickle", "csv"], default="auto",
+        help="Quelle der Punkte (auto = Pickles, falls vorhanden, sonst CSV-Textspalten)"
+    )
+    args = parser.parse_args()
+
+    for base_name, wind_column in datasets.items():
+        start = time.perf_counter()
+        bootstrap_path = os.path.join(RAW_DIR, f"{base_name}_bootstrap.pkl")
+        non_bootstrap_path = os.path.join(RAW_DIR, f"{base_name}_non_bootstrap.pkl")
+        csv_path = os.path.join(RAW_DIR, f"{base_name}.csv")
+
+        source = args.source
+        if source == "auto":
+            source = "pickle" if os.path.exists(bootstrap_path) and os.path.exists(non_bootstrap_path) else "csv"
+
+        try:
+            if source == "pickle":
+                with open(bootstrap_path, "rb") as f:
+                    bootstrap_data = pickle.load(f)
+                with open(non_bootstrap_path, "rb") as f:
+                    non_bootstrap_data = pickle.load(f)
+                store = build_bootstrap_store(bootstrap_data, non_bootstrap_data, wind_column=wind_column)
+            else:
+                texts = pd.read_csv(csv_path, usecols=["bootstrap_data", "non_bootstrap_data"])
+                store = build_bootstrap_store_from_texts(
+                    texts["bootstrap_data"], texts["non_bootstrap_data"], wind_column=wind_column
+                )
+        except (OSError, ValueError) as e:
+            print(f"⚠️  {base_name} übersprungen ({source}): {e}")
+            continue
+
+        out_dir = os.path.join(PROCESSED_BOOTSTRAP_DIR, base_name)
+        save_bootstrap_store(store, out_dir)
+        print(f"✅ {base_name} ({source}): {store.n_points} Punkte aus {store.n_iterations} Iterationen "
+              f"gespeichert in {out_dir} ({time.perf_counter() - start:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
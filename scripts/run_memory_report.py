@@ -0,0 +1,16 @@
+import pandas as pd
+
+from data.config import DATA_REGISTRIES
+from utils.memory import memory_report
+
+# Aufruf aus dem Projektverzeichnis: python -m scripts.run_memory_report
+
+report = memory_report(DATA_REGISTRIES)
+
+with pd.option_context("display.float_format", "{:.2f}".format, "display.width", 120):
+    print(report.to_string(index=False))
+
+print(
+    f"\nGesamt: {report['before_mb'].sum():.2f} MB -> {report['after_mb'].sum():.2f} MB "
+    f"(Faktor {report['before_mb'].sum() / report['after_mb'].sum():.1f})"
+)
@@ -1,10 +1,16 @@
+import argparse
 import os
+import time
+
 import pandas as pd
-from utils.transform_lt import transform_energy_wind_data
 
-RAW_DIR = "/Users/jonathanabebe/Desktop/Python-Projekte/OpenOA-Dashboard/data/raw"
-OUT_DIR = "/Users/jonathanabebe/Desktop/Python-Projekte/OpenOA-Dashboard/data/processed/longterm"
-os.makedirs(OUT_DIR, exist_ok=True)
+from utils.parallel_transform import LT_INPUT_COLUMNS, format_task_report, lt_tasks, merge_lt_results, run_tasks
+
+# Aufruf aus dem Projektverzeichnis: python -m scripts.run_transform_lt [--jobs 4]
+# Pfade relativ zum Projektverzeichnis (Build aller Artefakte: python -m scripts.build_artifacts)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAW_DIR = os.path.join(REPO_ROOT, "data", "raw")
+OUT_DIR = os.path.join(REPO_ROOT, "data", "processed", "longterm")
 
 # Mapping von CSV-Dateien zu neuen Namen
 datasets = {
@@ -15,13 +21,42 @@ datasets = {
     "mc_merra2_true.csv": "merra2_filtered"
 }
 
-for filename, label in datasets.items():
-    raw_path = os.path.join(RAW_DIR, filename)
-    df = pd.read_csv(raw_path)
 
-    df_transformed = transform_energy_wind_data(df, dataset_name=label)
+def main():
+    parser = argparse.ArgumentParser(description="LT-Transformation aller MC-Ergebnisse.")
+    parser.add_argument("--jobs", type=int, default=1, help="Anzahl Prozesse (Datensätze und Iterationsbereiche)")
+    parser.add_argument(
+        "--min-iterations", type=int, default=5000,
+        help="Datensätze erst ab 2x dieser Iterationszahl in Bereiche aufteilen"
+    )
+    args = parser.parse_args()
+    os.makedirs(OUT_DIR, exist_ok=True)
+
+    tasks = []
+    for filename, label in datasets.items():
+        raw_path = os.path.join(RAW_DIR, filename)
+        if not os.path.exists(raw_path):
+            print(f"⚠️  {raw_path} nicht gefunden, übersprungen.")
+            continue
+        df = pd.read_csv(raw_path, usecols=LT_INPUT_COLUMNS)
+        tasks += lt_tasks(label, df, args.jobs, args.min_iterations)
+
+    start = time.perf_counter()
+    results = run_tasks(tasks, jobs=args.jobs)
+    wall_seconds = time.perf_counter() - start
+
+    failed = {r["group"] for r in results if r["error"] is not None}
+    for label, df_transformed in merge_lt_results(results).items():
+        if label in failed:
+            print(f"⚠️  {label} nicht gespeichert (Teilaufgabe fehlgeschlagen).")
+            continue
+        out_path = os.path.join(OUT_DIR, f"mc_{label}_lt.csv")
+        df_transformed.to_csv(out_path, index=False)
+        print(f"Gespeichert: {out_path} ({len(df_transformed)} Zeilen)")
+
+    print()
+    print(format_task_report(results, wall_seconds, jobs=args.jobs))
 
-    out_path = os.path.join(OUT_DIR, f"mc_{label}_lt.csv")
-    df_transformed.to_csv(out_path, index=False)
 
-    print(f"Gespeichert: {out_path}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,30 @@
+import argparse
 import os
-import pandas as pd
 import pickle
-from utils.transform_por import transform_reg_data_combined
+import time
+
+import pandas as pd
+
+from utils.bootstrap_store import load_bootstrap_store
+from utils.parallel_transform import (
+    SCATTER_INPUT_COLUMNS,
+    format_task_report,
+    merge_part_files,
+    remove_part_files,
+    run_tasks,
+    scatter_tasks
+)
 
-RAW_DIR = "/Users/jonathanabebe/Desktop/Python-Projekte/OpenOA-Dashboard/data/raw"
-OUT_DIR_SCATTER = "/Users/jonathanabebe/Desktop/Python-Projekte/OpenOA-Dashboard/data/processed/scatter"
-OUT_DIR_FULL = "/Users/jonathanabebe/Desktop/Python-Projekte/OpenOA-Dashboard/data/processed/por"
-os.makedirs(OUT_DIR_SCATTER, exist_ok=True)
-os.makedirs(OUT_DIR_FULL, exist_ok=True)
+# Aufruf aus dem Projektverzeichnis: python -m scripts.run_transform_por [--jobs 4]
+# Pfade relativ zum Projektverzeichnis (Build aller Artefakte: python -m scripts.build_artifacts)
+# Die modellierte POR-Zeitreihe wird nicht mehr materialisiert (siehe utils/por_model.py).
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAW_DIR = os.path.join(REPO_ROOT, "data", "raw")
+OUT_DIR_SCATTER = os.path.join(REPO_ROOT, "data", "processed", "scatter")
+BOOTSTRAP_STORE_DIR = os.path.join(os.path.dirname(RAW_DIR), "processed", "bootstrap")
+
+# Iterationen je geschriebenem Block (begrenzt den Speicherbedarf)
+CHUNK_SIZE = 500
 
 datasets = {
     "mc_era5": ("ERA5", "era5"),
@@ -16,47 +33,82 @@ datasets = {
     "mc_merra2_true": ("MERRA2 gefiltert", "merra2")
 }
 
-for base_name, (label, wind_column) in datasets.items():
-    print(f"\n🔄 Starte Transformation für {label} ...")
-
-    # Lade Grunddaten
-    csv_path = os.path.join(RAW_DIR, f"{base_name}.csv")
-    aggregate_path = os.path.join(RAW_DIR, f"{base_name}_aggregate.csv")
-    bootstrap_path = os.path.join(RAW_DIR, f"{base_name}_bootstrap.pkl")
-    non_bootstrap_path = os.path.join(RAW_DIR, f"{base_name}_non_bootstrap.pkl")
-
-    df = pd.read_csv(csv_path)
-    aggregate_df = pd.read_csv(aggregate_path, parse_dates=["time"])
-
-    with open(bootstrap_path, "rb") as f:
-        bootstrap_data = pickle.load(f)
-    with open(non_bootstrap_path, "rb") as f:
-        non_bootstrap_data = pickle.load(f)
-
-    # Scatter-Daten (bootstrap / non-bootstrap)
-    df_scatter = transform_reg_data_combined(
-        df, aggregate_df, wind_column,
-        bootstrap_list=bootstrap_data,
-        non_bootstrap_list=non_bootstrap_data,
-        dataset_name=label,
-        mode="scatter"
+
+def main():
+    parser = argparse.ArgumentParser(description="Scatter-Daten (Bootstrap/Non-Bootstrap) aller MC-Ergebnisse.")
+    parser.add_argument("--jobs", type=int, default=1, help="Anzahl Prozesse (Datensätze und Iterationsbereiche)")
+    parser.add_argument(
+        "--min-iterations", type=int, default=5000,
+        help="Datensätze erst ab 2x dieser Iterationszahl in Bereiche aufteilen"
     )
+    args = parser.parse_args()
+    os.makedirs(OUT_DIR_SCATTER, exist_ok=True)
 
-    out_scatter = os.path.join(OUT_DIR_SCATTER, f"mc_{label.lower().replace(' ', '_')}_scatter.csv")
-    df_scatter.to_csv(out_scatter, index=False)
-    print(f"✅ Scatterdaten gespeichert: {out_scatter}")
+    tasks = []
+    for base_name, (label, wind_column) in datasets.items():
+        csv_path = os.path.join(RAW_DIR, f"{base_name}.csv")
+        bootstrap_path = os.path.join(RAW_DIR, f"{base_name}_bootstrap.pkl")
+        non_bootstrap_path = os.path.join(RAW_DIR, f"{base_name}_non_bootstrap.pkl")
+        if not os.path.exists(csv_path):
+            print(f"⚠️  {csv_path} nicht gefunden, übersprungen.")
+            continue
+
+        df = pd.read_csv(csv_path, usecols=SCATTER_INPUT_COLUMNS)
+        out_scatter = os.path.join(OUT_DIR_SCATTER, f"mc_{label.lower().replace(' ', '_')}_scatter.csv")
+
+        # Scatter-Daten (bootstrap / non-bootstrap): bevorzugt aus dem .npy-Store
+        # (scripts/run_convert_bootstrap.py), sonst aus den Pickles; blockweise geschrieben.
+        # Ein Store mit anderer Iterationszahl als die CSV (veraltet) wird nicht verwendet.
+        store_dir = os.path.join(BOOTSTRAP_STORE_DIR, base_name)
+        use_store = os.path.isdir(store_dir)
+        if use_store:
+            n_store = load_bootstrap_store(store_dir).n_iterations
+            if n_store != len(df):
+                if not os.path.exists(bootstrap_path) or not os.path.exists(non_bootstrap_path):
+                    raise ValueError(
+                        f"Bootstrap-Store {store_dir} hat {n_store} Iterationen, {csv_path} aber {len(df)}; "
+                        f"Pickles fehlen. Store neu bauen mit: python -m scripts.build_artifacts"
+                    )
+                print(
+                    f"⚠️  Bootstrap-Store {store_dir} veraltet ({n_store} statt {len(df)} Iterationen), "
+                    f"verwende die Pickles."
+                )
+                use_store = False
+
+        if use_store:
+            tasks += scatter_tasks(
+                label, df, out_scatter, args.jobs,
+                store_dir=store_dir, chunk_size=CHUNK_SIZE, min_iterations=args.min_iterations
+            )
+        else:
+            with open(bootstrap_path, "rb") as f:
+                bootstrap_data = pickle.load(f)
+            with open(non_bootstrap_path, "rb") as f:
+                non_bootstrap_data = pickle.load(f)
+
+            tasks += scatter_tasks(
+                label, df, out_scatter, args.jobs,
+                bootstrap_data=bootstrap_data, non_bootstrap_data=non_bootstrap_data,
+                chunk_size=CHUNK_SIZE, min_iterations=args.min_iterations
+            )
+
+    start = time.perf_counter()
+    results = run_tasks(tasks, jobs=args.jobs)
+    wall_seconds = time.perf_counter() - start
+
+    # Teildateien je Ausgabe in Bereichsreihenfolge zusammenführen
+    for out_scatter in dict.fromkeys(r["group"] for r in results):
+        group = [r for r in results if r["group"] == out_scatter]
+        if any(r["error"] is not None for r in group):
+            remove_part_files(out_scatter, len(group))
+            print(f"⚠️  {out_scatter} nicht gespeichert (Teilaufgabe fehlgeschlagen).")
+            continue
+        merge_part_files(out_scatter, len(group))
+        print(f"✅ Scatterdaten gespeichert: {out_scatter}")
+
+    print()
+    print(format_task_report(results, wall_seconds, jobs=args.jobs))
 
-    # Vollständige Zeitreihe (modellierte Energie)
-    df_full = transform_reg_data_combined(
-        df, aggregate_df, wind_column,
-        dataset_name=label,
-        mode="full"
-    )
 
-    out_full = os.path.join(OUT_DIR_FULL, f"mc_{label.lower().replace(' ', '_')}_por.csv")
-    df_full.to_csv(out_full, index=False)
-    print(f"✅ Zeitreihendaten gespeichert: {out_full}")
-    
-    
-    
-    
\ No newline at end of file
+if __name__ == "__main__":
+    main()
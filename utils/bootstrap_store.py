@@ -0,0 +1,289 @@
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import is_cache_valid, save_npy_atomic, source_metadata, write_atomic_json
+
+
+BOOTSTRAP_FIELDS = ["iteration", "time", "wind_speed", "energy", "source"]
+SOURCE_LABELS = np.array(["bootstrap", "non-bootstrap"])
+
+
+class BootstrapStore:
+    """
+    Alle Bootstrap- und Non-Bootstrap-Punkte eines Datensatzes als flache Tabelle.
+
+    Die Punkte liegen nach Iteration sortiert vor (je Iteration erst Bootstrap, dann
+    Non-Bootstrap). Die Punkte der k-ten Iteration stehen im Bereich
+    [offsets[k], offsets[k + 1]); `source` ist 0 (bootstrap) oder 1 (non-bootstrap).
+    """
+
+    def __init__(self, iteration, time, wind_speed, energy, source, offsets):
+        self.iteration = iteration
+        self.time = time
+        self.wind_speed = wind_speed
+        self.energy = energy
+        self.source = source
+        self.offsets = offsets
+
+    @property
+    def n_iterations(self):
+        return len(self.offsets) - 1
+
+    @property
+    def n_points(self):
+        return int(self.offsets[-1])
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, field).nbytes for field in BOOTSTRAP_FIELDS) + self.offsets.nbytes
+
+    def __len__(self):
+        return self.n_points
+
+    def __repr__(self):
+        return f"BootstrapStore(n_iterations={self.n_iterations}, n_points={self.n_points})"
+
+    def slice(self, start, stop):
+        """Punkte der Iterationspositionen [start, stop) als Array-Views."""
+        lo, hi = int(self.offsets[start]), int(self.offsets[stop])
+        return {field: getattr(self, field)[lo:hi] for field in BOOTSTRAP_FIELDS}
+
+    def get_iteration(self, position):
+        """Punkte einer einzelnen Iteration als DataFrame (time, wind_speed, energy, source)."""
+        if not 0 <= position < self.n_iterations:
+            raise IndexError(f"Iteration {position} außerhalb des Bereichs (0..{self.n_iterations - 1}).")
+
+        points = self.slice(position, position + 1)
+        return pd.DataFrame({
+            "time": np.asarray(points["time"]),
+            "wind_speed": np.asarray(points["wind_speed"]),
+            "energy": np.asarray(points["energy"]),
+            "source": SOURCE_LABELS[np.asarray(points["source"])],
+        })
+
+
+def _frame_arrays(frame, wind_column=None):
+    values = frame.reset_index()
+    if wind_column is None:
+        if values.shape[1] != 3:
+            raise ValueError(
+                f"Erwartet (time, Wind, Energie), gefunden: {list(values.columns)}. "
+                f"Bitte 'wind_column' angeben."
+            )
+        wind = values.iloc[:, 1]
+    else:
+        wind = values[wind_column]
+    return values.iloc[:, 0].to_numpy(), wind.to_numpy(np.float64), values.iloc[:, -1].to_numpy(np.float64)
+
+
+def build_bootstrap_store(bootstrap_data, non_bootstrap_data, wind_column=None):
+    """
+    Baut einen BootstrapStore aus den bisherigen Pickle-Inhalten.
+
+    Parameters:
+        bootstrap_data (dict | list): Iteration -> DataFrame (Index time, Wind, Energie)
+        non_bootstrap_data (dict | list): wie bootstrap_data
+        wind_column (str): Windspalte bei mehreren Windspalten (z. B. "era5")
+
+    Returns:
+        BootstrapStore
+    """
+    if len(bootstrap_data) != len(non_bootstrap_data):
+        raise ValueError("Bootstrap- und Non-Bootstrap-Daten haben unterschiedlich viele Iterationen.")
+
+    times, winds, energies, sources, counts = [], [], [], [], []
+
+    for i in range(len(bootstrap_data)):
+        count = 0
+        for source, frames in enumerate([bootstrap_data, non_bootstrap_data]):
+            time, wind, energy = _frame_arrays(frames[i], wind_column)
+            times.append(time)
+            winds.append(wind)
+            energies.append(energy)
+            sources.append(np.full(len(time), source, dtype=np.int8))
+            count += len(time)
+        counts.append(count)
+
+    counts = np.asarray(counts, dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    return BootstrapStore(
+        iteration=np.repeat(np.arange(len(counts), dtype=np.int32), counts),
+        time=np.concatenate(times).astype("datetime64[ns]"),
+        wind_speed=np.concatenate(winds),
+        energy=np.concatenate(energies),
+        source=np.concatenate(sources),
+        offsets=offsets
+    )
+
+
+def concat_bootstrap_stores(store, extra):
+    """Hängt die Iterationen von `extra` hinter `store` an (Iterationsnummern fortlaufend)."""
+    return BootstrapStore(
+        iteration=np.concatenate([np.asarray(store.iteration), np.asarray(extra.iteration) + store.n_iterations]),
+        time=np.concatenate([np.asarray(store.time), np.asarray(extra.time)]),
+        wind_speed=np.concatenate([np.asarray(store.wind_speed), np.asarray(extra.wind_speed)]),
+        energy=np.concatenate([np.asarray(store.energy), np.asarray(extra.energy)]),
+        source=np.concatenate([np.asarray(store.source), np.asarray(extra.source)]),
+        offsets=np.concatenate([np.asarray(store.offsets), np.asarray(extra.offsets)[1:] + store.n_points])
+    )
+
+
+def save_bootstrap_store(store, directory):
+    os.makedirs(directory, exist_ok=True)
+    for field in BOOTSTRAP_FIELDS + ["offsets"]:
+        save_npy_atomic(os.path.join(directory, f"{field}.npy"), np.asarray(getattr(store, field)))
+
+    with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"n_iterations": store.n_iterations, "n_points": store.n_points}, f, indent=2)
+
+
+def load_bootstrap_store(directory, mmap=True):
+    """Lädt einen gespeicherten BootstrapStore; mit `mmap=True` ohne Kopie (memory-mapped)."""
+    mmap_mode = "r" if mmap else None
+    return BootstrapStore(**{
+        field: np.load(os.path.join(directory, f"{field}.npy"), mmap_mode=mmap_mode)
+        for field in BOOTSTRAP_FIELDS + ["offsets"]
+    })
+
+
+# --- Punkte direkt aus den Textspalten der MC-Ergebnisse ---
+def parse_frame_reprs(texts, wind_column=None):
+    """
+    Parst die als Text gespeicherten DataFrames (repr mit Index `time`, Wind, Energie)
+    aller Iterationen in einem Durchgang.
+
+    Die Kopfzeilen werden abgeschnitten, alle Datenzeilen zu einem Text verbunden und
+    gemeinsam mit dem C-Parser von pandas gelesen. Der repr enthält nur 6 Nachkommastellen;
+    gekürzte Darstellungen ("...") werden abgelehnt, da dort Punkte fehlen.
+
+    Parameters:
+        texts (pd.Series): Ein repr-Text je Iteration (z. B. Spalte bootstrap_data)
+        wind_column (str): Windspalte bei mehreren Windspalten (z. B. "era5")
+
+    Returns:
+        tuple: (time datetime64[ns], wind float64, energy float64, counts int64)
+    """
+    texts = pd.Series(texts, dtype=object).reset_index(drop=True)
+    if not texts.map(lambda t: isinstance(t, str)).all():
+        raise ValueError("Textspalte enthält leere Einträge (NaN).")
+
+    truncated = texts.str.contains(r"\n\.\.\.|rows x \d+ columns", regex=True)
+    if truncated.any():
+        raise ValueError(
+            f"Gekürzte DataFrame-Darstellung in Iteration(en) {list(np.flatnonzero(truncated)[:10])}; "
+            f"Punkte nur aus den Pickle-Dateien rekonstruierbar."
+        )
+
+    empty = texts.str.startswith("Empty DataFrame").to_numpy()
+    parts = texts.str.split("\n", n=2)
+    columns = parts.str[0].where(~empty, texts.str.extract(r"Columns: \[(.*)\]", expand=False))
+    columns = columns.str.replace(",", " ").str.split().map(tuple)
+
+    unique_columns = set(columns)
+    if len(unique_columns) != 1:
+        raise ValueError(f"Uneinheitliche Spalten in den DataFrame-Texten: {sorted(unique_columns)}")
+    columns = list(unique_columns.pop())
+
+    if wind_column is None:
+        if len(columns) != 2:
+            raise ValueError(f"Erwartet (Wind, Energie), gefunden: {columns}. Bitte 'wind_column' angeben.")
+        wind_position = 0
+    elif wind_column in columns:
+        wind_position = columns.index(wind_column)
+    else:
+        raise ValueError(f"Spalte '{wind_column}' nicht in den DataFrame-Texten gefunden ({columns}).")
+
+    bodies = parts.str[2].where(~empty, "").fillna("")
+    counts = np.where(bodies.str.len().to_numpy() == 0, 0, bodies.str.count("\n").to_numpy() + 1)
+    joined = "\n".join(body for body in bodies if body)
+
+    if not joined:
+        return (np.empty(0, dtype="datetime64[ns]"), np.empty(0), np.empty(0), counts.astype(np.int64))
+
+    values = pd.read_csv(
+        io.StringIO(joined), sep=r"\s+", header=None, engine="c", float_precision="round_trip"
+    )
+    # Stündliche Indizes ("2014-01-01 01:00:00") belegen zwei Felder
+    n_time_fields = values.shape[1] - len(columns)
+    if n_time_fields not in (1, 2) or len(values) != counts.sum():
+        raise ValueError("DataFrame-Texte konnten nicht eindeutig gelesen werden.")
+
+    time_text = values[0].astype(str)
+    if n_time_fields == 2:
+        time_text = time_text + " " + values[1].astype(str)
+
+    return (
+        pd.to_datetime(time_text).to_numpy("datetime64[ns]"),
+        values[n_time_fields + wind_position].to_numpy(np.float64),
+        values[values.shape[1] - 1].to_numpy(np.float64),
+        counts.astype(np.int64),
+    )
+
+
+def build_bootstrap_store_from_texts(bootstrap_texts, non_bootstrap_texts, wind_column=None):
+    """
+    Baut einen BootstrapStore aus den Spalten bootstrap_data / non_bootstrap_data der
+    MC-Ergebnisse (ohne Pickle-Dateien). Reihenfolge wie build_bootstrap_store.
+    """
+    if len(bootstrap_texts) != len(non_bootstrap_texts):
+        raise ValueError("Bootstrap- und Non-Bootstrap-Daten haben unterschiedlich viele Iterationen.")
+
+    b_time, b_wind, b_energy, b_counts = parse_frame_reprs(bootstrap_texts, wind_column)
+    nb_time, nb_wind, nb_energy, nb_counts = parse_frame_reprs(non_bootstrap_texts, wind_column)
+
+    n_iterations = len(b_counts)
+    iteration = np.concatenate([
+        np.repeat(np.arange(n_iterations, dtype=np.int32), b_counts),
+        np.repeat(np.arange(n_iterations, dtype=np.int32), nb_counts),
+    ])
+    source = np.concatenate([np.zeros(b_counts.sum(), dtype=np.int8), np.ones(nb_counts.sum(), dtype=np.int8)])
+
+    # Je Iteration erst Bootstrap, dann Non-Bootstrap (stabile Sortierung erhält die Reihenfolge)
+    order = np.argsort(iteration.astype(np.int64) * 2 + source, kind="stable")
+    counts = b_counts + nb_counts
+
+    return BootstrapStore(
+        iteration=iteration[order],
+        time=np.concatenate([b_time, nb_time])[order],
+        wind_speed=np.concatenate([b_wind, nb_wind])[order],
+        energy=np.concatenate([b_energy, nb_energy])[order],
+        source=source[order],
+        offsets=np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    )
+
+
+def load_bootstrap_store_cached(csv_path, cache_dir, wind_column=None):
+    """
+    Liefert den BootstrapStore zu einer MC-Ergebnis-CSV aus dem Cache (memory-mapped .npy).
+
+    Beim ersten Aufruf (bzw. nach Änderung der CSV) werden nur die beiden Textspalten
+    gelesen und mit parse_frame_reprs zerlegt.
+    """
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    suffix = f"-{wind_column}" if wind_column else ""
+    directory = os.path.join(cache_dir, f"{stem}-bootstrap{suffix}")
+    meta_path = os.path.join(directory, "source.meta.json")
+
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if is_cache_valid(csv_path, meta):
+            return load_bootstrap_store(directory)
+
+    texts = pd.read_csv(csv_path, usecols=["bootstrap_data", "non_bootstrap_data"])
+    store = build_bootstrap_store_from_texts(
+        texts["bootstrap_data"], texts["non_bootstrap_data"], wind_column=wind_column
+    )
+
+    try:
+        save_bootstrap_store(store, directory)
+        write_atomic_json(meta_path, source_metadata(csv_path))
+        return load_bootstrap_store(directory)
+    except OSError as e:
+        print(f"Bootstrap-Store für {csv_path} konnte nicht gespeichert werden: {e}")
+        return store
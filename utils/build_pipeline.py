@@ -0,0 +1,390 @@
+import json
+import os
+import pickle
+import time
+
+import pandas as pd
+
+from utils.bootstrap_store import (
+    build_bootstrap_store,
+    build_bootstrap_store_from_texts,
+    load_bootstrap_store,
+    save_bootstrap_store
+)
+from utils.cache import file_sha256, source_metadata, source_signature, write_atomic_json
+from utils.parallel_transform import run_tasks
+from utils.running_stats import compute_dataset_stats
+from utils.transform_lt import transform_energy_wind_data
+from utils.transform_por import write_scatter_streaming
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bei Änderungen an einer Transformation erhöhen, um alle Artefakte dieser Art neu zu bauen
+ARTIFACT_VERSIONS = {
+    "lt": 1,
+    "bootstrap": 1,
+    "scatter": 1,
+    "stats": 2,
+}
+
+# Textspalten der MC-Ergebnisse, die für die Kennzahlen nicht gelesen werden
+MC_TEXT_COLUMNS = ["yearly_gross_energy", "yearly_wind_speeds", "bootstrap_data", "non_bootstrap_data"]
+
+# Iterationen je Block beim gestreamten Schreiben der Scatter-Daten
+SCATTER_CHUNK_ITERATIONS = 500
+
+
+def artifact_file_name(label):
+    """Dateiname-Stamm der Scatter-Artefakte, z. B. "ERA5 gefiltert" -> "era5_gefiltert"."""
+    return label.lower().replace(" ", "_")
+
+
+# --- Builder je Artefakt-Art ---
+def _build_lt(inputs, output, spec):
+    df = pd.read_csv(inputs["mc"])
+    df_transformed = transform_energy_wind_data(df, dataset_name=spec["lt_name"])
+    df_transformed.to_csv(output, index=False)
+
+
+def _build_bootstrap(inputs, output, spec):
+    if "bootstrap" in inputs:
+        with open(inputs["bootstrap"], "rb") as f:
+            bootstrap_data = pickle.load(f)
+        with open(inputs["non_bootstrap"], "rb") as f:
+            non_bootstrap_data = pickle.load(f)
+        store = build_bootstrap_store(bootstrap_data, non_bootstrap_data, wind_column=spec["wind_column"])
+    else:
+        # Ohne Pickles: Punkte aus den Textspalten der MC-Ergebnisse (6 Nachkommastellen)
+        texts = pd.read_csv(inputs["mc"], usecols=["bootstrap_data", "non_bootstrap_data"])
+        store = build_bootstrap_store_from_texts(
+            texts["bootstrap_data"], texts["non_bootstrap_data"], wind_column=spec["wind_column"]
+        )
+    save_bootstrap_store(store, output)
+
+
+def _build_scatter(inputs, output, spec):
+    df = pd.read_csv(inputs["mc"])
+    write_scatter_streaming(
+        df, output,
+        bootstrap_store=load_bootstrap_store(inputs["bootstrap_store"]),
+        dataset_name=spec["label"],
+        chunk_size=SCATTER_CHUNK_ITERATIONS
+    )
+
+
+def _build_stats(inputs, output, spec):
+    df = pd.read_csv(inputs["mc"], usecols=lambda column: column not in MC_TEXT_COLUMNS)
+    stats = compute_dataset_stats(df)
+    stats.source = source_metadata(inputs["mc"])
+    stats.save(output)
+
+
+BUILDERS = {
+    "lt": _build_lt,
+    "bootstrap": _build_bootstrap,
+    "scatter": _build_scatter,
+    "stats": _build_stats,
+}
+
+
+def plan_artifacts(manifest, dirs, root=REPO_ROOT, csv_bootstrap=()):
+    """
+    Leitet aus dem Manifest alle abgeleiteten Artefakte ab.
+
+    Parameters:
+        manifest (dict): Basisname (z. B. "mc_era5") -> {label, wind_column, lt_name, por}
+        dirs (dict): raw, longterm, bootstrap, scatter (relativ zu `root`)
+        root (str): Projektverzeichnis
+        csv_bootstrap (list[str]): Basisnamen, deren Bootstrap-Punkte immer aus den
+            Textspalten stammen (z. B. nach ingest_iterations, die Pickles sind dann unvollständig)
+
+    Returns:
+        list[dict]: name, kind, inputs (Rolle -> Pfad), output, spec – in Build-Reihenfolge
+    """
+    def path(key, *parts):
+        return os.path.join(root, dirs[key], *parts)
+
+    artifacts = []
+
+    for base_name, spec in manifest.items():
+        raw = {
+            "mc": path("raw", f"{base_name}.csv"),
+            "bootstrap": path("raw", f"{base_name}_bootstrap.pkl"),
+            "non_bootstrap": path("raw", f"{base_name}_non_bootstrap.pkl"),
+        }
+
+        artifacts.append({
+            "name": f"lt:{base_name}",
+            "kind": "lt",
+            "inputs": {"mc": raw["mc"]},
+            "output": path("longterm", f"mc_{spec['lt_name']}_lt.csv"),
+            "spec": spec,
+        })
+
+        if "stats" in dirs:
+            artifacts.append({
+                "name": f"stats:{base_name}",
+                "kind": "stats",
+                "inputs": {"mc": raw["mc"]},
+                "output": path("stats", f"{base_name}.json"),
+                "spec": spec,
+            })
+
+        if not spec.get("por", True):
+            continue
+
+        store_dir = path("bootstrap", base_name)
+        stem = artifact_file_name(spec["label"])
+
+        # Pickles (volle Genauigkeit) bevorzugt, sonst Textspalten der MC-Ergebnisse
+        has_pickles = os.path.exists(raw["bootstrap"]) and os.path.exists(raw["non_bootstrap"])
+        if has_pickles and base_name not in csv_bootstrap:
+            bootstrap_inputs = {"bootstrap": raw["bootstrap"], "non_bootstrap": raw["non_bootstrap"]}
+        else:
+            bootstrap_inputs = {"mc": raw["mc"]}
+
+        artifacts.append({
+            "name": f"bootstrap:{base_name}",
+            "kind": "bootstrap",
+            "inputs": bootstrap_inputs,
+            "output": store_dir,
+            "spec": spec,
+        })
+        # Scatter liest die MC-Ergebnisse und den Store; dessen Quellen zählen mit, damit
+        # ein neu gebauter Store auch die Scatter-Daten erneuert
+        artifacts.append({
+            "name": f"scatter:{base_name}",
+            "kind": "scatter",
+            "inputs": dict(bootstrap_inputs, mc=raw["mc"]),
+            "output": path("scatter", f"mc_{stem}_scatter.csv"),
+            "spec": spec,
+            "requires": {"bootstrap_store": store_dir},
+        })
+
+    return artifacts
+
+
+# --- Manifest (Zustand des letzten Builds) ---
+def load_build_state(state_path):
+    if not os.path.exists(state_path):
+        return {"artifacts": {}, "inputs": {}}
+    with open(state_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _relative(path, root):
+    return os.path.relpath(path, root)
+
+
+def hash_inputs(paths, known_inputs, root=REPO_ROOT):
+    """
+    SHA-256 aller Eingabedateien. Unveränderte Dateien (Größe + mtime wie im letzten
+    Manifest) werden nicht erneut gehasht.
+    """
+    hashes = {}
+    for path in sorted(set(paths)):
+        key = _relative(path, root)
+        if not os.path.exists(path):
+            hashes[key] = None
+            continue
+
+        signature = source_signature(path)
+        known = known_inputs.get(key)
+        if known and known.get("size") == signature["size"] and known.get("mtime_ns") == signature["mtime_ns"]:
+            hashes[key] = dict(known)
+        else:
+            hashes[key] = dict(signature, sha256=file_sha256(path))
+    return hashes
+
+
+def _artifact_fingerprint(artifact, input_hashes, root):
+    return {
+        "version": ARTIFACT_VERSIONS[artifact["kind"]],
+        "inputs": {
+            role: (input_hashes[_relative(path, root)] or {}).get("sha256")
+            for role, path in sorted(artifact["inputs"].items())
+        },
+    }
+
+
+def _record_artifact(state, artifact, input_hashes, root):
+    state["artifacts"][artifact["name"]] = {
+        "kind": artifact["kind"],
+        "output": _relative(artifact["output"], root),
+        "fingerprint": _artifact_fingerprint(artifact, input_hashes, root),
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def find_stale_artifacts(artifacts, state, input_hashes, root=REPO_ROOT):
+    """Artefakte, deren Ausgabe fehlt oder deren Eingaben/Version sich geändert haben."""
+    stale = []
+    for artifact in artifacts:
+        recorded = state["artifacts"].get(artifact["name"])
+        fingerprint = _artifact_fingerprint(artifact, input_hashes, root)
+        if (
+            recorded is None
+            or recorded.get("fingerprint") != fingerprint
+            or not os.path.exists(artifact["output"])
+        ):
+            stale.append(artifact)
+    return stale
+
+
+def run_build(manifest, dirs, state_path, root=REPO_ROOT, force=False, only=None, dry_run=False, jobs=1):
+    """
+    Baut alle veralteten Artefakte neu und schreibt das Manifest.
+
+    Parameters:
+        force (bool): Alle Artefakte unabhängig vom Manifest neu bauen
+        only (list[str]): Nur diese Artefakt-Arten bauen (z. B. ["lt"])
+        dry_run (bool): Nur anzeigen, was gebaut würde
+        jobs (int): Anzahl Prozesse für voneinander unabhängige Artefakte
+
+    Returns:
+        list[dict]: Je gebautem Artefakt name, seconds, error
+    """
+    state_path = os.path.join(root, state_path)
+    state = load_build_state(state_path)
+    artifacts = [
+        a for a in plan_artifacts(manifest, dirs, root, state.get("csv_bootstrap", []))
+        if not only or a["kind"] in only
+    ]
+
+    input_hashes = hash_inputs(
+        [path for a in artifacts for path in a["inputs"].values()],
+        state.get("inputs", {}),
+        root
+    )
+    stale = artifacts if force else find_stale_artifacts(artifacts, state, input_hashes, root)
+
+    print(f"{len(stale)} von {len(artifacts)} Artefakten veraltet.")
+    if dry_run:
+        for artifact in stale:
+            print(f"  würde bauen: {artifact['name']} -> {_relative(artifact['output'], root)}")
+        return []
+
+    # Artefakte ohne fehlende Eingaben; abhängige (z. B. Scatter -> Bootstrap-Store) erst
+    # in einer zweiten Welle, nachdem die Vorgänger gebaut sind
+    results = {}
+    ready = []
+    for artifact in stale:
+        requires = artifact.get("requires", {})
+        missing = [_relative(path, root) for path in artifact["inputs"].values() if not os.path.exists(path)]
+        missing += [
+            _relative(path, root) for path in requires.values()
+            if not os.path.exists(path) and path not in {a["output"] for a in stale}
+        ]
+        if missing:
+            print(f"⚠️  {artifact['name']} übersprungen, Eingaben fehlen: {', '.join(missing)}")
+            results[artifact["name"]] = {"name": artifact["name"], "seconds": 0.0, "error": "Eingaben fehlen"}
+            continue
+        ready.append(artifact)
+
+    for wave in [[a for a in ready if not a.get("requires")], [a for a in ready if a.get("requires")]]:
+        tasks = []
+        for artifact in wave:
+            print(f"🔄 Baue {artifact['name']} ...")
+            os.makedirs(os.path.dirname(artifact["output"]), exist_ok=True)
+            tasks.append({
+                "name": artifact["name"],
+                "func": BUILDERS[artifact["kind"]],
+                "args": (dict(artifact["inputs"], **artifact.get("requires", {})), artifact["output"], artifact["spec"]),
+            })
+
+        for artifact, task_result in zip(wave, run_tasks(tasks, jobs=jobs)):
+            results[artifact["name"]] = {
+                "name": artifact["name"], "seconds": task_result["seconds"], "error": task_result["error"]
+            }
+            if task_result["error"] is not None:
+                print(f"❌ {artifact['name']} fehlgeschlagen: {task_result['error']}")
+                continue
+
+            _record_artifact(state, artifact, input_hashes, root)
+            print(f"✅ {artifact['name']} gebaut ({task_result['seconds']:.2f} s)")
+
+    state.setdefault("inputs", {}).update(
+        {key: value for key, value in input_hashes.items() if value is not None}
+    )
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    write_atomic_json(state_path, state)
+    # Ergebnisse in Planreihenfolge, unabhängig von der Fertigstellung
+    return [results[a["name"]] for a in stale if a["name"] in results]
+
+
+def check_build_state(manifest, dirs, state_path, root=REPO_ROOT):
+    """
+    Prüft beim App-Start, ob die Artefakte unter data/processed zum Rohdatenstand passen.
+
+    Ohne Manifest (z. B. frischer Clone, data/processed wird mitgeliefert) gibt es nichts zu
+    vergleichen. Sonst werden nur Größe und mtime der Eingaben mit dem Manifest verglichen,
+    ohne Inhalte zu hashen; eine bloß berührte Datei gilt damit als geändert, den genauen
+    Abgleich per SHA-256 macht erst run_build.
+
+    Returns:
+        list[str]: Namen veralteter Artefakte (leer = aktuell)
+    """
+    state_path = os.path.join(root, state_path)
+    if not os.path.exists(state_path):
+        return []
+
+    state = load_build_state(state_path)
+    known_inputs = state.get("inputs", {})
+    stale = []
+    for artifact in plan_artifacts(manifest, dirs, root, state.get("csv_bootstrap", [])):
+        recorded = state["artifacts"].get(artifact["name"])
+        if recorded is None or not os.path.exists(artifact["output"]):
+            stale.append(artifact["name"])
+            continue
+
+        fingerprint = recorded.get("fingerprint", {})
+        current = fingerprint.get("version") == ARTIFACT_VERSIONS[artifact["kind"]]
+        for role, path in artifact["inputs"].items():
+            known = known_inputs.get(_relative(path, root))
+            if not current or known is None or not os.path.exists(path):
+                current = False
+                break
+            signature = source_signature(path)
+            current = (
+                known.get("size") == signature["size"]
+                and known.get("mtime_ns") == signature["mtime_ns"]
+                and fingerprint.get("inputs", {}).get(role) == known.get("sha256")
+            )
+            if not current:
+                break
+        if not current:
+            stale.append(artifact["name"])
+    return stale
+
+
+def mark_artifacts_current(manifest, dirs, state_path, names, root=REPO_ROOT, csv_bootstrap=()):
+    """
+    Trägt bereits (inkrementell) aktualisierte Artefakte mit den aktuellen Eingabe-Hashes
+    ins Manifest ein, damit der nächste Build sie nicht erneut baut.
+
+    Parameters:
+        names (list[str]): Artefaktnamen, z. B. ["lt:mc_era5", "stats:mc_era5"]
+        csv_bootstrap (list[str]): Basisnamen, die künftig die Textspalten statt der Pickles nutzen
+    """
+    state_path = os.path.join(root, state_path)
+    state = load_build_state(state_path)
+    state["csv_bootstrap"] = sorted(set(state.get("csv_bootstrap", [])) | set(csv_bootstrap))
+
+    artifacts = [
+        a for a in plan_artifacts(manifest, dirs, root, state["csv_bootstrap"]) if a["name"] in names
+    ]
+    input_hashes = hash_inputs(
+        [path for a in artifacts for path in a["inputs"].values()],
+        state.get("inputs", {}),
+        root
+    )
+    for artifact in artifacts:
+        if os.path.exists(artifact["output"]):
+            _record_artifact(state, artifact, input_hashes, root)
+
+    state.setdefault("inputs", {}).update(
+        {key: value for key, value in input_hashes.items() if value is not None}
+    )
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    write_atomic_json(state_path, state)
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv  # Feather/Arrow-IPC und optionaler CSV-Parser
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+CACHE_FORMAT_VERSION = 1
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_signature(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def source_metadata(path):
+    """Signatur (Größe, mtime, SHA-256) einer Quelldatei für Cache-Metadaten."""
+    meta = source_signature(path)
+    meta["sha256"] = file_sha256(path)
+    meta["source"] = path
+    return meta
+
+
+def _read_key(read_kwargs):
+    payload = json.dumps(
+        {"version": CACHE_FORMAT_VERSION, "kwargs": read_kwargs},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def get_cache_paths(path, cache_dir, read_kwargs=None):
+    """Liefert (Feather-Datei, Metadaten-Datei) des Caches zu einer Quelldatei."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    key = _read_key(read_kwargs or {})
+    base = os.path.join(cache_dir, f"{stem}-{key}")
+    return f"{base}.feather", f"{base}.meta.json"
+
+
+def is_cache_valid(path, meta):
+    """Prüft, ob die in `meta` gespeicherte Signatur noch zur Quelldatei passt."""
+    signature = source_signature(path)
+
+    if meta.get("size") != signature["size"]:
+        return False
+    if meta.get("mtime_ns") == signature["mtime_ns"]:
+        return True
+
+    # Gleiche Größe, aber neue mtime (z. B. nach git checkout): Inhalt vergleichen
+    return meta.get("sha256") == file_sha256(path)
+
+
+def write_atomic_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def save_npy_atomic(path, array):
+    """
+    Speichert ein .npy-Array über eine temporäre Datei. Bestehende memory-maps auf die
+    alte Datei bleiben gültig (neue Datei statt Überschreiben an Ort und Stelle).
+    """
+    tmp_path = f"{path[:-len('.npy')]}.tmp.npy"
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+
+def parse_csv(path, engine="pandas", **read_kwargs):
+    """
+    Parst eine CSV mit pandas oder (engine="pyarrow") mit dem multithreaded Arrow-Parser.
+
+    Der Arrow-Parser unterstützt hier nur `usecols` (Liste) und `parse_dates` (Liste);
+    bei anderen Argumenten oder ohne pyarrow wird auf pandas zurückgefallen.
+    """
+    supported = set(read_kwargs) <= {"usecols", "parse_dates"}
+    if engine != "pyarrow" or not HAS_PYARROW or not supported:
+        return pd.read_csv(path, **read_kwargs)
+
+    table = pa_csv.read_csv(
+        path,
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(include_columns=read_kwargs.get("usecols"))
+    )
+    df = table.to_pandas()
+    for column in read_kwargs.get("parse_dates", []):
+        df[column] = pd.to_datetime(df[column])
+    return df
+
+
+def read_csv_cached(path, cache_dir, engine="pandas", **read_kwargs):
+    """
+    Liest eine CSV-Datei über einen binären Spalten-Cache (Feather/Arrow IPC).
+
+    Beim ersten Aufruf wird die CSV geparst und als Feather-Datei in `cache_dir`
+    abgelegt. Folgeaufrufe lesen direkt aus dem Cache, solange Größe, mtime bzw.
+    SHA-256 der Quelldatei unverändert sind. Ohne pyarrow wird die CSV direkt gelesen.
+
+    Parameters:
+        path (str): Pfad zur Quell-CSV
+        cache_dir (str): Verzeichnis für die Cache-Dateien
+        engine (str): CSV-Parser beim Neuaufbau, "pandas" oder "pyarrow" (siehe parse_csv)
+        **read_kwargs: Argumente für pd.read_csv (Teil des Cache-Schlüssels)
+
+    Returns:
+        pd.DataFrame: Identisch zu pd.read_csv(path, **read_kwargs)
+    """
+    if not HAS_PYARROW:
+        return pd.read_csv(path, **read_kwargs)
+
+    # Der Parser ist Teil des Schlüssels (Arrow rundet Gleitkommazahlen minimal anders)
+    key_kwargs = dict(read_kwargs, engine=engine) if engine != "pandas" else read_kwargs
+    cache_path, meta_path = get_cache_paths(path, cache_dir, key_kwargs)
+
+    if os.path.exists(cache_path) and os.path.exists(meta_path):
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+
+            if is_cache_valid(path, meta):
+                if meta.get("mtime_ns") != source_signature(path)["mtime_ns"]:
+                    meta.update(source_signature(path))
+                    write_atomic_json(meta_path, meta)
+                return pd.read_feather(cache_path)
+        except (OSError, ValueError) as e:
+            print(f"Cache für {path} unlesbar, wird neu erstellt: {e}")
+
+    df = parse_csv(path, engine=engine, **read_kwargs)
+
+    # Cache schreiben ist optional: scheitert es (z. B. Objektspalte mit gemischten Typen,
+    # die Arrow nicht abbilden kann), wird das geparste Ergebnis trotzdem zurückgegeben
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_feather(tmp_path)
+        os.replace(tmp_path, cache_path)
+
+        meta = source_metadata(path)
+        meta["read_kwargs"] = json.loads(json.dumps(read_kwargs, default=str))
+        write_atomic_json(meta_path, meta)
+    except (OSError, ValueError, TypeError, pa.ArrowException) as e:
+        print(f"Cache für {path} konnte nicht geschrieben werden: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return df
+
+
+def clear_cache(cache_dir):
+    """
+    Entfernt alle Cache-Dateien aus `cache_dir`, einschließlich der Verzeichnisse der
+    LT-Matrizen (`<stem>-matrix/`) und Bootstrap-Stores (`<stem>-bootstrap*/`).
+
+    Returns:
+        int: Anzahl entfernter Dateien und Verzeichnisse
+    """
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    removed = 0
+    for filename in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, filename)
+        if os.path.isdir(path):
+            if filename.endswith("-matrix") or "-bootstrap" in filename:
+                shutil.rmtree(path)
+                removed += 1
+        elif filename.endswith((".feather", ".npy", ".meta.json")):
+            os.remove(path)
+            removed += 1
+    return removed
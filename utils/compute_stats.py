@@ -1,4 +1,9 @@
+import numpy as np
+import pandas as pd
+
 from data.config import TIMESERIES_DATAFRAMES
+from utils.lt_store import LTMatrix, lt_matrix_to_long
+from utils.rank_index import parse_iteration_method
 
 
 def compute_normalized_timeseries():
@@ -14,17 +19,18 @@ def compute_normalized_timeseries():
     return era5_ts, merra2_ts
 
 
-def get_aep_stats(dataframes):
+def get_aep_stats(catalogs, metric="aep_final"):
+    """Mittelwert und CV der AEP je Label aus den Kennzahl-Katalogen (STATS_CATALOGS)."""
     stats = {
         "labels": [],
         "mean_aep": [],
         "aep_cv": []
     }
     
-    for label, df in dataframes.items():
+    for label, catalog in catalogs.items():
         stats["labels"].append(label)
-        mean = df["aep_final"].mean()
-        std = df["aep_final"].std()
+        mean = catalog[metric]["mean"]
+        std = catalog[metric]["std"]
         stats["mean_aep"].append(mean)
         stats["aep_cv"].append(std / mean)
     
@@ -34,16 +40,25 @@ def get_aep_stats(dataframes):
 def filter_dataframes_by_labels(dataframes, selected_labels):    
     filtered = {}
     
-    for label, df in dataframes.items():
+    # Nur ausgewählte Labels anfassen, damit lazy Registries nichts Unnötiges laden
+    for label in dataframes:
         if label in selected_labels:
-            filtered[label]=df
+            filtered[label] = dataframes[label]
             
     return filtered
 
 
 def compute_lt_metrics(df, column ="energy"):
-    df_grouped = df.groupby("year", as_index=False).agg(mean_value=(column, "mean"))
-    df_grouped = df_grouped.sort_values("year")
+    if isinstance(df, LTMatrix):
+        values = np.asarray(getattr(df, column))
+        has_values = (~np.isnan(values)).any(axis=0)
+        df_grouped = pd.DataFrame({
+            "year": np.asarray(df.years)[has_values],
+            "mean_value": np.nanmean(values[:, has_values], axis=0)
+        })
+    else:
+        df_grouped = df.groupby("year", as_index=False).agg(mean_value=(column, "mean"))
+        df_grouped = df_grouped.sort_values("year")
     
     years = df_grouped["year"]
     non_cum_mean = df_grouped["mean_value"]
@@ -56,51 +71,27 @@ def compute_lt_metrics(df, column ="energy"):
 
 
 def filter_lt_data(df, selected_years):
+    if isinstance(df, LTMatrix):
+        return lt_matrix_to_long(df, selected_years)
     return df[df["year"].isin(selected_years)]
 
 
 
-def get_iteration(df, metric, method="max"):  
+def get_iteration(df, metric, method="max", index=None):
+    """
+    Iteration, deren Metrikwert dem gewählten Wert (max, min, median, q1, q3 oder
+    Perzentil wie "p95") am nächsten liegt.
+
+    Mit `index` (IterationRankIndex des Datensatzes) per binärer Suche über die Werte je
+    Iteration, sonst per Scan über alle Zeilen von `df`.
+    """
+    if index is not None:
+        return index.get_iteration(metric, method)
+
     if df.empty or metric not in df.columns:
         raise ValueError("Ungültige Dataframes oder Metrik nicht gefunden.")
-        
-    method = method.lower()
-    
-    if method == "max":
-        target_value = df[metric].max()
-    elif method == "min":
-        target_value = df[metric].min()
-    elif method == "median":
-        target_value = df[metric].median()
-    elif method == "q1":
-        target_value = df[metric].quantile(0.25)
-    elif method == "q3":
-        target_value = df[metric].quantile(0.75)
-    else:
-        raise ValueError(f"Unbekannte Methode: {method}")
-    
+
+    target_value = df[metric].quantile(parse_iteration_method(method))
     closest_index = (df[metric] - target_value).abs().idxmin()
 
     return df.loc[closest_index, "iteration"]
-        
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+
+from utils.running_stats import load_dataset_stats
+
+
+CORRELATION_METHODS = ["pearson", "spearman"]
+
+
+class CorrelationMatrices:
+    """
+    Vollständige Korrelationsmatrizen (Pearson und Spearman) aller Metriken eines Datensatzes.
+
+    Einmal beim Laden berechnet; Plots schneiden nur noch die gewählten Metriken heraus.
+    Methoden in `loaders` (Methode -> Funktion ohne Argumente) werden erst beim ersten Zugriff
+    berechnet.
+    """
+
+    def __init__(self, matrices, name=None, loaders=None):
+        self._matrices = dict(matrices)
+        self._loaders = dict(loaders or {})
+        self.name = name
+
+    @property
+    def metrics(self):
+        return list(next(iter(self._matrices.values())).columns) if self._matrices else []
+
+    @property
+    def nbytes(self):
+        return sum(int(m.to_numpy().nbytes) for m in self._matrices.values())
+
+    def __repr__(self):
+        return f"CorrelationMatrices(name={self.name!r}, metrics={self.metrics})"
+
+    def matrix(self, metrics=None, method="pearson"):
+        """
+        Ausschnitt der Korrelationsmatrix (Reihenfolge wie `metrics`; fehlende Metriken entfallen).
+        """
+        if method not in self._matrices and method in self._loaders:
+            self._matrices[method] = self._loaders.pop(method)()
+        if method not in self._matrices:
+            raise ValueError(f"Unbekannte Korrelationsmethode: {method}")
+        corr = self._matrices[method]
+        if metrics is None:
+            return corr
+        metrics = [metric for metric in metrics if metric in corr.columns]
+        return corr.loc[metrics, metrics]
+
+
+def build_correlation_matrices(df, metrics, name=None):
+    """
+    Pearson- und Spearman-Korrelationen aller numerischen `metrics` eines Datensatzes
+    (paarweise ohne NaN wie pd.DataFrame.corr).
+    """
+    metrics = [
+        metric for metric in metrics
+        if metric in df.columns and pd.api.types.is_numeric_dtype(df[metric])
+    ]
+    values = df[metrics].astype(np.float64)
+    return CorrelationMatrices(
+        {method: values.corr(method=method) for method in CORRELATION_METHODS},
+        name=name
+    )
+
+
+def load_correlation_matrices(registry, label, metrics, stats_path=None, source_path=None):
+    """
+    Loader für eine Korrelations-Registry.
+
+    Passen die gespeicherten Kennzahlen unter `stats_path` zum Stand der Rohdatei `source_path`,
+    stammt die Pearson-Matrix aus deren laufender Kovarianz (über vollständige Zeilen statt
+    paarweise); Spearman braucht die Ränge und wird erst bei Bedarf aus `registry[label]`
+    berechnet. Sonst werden beide Matrizen aus dem geladenen Datensatz berechnet.
+    """
+    if stats_path is not None:
+        dataset_stats = load_dataset_stats(stats_path, source_path)
+        if dataset_stats is not None:
+            pearson = dataset_stats.correlation()
+            metrics = [metric for metric in metrics if metric in pearson.columns]
+
+            def spearman():
+                return build_correlation_matrices(registry[label], metrics).matrix(method="spearman")
+
+            return CorrelationMatrices(
+                {"pearson": pearson.loc[metrics, metrics]},
+                name=label,
+                loaders={"spearman": spearman}
+            )
+
+    return build_correlation_matrices(registry[label], metrics, name=label)
+
+
+def cluster_order(*corrs):
+    """
+    Reihenfolge der Metriken nach hierarchischer Clusterung (average linkage, Distanz 1 - |r|).
+
+    Bei mehreren Matrizen (gleiche Metriken) wird über |r| gemittelt, damit alle Heatmaps
+    dieselbe Reihenfolge erhalten. Fehlende Korrelationen (NaN) gelten als Distanz 1.
+
+    Returns:
+        list: Metriken in Blattreihenfolge des Dendrogramms
+    """
+    metrics = list(corrs[0].columns)
+    if len(metrics) < 3:
+        return metrics
+
+    abs_corr = np.mean([np.nan_to_num(np.abs(c.loc[metrics, metrics].to_numpy()), nan=0.0) for c in corrs], axis=0)
+    distance = 1 - abs_corr
+    np.fill_diagonal(distance, 0.0)
+
+    # Cluster als Listen von Metrik-Indizes (Blattreihenfolge); zusammenfassen nach kleinster
+    # mittlerer Distanz zwischen den Mitgliedern
+    clusters = [[i] for i in range(len(metrics))]
+    while len(clusters) > 1:
+        best = None
+        for a in range(len(clusters)):
+            for b in range(a + 1, len(clusters)):
+                d = distance[np.ix_(clusters[a], clusters[b])].mean()
+                if best is None or d < best[0]:
+                    best = (d, a, b)
+        _, a, b = best
+        merged = clusters[a] + clusters[b]
+        clusters = [c for k, c in enumerate(clusters) if k not in (a, b)] + [merged]
+
+    return [metrics[i] for i in clusters[0]]
@@ -0,0 +1,210 @@
+import os
+import shutil
+import time
+
+import pandas as pd
+
+from utils.bootstrap_store import (
+    build_bootstrap_store_from_texts,
+    concat_bootstrap_stores,
+    load_bootstrap_store,
+    save_bootstrap_store
+)
+from utils.build_pipeline import MC_TEXT_COLUMNS, REPO_ROOT, mark_artifacts_current, plan_artifacts
+from utils.cache import source_metadata
+from utils.nested_columns import read_csv_header
+from utils.running_stats import DatasetStats, compute_dataset_stats
+from utils.transform_lt import transform_energy_wind_data
+from utils.transform_por import SCATTER_METRICS, write_scatter_streaming
+
+
+def _ensure_trailing_newline(path):
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def _append_csv_file(part_path, path):
+    # Teildatei ohne Kopfzeile anhängen
+    _ensure_trailing_newline(path)
+    with open(part_path, "rb") as src, open(path, "ab") as dst:
+        src.readline()
+        shutil.copyfileobj(src, dst)
+    os.remove(part_path)
+
+
+def _replace_store(tmp_dir, directory):
+    # Fertig geschriebenes Verzeichnis tauschen; bestehende memory-maps anderer Prozesse
+    # bleiben gültig, da die alten Dateien nur gelöscht (nicht überschrieben) werden
+    old_dir = f"{directory}.old"
+    shutil.rmtree(old_dir, ignore_errors=True)
+    os.replace(directory, old_dir)
+    os.replace(tmp_dir, directory)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def _max_iteration(path, column):
+    values = pd.read_csv(path, usecols=[column])[column]
+    return int(values.max()) if len(values) else -1
+
+
+def ingest_iterations(base_name, new_rows, manifest, dirs, state_path, root=REPO_ROOT):
+    """
+    Hängt zusätzliche MC-Iterationen an einen bestehenden Datensatz an.
+
+    Nur die neuen Zeilen werden transformiert: sie werden an data/raw/<basis>.csv, die
+    LT-Langtabelle und die Scatter-Daten angehängt, der Bootstrap-Store wird um die Punkte
+    aus den Textspalten erweitert und die laufenden Kennzahlen (DatasetStats) werden
+    fortgeschrieben. Die POR-Zeitreihe ist virtuell (PORModel) und braucht keinen Schritt.
+    Anschließend wird das Build-Manifest aktualisiert, sodass kein Neubau nötig ist.
+
+    Ablauf: zuerst alle Prüfungen (Iterationszahlen von Bootstrap-Store, LT- und
+    Scatter-Daten), dann werden alle neuen Teile in temporäre Dateien geschrieben. Erst
+    danach werden die Artefakte in einem Schritt ersetzt bzw. erweitert, die Rohdaten
+    zuletzt. Schlägt eine Prüfung oder Vorbereitung fehl, bleibt der Datensatz unverändert.
+
+    Parameters:
+        base_name (str): Basisname aus dem Build-Manifest (z. B. "mc_era5_true")
+        new_rows (pd.DataFrame): Neue Iterationen im Spaltenformat der MC-Ergebnis-CSV
+        manifest, dirs, state_path: wie bei run_build
+        root (str): Projektverzeichnis
+
+    Returns:
+        dict: n_existing, n_new, updated (Artefaktnamen), seconds
+    """
+    if base_name not in manifest:
+        raise ValueError(f"Unbekannter Datensatz: {base_name}")
+    spec = manifest[base_name]
+    start_time = time.perf_counter()
+
+    artifacts = {
+        a["kind"]: a for a in plan_artifacts(manifest, dirs, root, csv_bootstrap=[base_name])
+        if a["name"] == f"{a['kind']}:{base_name}"
+    }
+    mc_path = os.path.join(root, dirs["raw"], f"{base_name}.csv")
+    header = read_csv_header(mc_path)
+
+    missing = [column for column in header if column not in new_rows.columns]
+    if missing:
+        raise ValueError(f"Neue Iterationen ohne Spalten: {', '.join(missing)}")
+    if len(new_rows) == 0:
+        raise ValueError("Keine neuen Iterationen übergeben.")
+
+    n_existing = len(pd.read_csv(mc_path, usecols=[header[0]]))
+    new_rows = new_rows[header].reset_index(drop=True)
+    if "i" in header:
+        new_rows["i"] = range(n_existing, n_existing + len(new_rows))
+
+    lt, stats = artifacts["lt"], artifacts.get("stats")
+    bootstrap, scatter = artifacts.get("bootstrap"), artifacts.get("scatter")
+    has_lt = os.path.exists(lt["output"])
+    has_bootstrap = bootstrap is not None and os.path.isdir(bootstrap["output"])
+    has_scatter = has_bootstrap and scatter is not None and os.path.exists(scatter["output"])
+
+    # --- Prüfungen (noch keine Datei verändert) ---
+    if has_bootstrap:
+        existing = load_bootstrap_store(bootstrap["output"], mmap=False)
+        if existing.n_iterations != n_existing:
+            raise ValueError(
+                f"Bootstrap-Store enthält {existing.n_iterations} statt {n_existing} Iterationen; "
+                f"bitte mit scripts.build_artifacts --force neu bauen."
+            )
+    for artifact, column, present in ((lt, "Iteration", has_lt), (scatter, "iteration", has_scatter)):
+        if present and _max_iteration(artifact["output"], column) >= n_existing:
+            raise ValueError(
+                f"{artifact['name']} enthält bereits Iterationen ab {n_existing}; "
+                f"bitte mit scripts.build_artifacts --force neu bauen."
+            )
+
+    # --- Neue Teile vorbereiten (nur temporäre Dateien) ---
+    prepared = []  # (Art, temporärer Pfad, Ziel, Artefaktname)
+    try:
+        if has_bootstrap:
+            extra = build_bootstrap_store_from_texts(
+                new_rows["bootstrap_data"], new_rows["non_bootstrap_data"], wind_column=spec["wind_column"]
+            )
+            store = concat_bootstrap_stores(existing, extra)
+            tmp_dir = f"{bootstrap['output']}.tmp"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            prepared.append(("store", tmp_dir, bootstrap["output"], bootstrap["name"]))
+            save_bootstrap_store(store, tmp_dir)
+
+            if has_scatter:
+                metrics_df = pd.concat(
+                    [pd.read_csv(mc_path, usecols=SCATTER_METRICS), new_rows[SCATTER_METRICS]],
+                    ignore_index=True
+                )
+                part_path = f"{scatter['output']}.part"
+                prepared.append(("append", part_path, scatter["output"], scatter["name"]))
+                write_scatter_streaming(
+                    metrics_df, part_path,
+                    bootstrap_store=store,
+                    dataset_name=spec["label"],
+                    file_format="csv",
+                    start_iteration=n_existing
+                )
+
+        if stats is not None:
+            scalar_rows = new_rows.drop(columns=[c for c in MC_TEXT_COLUMNS if c in new_rows.columns])
+            dataset_stats = None
+            if os.path.exists(stats["output"]):
+                dataset_stats = DatasetStats.load(stats["output"])
+                if dataset_stats.n_iterations != n_existing:
+                    print(f"⚠️  Kennzahlen für {base_name} passen nicht zu den Rohdaten, werden neu berechnet.")
+                    dataset_stats = None
+                else:
+                    dataset_stats.update(scalar_rows)
+            if dataset_stats is None:
+                full = pd.read_csv(mc_path, usecols=lambda column: column not in MC_TEXT_COLUMNS)
+                dataset_stats = compute_dataset_stats(pd.concat([full, scalar_rows], ignore_index=True))
+            stats_part = f"{stats['output']}.part"
+            prepared.append(("replace", stats_part, stats["output"], stats["name"]))
+            dataset_stats.save(stats_part)
+
+        if has_lt:
+            lt_new = transform_energy_wind_data(new_rows)
+            lt_new["Iteration"] += n_existing
+            lt_part = f"{lt['output']}.part"
+            prepared.append(("append", lt_part, lt["output"], lt["name"]))
+            lt_new.to_csv(lt_part, index=False)
+
+        # Rohdaten zuletzt: ihre Zeilenzahl ist der Bezug aller Prüfungen
+        raw_part = f"{mc_path}.part"
+        prepared.append(("append", raw_part, mc_path, None))
+        new_rows.to_csv(raw_part, index=False)
+    except Exception:
+        for kind, tmp_path, _, _ in prepared:
+            if kind == "store":
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            elif os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+
+    # --- Übernehmen ---
+    updated = []
+    for kind, tmp_path, target, name in prepared:
+        if kind == "store":
+            _replace_store(tmp_path, target)
+        elif kind == "replace":
+            os.replace(tmp_path, target)
+        else:
+            _append_csv_file(tmp_path, target)
+        if name is not None:
+            updated.append(name)
+    print(f"{base_name}: {len(new_rows)} Iterationen an {n_existing} bestehende angehängt.")
+
+    # Kennzahlen auf den neuen Rohdatenstand beziehen (sonst greift die App auf den Scan zurück)
+    if stats is not None:
+        dataset_stats.source = source_metadata(mc_path)
+        dataset_stats.save(stats["output"])
+
+    mark_artifacts_current(manifest, dirs, state_path, updated, root, csv_bootstrap=[base_name])
+
+    seconds = time.perf_counter() - start_time
+    print(f"✅ {base_name}: {n_existing} -> {n_existing + len(new_rows)} Iterationen "
+          f"({', '.join(updated) or 'nur Rohdaten'}, {seconds:.2f} s)")
+    return {"n_existing": n_existing, "n_new": len(new_rows), "updated": updated, "seconds": seconds}
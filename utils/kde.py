@@ -0,0 +1,136 @@
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+
+KDE_GRID_SIZE = 128
+
+
+def silverman_bandwidth(values):
+    """Bandbreite nach Silverman (wie Plotly-Violinen): 1.059 * min(std, IQR/1.349) * n^(-1/5)."""
+    n = len(values)
+    if n < 2:
+        return 1.0
+    std = values.std(ddof=1)
+    q1, q3 = np.quantile(values, [0.25, 0.75])
+    spread = min(std, (q3 - q1) / 1.349) or std
+    bandwidth = 1.059 * spread * n ** (-1 / 5)
+    return bandwidth if bandwidth > 0 else 1.0
+
+
+def gaussian_kde_binned(values, grid_size=KDE_GRID_SIZE, bandwidth=None):
+    """
+    Gauß-Kerndichteschätzung über ein äquidistantes Gitter (Binning + Faltung, O(n + Gitter)).
+
+    Das Gitter reicht wie bei Plotly (spanmode="soft") von min - 2 * Bandbreite bis
+    max + 2 * Bandbreite.
+
+    Returns:
+        tuple[np.ndarray]: grid, density (Integral ≈ 1)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return np.array([]), np.array([])
+
+    bandwidth = silverman_bandwidth(values) if bandwidth is None else bandwidth
+    grid = np.linspace(values.min() - 2 * bandwidth, values.max() + 2 * bandwidth, grid_size)
+    step = grid[1] - grid[0]
+
+    # Lineares Binning auf die Gitterpunkte
+    position = (values - grid[0]) / step
+    lower = np.clip(np.floor(position).astype(np.int64), 0, grid_size - 2)
+    weight_upper = position - lower
+    counts = np.bincount(lower, weights=1 - weight_upper, minlength=grid_size)
+    counts += np.bincount(lower + 1, weights=weight_upper, minlength=grid_size)
+
+    # Faltung mit dem auf das Gitter abgetasteten Gauß-Kern (bis 4 Bandbreiten)
+    half_width = int(np.ceil(4 * bandwidth / step))
+    offsets = np.arange(-half_width, half_width + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    density = np.convolve(counts, kernel)[half_width:half_width + grid_size] / len(values)
+
+    return grid, density
+
+
+def violin_summary(values, points_max=0, seed=0, grid_size=KDE_GRID_SIZE):
+    """
+    Alles, was für Violine und Box nötig ist, ohne die Einzelwerte.
+
+    Returns:
+        dict: n, mean, min, max, q1, median, q3, lowerfence, upperfence (Whisker bei
+        1.5 IQR wie Plotly), grid, density, outliers (Werte außerhalb der Whisker) und
+        points (zufällige Stichprobe mit höchstens `points_max` Werten)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        raise ValueError("Keine Werte für die Violine.")
+
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    grid, density = gaussian_kde_binned(values, grid_size=grid_size)
+
+    rng = np.random.default_rng(seed)
+    n_points = min(points_max, len(values))
+    points = rng.choice(values, size=n_points, replace=False) if n_points else np.array([])
+
+    return {
+        "n": len(values),
+        "mean": float(values.mean()),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "q1": float(q1),
+        "median": float(median),
+        "q3": float(q3),
+        "lowerfence": float(inside.min()),
+        "upperfence": float(inside.max()),
+        "grid": grid,
+        "density": density,
+        "outliers": values[(values < inside.min()) | (values > inside.max())],
+        "points": points,
+    }
+
+
+class ViolinSummaries(Mapping):
+    """Violin-Zusammenfassungen (violin_summary) aller Metriken eines Datensatzes."""
+
+    def __init__(self, summaries, name=None):
+        self._summaries = dict(summaries)
+        self.name = name
+
+    def __getitem__(self, metric):
+        if metric not in self._summaries:
+            raise KeyError(f"Metrik '{metric}' nicht in den Violin-Zusammenfassungen ({self.name}).")
+        return self._summaries[metric]
+
+    def __iter__(self):
+        return iter(self._summaries)
+
+    def __len__(self):
+        return len(self._summaries)
+
+    def __repr__(self):
+        return f"ViolinSummaries(name={self.name!r}, metrics={list(self._summaries)})"
+
+    @property
+    def nbytes(self):
+        return sum(
+            s[key].nbytes for s in self._summaries.values() for key in ("grid", "density", "outliers", "points")
+        )
+
+
+def build_violin_summaries(df, metrics, points_max=0, name=None):
+    """Violin-Zusammenfassungen aller numerischen `metrics` eines Datensatzes."""
+    return ViolinSummaries({
+        metric: violin_summary(df[metric], points_max=points_max)
+        for metric in metrics
+        if metric in df.columns and pd.api.types.is_numeric_dtype(df[metric]) and df[metric].notna().any()
+    }, name=name)
+
+
+def load_violin_summaries(registry, label, metrics, points_max=0):
+    """Loader für eine Violin-Registry: Zusammenfassungen des geladenen Datensatzes `registry[label]`."""
+    return build_violin_summaries(registry[label], metrics, points_max=points_max, name=label)
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+
+class LTMetricTable:
+    """
+    LT-Kennzahlen einer Spalte (energy/wind) für mehrere Labels auf einem gemeinsamen Jahresraster.
+
+    `mean`, `cum_mean` und `cum_cv` sind (n_labels, n_years)-Arrays; Jahre ohne Werte eines
+    Labels sind NaN und werden bei `get` ausgelassen (wie bisher in compute_lt_metrics).
+    """
+
+    def __init__(self, column, labels, years, mean, cum_mean, cum_cv):
+        self.column = column
+        self.labels = list(labels)
+        self.years = years
+        self.mean = mean
+        self.cum_mean = cum_mean
+        self.cum_cv = cum_cv
+
+    @property
+    def nbytes(self):
+        return int(self.years.nbytes + self.mean.nbytes + self.cum_mean.nbytes + self.cum_cv.nbytes)
+
+    def __repr__(self):
+        return f"LTMetricTable(column={self.column!r}, labels={self.labels}, n_years={len(self.years)})"
+
+    def __contains__(self, label):
+        return label in self.labels
+
+    def get(self, label):
+        """
+        Kennzahlen eines Labels wie compute_lt_metrics.
+
+        Returns:
+            tuple[pd.Series]: years, non_cum_mean, cum_mean, cum_cv
+        """
+        if label not in self.labels:
+            raise KeyError(f"Label '{label}' nicht in den LT-Kennzahlen ({self.column}).")
+        row = self.labels.index(label)
+        has_values = ~np.isnan(self.mean[row])
+
+        return (
+            pd.Series(self.years[has_values], name="year"),
+            pd.Series(self.mean[row, has_values], name="mean_value"),
+            pd.Series(self.cum_mean[row, has_values], name="mean_value"),
+            pd.Series(self.cum_cv[row, has_values], name="mean_value"),
+        )
+
+
+def cumulative_mean_cv(values):
+    """
+    Kumulierter Mittelwert und CV (in %, std mit ddof=1) entlang der Jahre für alle Zeilen zugleich.
+
+    NaN-Einträge werden übersprungen (wie expanding() über die vorhandenen Jahre). Die Summen
+    laufen über die Abweichung vom ersten Wert je Zeile, damit sich s2 - s1²/n nicht auslöscht.
+
+    Parameters:
+        values (np.ndarray): (n_rows, n_years), z. B. Jahresmittel je Label
+
+    Returns:
+        tuple[np.ndarray]: cum_mean, cum_cv (gleiche Form, NaN an fehlenden Jahren)
+    """
+    valid = ~np.isnan(values)
+    first_valid = np.argmax(valid, axis=1)
+    shift = np.where(valid.any(axis=1), values[np.arange(len(values)), first_valid], 0.0)
+
+    centered = np.where(valid, values - shift[:, None], 0.0)
+    n = np.cumsum(valid, axis=1)
+    s1 = np.cumsum(centered, axis=1)
+    s2 = np.cumsum(centered ** 2, axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cum_mean = s1 / n + shift[:, None]
+        variance = np.where(n > 1, (s2 - s1 ** 2 / n) / (n - 1), np.nan)
+        cum_std = np.sqrt(np.maximum(variance, 0.0))
+        cum_cv = cum_std / cum_mean * 100
+
+    cum_mean[~valid] = np.nan
+    cum_cv[~valid] = np.nan
+    return cum_mean, cum_cv
+
+
+def compute_lt_metric_table(matrices, column="energy", labels=None):
+    """
+    Jahresmittel, kumulierter Mittelwert und kumulierter CV einer Spalte für alle Labels.
+
+    Die Jahresmittel kommen spaltenweise aus den Iteration×Jahr-Matrizen (nansum/Anzahl),
+    die kumulierten Größen über kumulierte Summen für alle Labels in einem Schritt.
+
+    Parameters:
+        matrices (Mapping): Label -> LTMatrix (z. B. LONGTERM_MATRICES)
+        column (str): "energy" oder "wind"
+        labels (list): Optional, Teilmenge der Labels (Standard: alle)
+
+    Returns:
+        LTMetricTable
+    """
+    loaded = {}
+    for label in (labels if labels is not None else list(matrices)):
+        try:
+            loaded[label] = matrices[label]
+        except (OSError, ValueError) as e:
+            print(f"⚠️  LT-Kennzahlen ohne '{label}': {e}")
+
+    years = np.unique(np.concatenate([np.asarray(m.years) for m in loaded.values()])) if loaded else np.array([])
+    means = np.full((len(loaded), len(years)), np.nan)
+
+    for row, matrix in enumerate(loaded.values()):
+        values = np.asarray(getattr(matrix, column))
+        counts = (~np.isnan(values)).sum(axis=0)
+        sums = np.nansum(values, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means[row, np.searchsorted(years, matrix.years)] = np.where(counts > 0, sums / counts, np.nan)
+
+    cum_mean, cum_cv = cumulative_mean_cv(means)
+    return LTMetricTable(column, list(loaded), years, means, cum_mean, cum_cv)
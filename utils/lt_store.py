@@ -0,0 +1,138 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import is_cache_valid, save_npy_atomic, source_metadata, write_atomic_json
+
+
+LT_MATRIX_FIELDS = ["iterations", "years", "energy", "wind", "slope", "intercept", "yearly_bias"]
+
+
+class LTMatrix:
+    """
+    Dichte Speicherform der LT-Daten: eine Zeile je Iteration, eine Spalte je Jahr.
+
+    `energy` und `wind` sind (n_iterations, n_years)-Arrays; Jahre, die eine Iteration
+    nicht abdeckt, sind NaN. `slope`, `intercept` und `yearly_bias` liegen als 1-D-Arrays
+    je Iteration vor (statt je Jahreszeile wiederholt wie in der Langtabelle).
+    """
+
+    def __init__(self, iterations, years, energy, wind, slope, intercept, yearly_bias):
+        self.iterations = iterations
+        self.years = years
+        self.energy = energy
+        self.wind = wind
+        self.slope = slope
+        self.intercept = intercept
+        self.yearly_bias = yearly_bias
+
+    @property
+    def n_iterations(self):
+        return len(self.iterations)
+
+    @property
+    def n_years(self):
+        return len(self.years)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, field).nbytes for field in LT_MATRIX_FIELDS)
+
+    def __repr__(self):
+        return f"LTMatrix(n_iterations={self.n_iterations}, n_years={self.n_years})"
+
+
+def lt_matrix_from_long(df):
+    """Überführt die LT-Langtabelle (Iteration, year, energy, wind, ...) in eine LTMatrix."""
+    iterations, row_index = np.unique(df["Iteration"].to_numpy(), return_inverse=True)
+    years = np.arange(1, int(df["year"].max()) + 1)
+    col_index = df["year"].to_numpy().astype(np.int64) - 1
+
+    energy = np.full((len(iterations), len(years)), np.nan)
+    wind = np.full((len(iterations), len(years)), np.nan)
+    energy[row_index, col_index] = df["energy"].to_numpy()
+    wind[row_index, col_index] = df["wind"].to_numpy()
+
+    # Parameter sind je Iteration konstant: erster Eintrag je Iteration genügt
+    first_rows = np.unique(row_index, return_index=True)[1]
+
+    return LTMatrix(
+        iterations=iterations,
+        years=years,
+        energy=energy,
+        wind=wind,
+        slope=df["slope"].to_numpy()[first_rows],
+        intercept=df["intercept"].to_numpy()[first_rows],
+        yearly_bias=df["yearly_bias"].to_numpy()[first_rows]
+    )
+
+
+def save_lt_matrix(matrix, directory):
+    os.makedirs(directory, exist_ok=True)
+    for field in LT_MATRIX_FIELDS:
+        save_npy_atomic(os.path.join(directory, f"{field}.npy"), np.asarray(getattr(matrix, field)))
+
+
+def load_lt_matrix(directory, mmap=True):
+    """Lädt eine gespeicherte LTMatrix; mit `mmap=True` werden die Arrays nur eingeblendet."""
+    mmap_mode = "r" if mmap else None
+    return LTMatrix(**{
+        field: np.load(os.path.join(directory, f"{field}.npy"), mmap_mode=mmap_mode)
+        for field in LT_MATRIX_FIELDS
+    })
+
+
+def load_lt_matrix_cached(csv_path, cache_dir):
+    """
+    Liefert die LTMatrix zu einer LT-CSV aus dem Cache (memory-mapped .npy).
+
+    Der Matrix-Store wird beim ersten Aufruf aus der Langtabelle erzeugt und bei
+    Änderungen der Quelldatei automatisch neu aufgebaut.
+    """
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    directory = os.path.join(cache_dir, f"{stem}-matrix")
+    meta_path = os.path.join(directory, "meta.json")
+
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if is_cache_valid(csv_path, meta):
+            return load_lt_matrix(directory)
+
+    matrix = lt_matrix_from_long(pd.read_csv(csv_path))
+
+    try:
+        save_lt_matrix(matrix, directory)
+        write_atomic_json(meta_path, source_metadata(csv_path))
+        return load_lt_matrix(directory)
+    except OSError as e:
+        print(f"LT-Matrix für {csv_path} konnte nicht gespeichert werden: {e}")
+        return matrix
+
+
+def lt_matrix_to_long(matrix, selected_years=None):
+    """
+    Flache Punkttabelle (Iteration, year, energy, wind, slope, intercept, yearly_bias)
+    für die gewählten Jahre – reine Array-Indizierung, Reihenfolge wie in der Langtabelle.
+    """
+    if selected_years is None:
+        year_index = np.arange(matrix.n_years)
+    else:
+        year_index = np.unique(np.asarray(selected_years, dtype=np.int64)) - 1
+        year_index = year_index[(year_index >= 0) & (year_index < matrix.n_years)]
+
+    energy = np.asarray(matrix.energy[:, year_index])
+    valid = ~np.isnan(energy)
+    row_index, col_index = np.nonzero(valid)
+
+    return pd.DataFrame({
+        "Iteration": np.asarray(matrix.iterations)[row_index],
+        "year": np.asarray(matrix.years)[year_index][col_index],
+        "energy": energy[valid],
+        "wind": np.asarray(matrix.wind[:, year_index])[valid],
+        "slope": np.asarray(matrix.slope)[row_index],
+        "intercept": np.asarray(matrix.intercept)[row_index],
+        "yearly_bias": np.asarray(matrix.yearly_bias)[row_index],
+    })
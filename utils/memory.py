@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+def deep_memory_mb(df):
+    return df.memory_usage(deep=True).sum() / 1e6
+
+
+def compact_dataframe(df, category_ratio=0.5):
+    """
+    Verkleinert die Datentypen eines DataFrames.
+
+    - float64 -> float32
+    - Ganzzahlen -> kleinster passender Typ (int8/int16/int32)
+    - Textspalten -> category (wenige eindeutige Werte) bzw. Arrow-Strings
+
+    Andere Objekte (z. B. LTMatrix) werden unverändert zurückgegeben.
+
+    Parameters:
+        df (pd.DataFrame): Eingelesener Datensatz
+        category_ratio (float): Max. Anteil eindeutiger Werte für category
+
+    Returns:
+        pd.DataFrame: Neuer DataFrame mit kompakten Datentypen
+    """
+    if not isinstance(df, pd.DataFrame):
+        return df
+
+    compact = {}
+    for column in df.columns:
+        series = df[column]
+
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+            compact[column] = series
+        elif pd.api.types.is_float_dtype(series):
+            compact[column] = series.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(series):
+            compact[column] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_string_dtype(series) or series.dtype == object:
+            if series.nunique(dropna=False) <= max(1, len(series) * category_ratio):
+                compact[column] = series.astype("category")
+            elif HAS_PYARROW:
+                compact[column] = series.astype(pd.ArrowDtype(pa.string()))
+            else:
+                compact[column] = series
+        else:
+            compact[column] = series
+
+    return pd.DataFrame(compact, index=df.index)
+
+
+def memory_report(registries, compact=True):
+    """
+    Speicherbedarf je Label vor und nach compact_dataframe.
+
+    Parameters:
+        registries (dict): Name -> Mapping Label -> Datensatz (z. B. DATAFRAMES)
+        compact (bool): Zusätzlich den kompakten Speicherbedarf berechnen
+
+    Returns:
+        pd.DataFrame: Spalten registry, label, rows, before_mb, after_mb, ratio
+    """
+    rows = []
+
+    for name, registry in registries.items():
+        for label in registry:
+            try:
+                data = registry[label]
+            except (OSError, ValueError) as e:
+                print(f"{name}[{label}] übersprungen: {e}")
+                continue
+
+            if not isinstance(data, pd.DataFrame):
+                continue
+
+            before = deep_memory_mb(data)
+            after = deep_memory_mb(compact_dataframe(data)) if compact else np.nan
+            rows.append({
+                "registry": name,
+                "label": label,
+                "rows": len(data),
+                "before_mb": before,
+                "after_mb": after,
+                "ratio": before / after if compact and after else np.nan
+            })
+
+    return pd.DataFrame(rows, columns=["registry", "label", "rows", "before_mb", "after_mb", "ratio"])
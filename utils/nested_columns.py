@@ -0,0 +1,135 @@
+import csv
+import io
+import json
+import os
+import threading
+
+import numpy as np
+
+from utils.cache import is_cache_valid, read_csv_cached, source_metadata, write_atomic_json
+
+
+def read_csv_header(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f))
+
+
+def scalar_columns(path, nested_columns):
+    """Alle Spalten einer CSV außer den verschachtelten Textspalten (für usecols)."""
+    return [column for column in read_csv_header(path) if column not in nested_columns]
+
+
+def read_csv_without_nested(path, cache_dir, nested_columns, **read_kwargs):
+    """Liest nur die skalaren Spalten einer MC-Ergebnisdatei (über den Feather-Cache)."""
+    return read_csv_cached(
+        path, cache_dir,
+        usecols=scalar_columns(path, nested_columns),
+        **read_kwargs
+    )
+
+
+def build_row_offsets(path):
+    """
+    Berechnet die Byte-Offsets aller Datenzeilen einer CSV-Datei.
+
+    Zeilenumbrüche innerhalb von Anführungszeichen (mehrzeilige Felder wie
+    `bootstrap_data`) werden über die Parität der Anführungszeichen erkannt.
+
+    Returns:
+        np.ndarray: int64-Array der Länge n_rows + 1; Zeile i liegt in
+        [offsets[i], offsets[i + 1]).
+    """
+    buf = np.fromfile(path, dtype=np.uint8)
+    inside_quotes = (np.cumsum(buf == ord('"')) % 2).astype(bool)
+    line_ends = np.flatnonzero((buf == ord("\n")) & ~inside_quotes)
+
+    starts = line_ends + 1
+    starts = starts[starts < len(buf)]
+    return np.append(starts, len(buf)).astype(np.int64)
+
+
+class NestedColumnStore:
+    """
+    Zugriff auf die schweren Textspalten einer MC-Ergebnisdatei direkt von der Platte.
+
+    Statt die Spalten für alle Iterationen im Speicher zu halten, wird einmalig ein
+    Byte-Offset-Index je Zeile erstellt (im Cache-Verzeichnis als .npy abgelegt).
+    Einzelne Iterationen werden anschließend per Seek gelesen.
+
+    Parameters:
+        path (str): Pfad zur MC-Ergebnis-CSV
+        cache_dir (str): Verzeichnis für den Offset-Index
+    """
+
+    def __init__(self, path, cache_dir):
+        self.path = path
+        self.cache_dir = cache_dir
+        self._header = None
+        self._offsets = None
+        self._signature = None
+        self._lock = threading.Lock()
+
+    def _index_paths(self):
+        stem = os.path.splitext(os.path.basename(self.path))[0]
+        base = os.path.join(self.cache_dir, f"{stem}-rows")
+        return f"{base}.npy", f"{base}.meta.json"
+
+    def _load_offsets(self):
+        index_path, meta_path = self._index_paths()
+
+        if os.path.exists(index_path) and os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if is_cache_valid(self.path, meta):
+                return np.load(index_path, mmap_mode="r")
+
+        offsets = build_row_offsets(self.path)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.save(index_path, offsets)
+            write_atomic_json(meta_path, source_metadata(self.path))
+        except OSError as e:
+            print(f"Offset-Index für {self.path} konnte nicht geschrieben werden: {e}")
+
+        return offsets
+
+    @property
+    def header(self):
+        if self._header is None:
+            self._header = read_csv_header(self.path)
+        return self._header
+
+    @property
+    def offsets(self):
+        with self._lock:
+            # Nach Anhängen neuer Iterationen (Größe/mtime geändert) Index neu laden
+            stat = os.stat(self.path)
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self._offsets is None or signature != self._signature:
+                self._offsets = self._load_offsets()
+                self._signature = signature
+            return self._offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get_row(self, row):
+        """Liest eine komplette Zeile (alle Spalten als Strings) als dict."""
+        offsets = self.offsets
+        if not 0 <= row < len(offsets) - 1:
+            raise IndexError(f"Zeile {row} außerhalb des Bereichs (0..{len(offsets) - 2}).")
+
+        start, end = int(offsets[row]), int(offsets[row + 1])
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            raw = f.read(end - start).decode("utf-8")
+
+        values = next(csv.reader(io.StringIO(raw, newline="")))
+        return dict(zip(self.header, values))
+
+    def get(self, row, column):
+        """Liest den Rohtext einer Spalte für eine einzelne Zeile/Iteration."""
+        if column not in self.header:
+            raise ValueError(f"Spalte '{column}' nicht in {self.path} gefunden.")
+        return self.get_row(row)[column]
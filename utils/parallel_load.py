@@ -0,0 +1,84 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+def _warm_cache(loader):
+    # Läuft im Kindprozess: baut nur die Cache-Dateien auf, gibt keine Daten zurück
+    loader()
+    return None
+
+
+def _load_task(name, registry, label):
+    start = time.perf_counter()
+    try:
+        registry[label]
+        error = None
+    except (OSError, ValueError) as e:
+        error = str(e)
+    return {
+        "registry": name,
+        "label": label,
+        "seconds": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def preload_registries(registries, max_workers=None, process_workers=0):
+    """
+    Lädt alle Labels mehrerer Registries parallel.
+
+    Die Dateien sind voneinander unabhängig; das Lesen (Feather/Arrow bzw. CSV-Parser)
+    gibt den GIL größtenteils frei und läuft daher in einem Thread-Pool. Optional wird
+    vorher ein Prozess-Pool genutzt, der nur die Cache-Dateien der CSV-lastigen Loader
+    aufbaut; die Threads lesen danach direkt aus dem Cache.
+
+    Parameters:
+        registries (dict): Name -> DatasetRegistry
+        max_workers (int): Threads (None = min(32, CPU-Anzahl + 4))
+        process_workers (int): Prozesse für den Cache-Aufbau (0 = aus)
+
+    Returns:
+        list[dict]: Je Label registry, label, seconds, error (None bei Erfolg)
+    """
+    tasks = [
+        (name, registry, label)
+        for name, registry in registries.items()
+        for label in registry
+        if not registry.is_loaded(label)
+    ]
+
+    if process_workers:
+        try:
+            with ProcessPoolExecutor(max_workers=process_workers) as pool:
+                futures = [pool.submit(_warm_cache, registry.loader(label)) for _, registry, label in tasks]
+                for future in futures:
+                    try:
+                        future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception:
+                        pass  # Fehler werden beim Laden im Thread-Pool erneut erfasst
+        except Exception as e:
+            # z. B. BrokenProcessPool oder nicht picklebarer Loader: Cache-Aufbau übernimmt der Thread-Pool
+            print(f"⚠️  Prozess-Pool für den Cache-Aufbau fehlgeschlagen ({type(e).__name__}: {e}), lade nur mit Threads.")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_load_task, *task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+def format_load_report(timings, wall_seconds=None):
+    """Tabelle der Ladezeiten je Datei, langsamste zuerst."""
+    lines = [f"{'Registry':<22} {'Label':<20} {'Zeit (s)':>9}  Status"]
+    for t in sorted(timings, key=lambda t: t["seconds"], reverse=True):
+        status = "ok" if t["error"] is None else f"Fehler: {t['error']}"
+        lines.append(f"{t['registry']:<22} {t['label']:<20} {t['seconds']:>9.3f}  {status}")
+
+    total = sum(t["seconds"] for t in timings)
+    summary = f"Summe der Einzelzeiten: {total:.3f} s"
+    if wall_seconds is not None:
+        summary += f", Wall-Zeit: {wall_seconds:.3f} s (CPUs verfügbar: {os.cpu_count()})"
+    lines.append(summary)
+    return "\n".join(lines)
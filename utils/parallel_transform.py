@@ -0,0 +1,230 @@
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from utils.bootstrap_store import load_bootstrap_store
+from utils.transform_lt import transform_energy_wind_data
+from utils.transform_por import write_scatter_streaming
+
+try:
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+# Spalten, die die LT-Transformation braucht (nur diese werden an die Prozesse übergeben)
+LT_INPUT_COLUMNS = ["yearly_gross_energy", "yearly_wind_speeds", "slope", "intercept", "yearly_bias"]
+SCATTER_INPUT_COLUMNS = ["slope", "intercept", "mse", "r2", "yearly_bias"]
+
+
+def _timed_call(func, args, kwargs):
+    # Läuft im Kindprozess (bzw. direkt bei jobs=1)
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run_tasks(tasks, jobs=1):
+    """
+    Führt unabhängige Aufgaben in einem Prozess-Pool aus.
+
+    Die Ergebnisse stehen unabhängig von der Fertigstellungsreihenfolge immer in der
+    Reihenfolge der Aufgabenliste; bei `jobs=1` läuft alles im aktuellen Prozess. Jeder
+    Fehler einer Aufgabe (auch ein abgestürzter Prozess) landet in deren `error`, die
+    übrigen Aufgaben laufen weiter.
+
+    Parameters:
+        tasks (list[dict]): name, func (auf Modulebene, picklebar), args, kwargs, optional group
+        jobs (int): Anzahl Prozesse
+
+    Returns:
+        list[dict]: Je Aufgabe name, group, seconds, result, error (None bei Erfolg)
+    """
+    def entry(task, result=None, seconds=0.0, error=None):
+        return {
+            "name": task["name"],
+            "group": task.get("group", task["name"]),
+            "seconds": seconds,
+            "result": result,
+            "error": error,
+        }
+
+    results = []
+
+    if jobs <= 1:
+        for task in tasks:
+            try:
+                result, seconds = _timed_call(task["func"], task.get("args", ()), task.get("kwargs", {}))
+                results.append(entry(task, result, seconds))
+            except Exception as e:
+                results.append(entry(task, error=f"{type(e).__name__}: {e}"))
+        return results
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(_timed_call, task["func"], task.get("args", ()), task.get("kwargs", {}))
+            for task in tasks
+        ]
+        for task, future in zip(tasks, futures):
+            try:
+                result, seconds = future.result()
+                results.append(entry(task, result, seconds))
+            except Exception as e:
+                results.append(entry(task, error=f"{type(e).__name__}: {e}"))
+
+    return results
+
+
+def format_task_report(results, wall_seconds=None, jobs=1):
+    """Tabelle der Laufzeiten je Aufgabe (in Aufgabenreihenfolge) plus Summe und Wall-Zeit."""
+    lines = [f"{'Aufgabe':<40} {'Zeit (s)':>9}  Status"]
+    for r in results:
+        status = "ok" if r["error"] is None else f"Fehler: {r['error']}"
+        lines.append(f"{r['name'][:40]:<40} {r['seconds']:>9.2f}  {status}")
+
+    total = sum(r["seconds"] for r in results)
+    summary = f"Summe der Einzelzeiten: {total:.2f} s"
+    if wall_seconds is not None:
+        summary += f", Wall-Zeit: {wall_seconds:.2f} s ({jobs} Prozesse, CPUs verfügbar: {os.cpu_count()})"
+    lines.append(summary)
+    return "\n".join(lines)
+
+
+def split_ranges(n_iterations, jobs, min_iterations=5000):
+    """
+    Teilt [0, n_iterations) in höchstens `jobs` zusammenhängende Bereiche.
+
+    Kleine Datensätze (< 2 * min_iterations) bleiben ein einziger Bereich, da sich der
+    Prozess-Overhead dort nicht lohnt.
+    """
+    n_parts = max(1, min(jobs, n_iterations // max(min_iterations, 1)))
+    bounds = [round(k * n_iterations / n_parts) for k in range(n_parts + 1)]
+    return [(bounds[k], bounds[k + 1]) for k in range(n_parts)]
+
+
+# --- LT-Transformation ---
+def _lt_range(df_part, start):
+    df_transformed = transform_energy_wind_data(df_part)
+    df_transformed["Iteration"] += start
+    return df_transformed
+
+
+def lt_tasks(name, df, jobs, min_iterations=5000):
+    """Aufgaben für transform_energy_wind_data, je Iterationsbereich eine."""
+    df = df[LT_INPUT_COLUMNS]
+    return [
+        {
+            "name": f"{name} [{start}:{stop}]",
+            "group": name,
+            "func": _lt_range,
+            "args": (df.iloc[start:stop].reset_index(drop=True), start),
+        }
+        for start, stop in split_ranges(len(df), jobs, min_iterations)
+    ]
+
+
+def merge_lt_results(results):
+    """Fügt die Teilergebnisse je Gruppe in Aufgabenreihenfolge zusammen."""
+    merged = {}
+    for r in results:
+        if r["error"] is None:
+            merged.setdefault(r["group"], []).append(r["result"])
+    return {group: pd.concat(parts, ignore_index=True) for group, parts in merged.items()}
+
+
+# --- Scatter-Daten ---
+def _scatter_range(df, output_path, start, stop, dataset_name, chunk_size,
+                   store_dir=None, bootstrap_part=None, non_bootstrap_part=None):
+    return write_scatter_streaming(
+        df, output_path,
+        bootstrap_store=load_bootstrap_store(store_dir) if store_dir else None,
+        bootstrap_list=bootstrap_part,
+        non_bootstrap_list=non_bootstrap_part,
+        dataset_name=dataset_name,
+        chunk_size=chunk_size,
+        start_iteration=start,
+        stop_iteration=stop
+    )
+
+
+def scatter_tasks(name, df, output_path, jobs, store_dir=None,
+                  bootstrap_data=None, non_bootstrap_data=None,
+                  chunk_size=500, min_iterations=5000):
+    """
+    Aufgaben für write_scatter_streaming, je Iterationsbereich eine Teildatei
+    (`<output_path>.part<k>`); zusammengeführt mit merge_part_files.
+
+    Mit `store_dir` lädt jeder Prozess den memory-mapped BootstrapStore selbst, sonst
+    erhält er nur die Pickle-Einträge seines Bereichs.
+    """
+    df = df[SCATTER_INPUT_COLUMNS]
+    tasks = []
+
+    for k, (start, stop) in enumerate(split_ranges(len(df), jobs, min_iterations)):
+        kwargs = {"chunk_size": chunk_size, "store_dir": store_dir}
+        if store_dir is None:
+            kwargs["bootstrap_part"] = {i: bootstrap_data[i] for i in range(start, stop)}
+            kwargs["non_bootstrap_part"] = {i: non_bootstrap_data[i] for i in range(start, stop)}
+
+        tasks.append({
+            "name": f"{name} [{start}:{stop}]",
+            "group": output_path,
+            "func": _scatter_range,
+            "args": (df, f"{output_path}.part{k}", start, stop, name),
+            "kwargs": kwargs,
+        })
+    return tasks
+
+
+def merge_part_files(output_path, n_parts, file_format=None):
+    """
+    Hängt die Teildateien `<output_path>.part0..n` in dieser Reihenfolge aneinander
+    (CSV: Kopfzeile nur aus der ersten Datei, Parquet: Row Groups) und löscht sie.
+    """
+    file_format = file_format or ("parquet" if output_path.endswith(".parquet") else "csv")
+    parts = [f"{output_path}.part{k}" for k in range(n_parts)]
+    missing = [part for part in parts if not os.path.exists(part)]
+    if missing:
+        raise ValueError(f"Teildateien fehlen: {', '.join(missing)}")
+
+    tmp_path = f"{output_path}.tmp"
+
+    if file_format == "csv":
+        with open(tmp_path, "wb") as out:
+            for k, part in enumerate(parts):
+                with open(part, "rb") as f:
+                    header = f.readline()
+                    if k == 0:
+                        out.write(header)
+                    shutil.copyfileobj(f, out)
+    else:
+        if not HAS_PYARROW:
+            raise ValueError("Für Parquet-Ausgabe wird pyarrow benötigt.")
+        writer = None
+        try:
+            for part in parts:
+                part_file = pq.ParquetFile(part)
+                for i in range(part_file.num_row_groups):
+                    table = part_file.read_row_group(i)
+                    if writer is None:
+                        writer = pq.ParquetWriter(tmp_path, table.schema)
+                    writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    os.replace(tmp_path, output_path)
+    for part in parts:
+        os.remove(part)
+
+
+def remove_part_files(output_path, n_parts):
+    """Löscht die (ggf. unvollständigen) Teildateien `<output_path>.part0..n` einer fehlgeschlagenen Gruppe."""
+    for k in range(n_parts):
+        part = f"{output_path}.part{k}"
+        if os.path.exists(part):
+            os.remove(part)
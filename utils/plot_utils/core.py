@@ -2,11 +2,19 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from data.config import COLOR_MAP, METRIC_INFO
-from utils.plot_utils.shared import apply_dark_mode_colors
+from data.config import AEP_HISTOGRAM_BINS, COLOR_MAP, DENSITY_BINS, METRIC_INFO
+from utils.plot_utils.density import add_density_note, density_colorbar, density_grid, density_heatmap
+from utils.plot_utils.shared import (
+    add_summary_violin,
+    apply_dark_mode_colors,
+    get_column_bounds,
+    histogram_bar,
+    scatter_trace,
+    shared_bin_edges
+)
 
 
-def plot_aep_comparison(stats, dataframes):
+def plot_aep_comparison(stats, dataframes, violins=None, density_threshold=None):
     fig = make_subplots(
         rows=2, cols=3,
         specs=[
@@ -51,6 +59,38 @@ def plot_aep_comparison(stats, dataframes):
     )
 
     for label in stats["labels"]:
+        if violins is not None:
+            # Vorberechnete Quartile/Whisker; Ausreißer als eigene Punkte
+            summary = violins[label]["aep_final"]
+            fig.add_trace(
+                go.Box(
+                    x=[label],
+                    q1=[summary["q1"]],
+                    median=[summary["median"]],
+                    q3=[summary["q3"]],
+                    lowerfence=[summary["lowerfence"]],
+                    upperfence=[summary["upperfence"]],
+                    mean=[summary["mean"]],
+                    name=label,
+                    line=dict(width=0.5),
+                    marker_color=COLOR_MAP.get(label, "grey"),
+                    boxmean=True
+                ),
+                row=1, col=3
+            )
+            fig.add_trace(
+                scatter_trace(
+                    x=[label] * len(summary["outliers"]),
+                    y=summary["outliers"],
+                    mode="markers",
+                    marker=dict(color=COLOR_MAP.get(label, "grey"), symbol="x", size=6),
+                    name=label,
+                    showlegend=False
+                ),
+                row=1, col=3
+            )
+            continue
+
         fig.add_trace(
             go.Box(
                 y=dataframes[label]["aep_final"],
@@ -68,32 +108,62 @@ def plot_aep_comparison(stats, dataframes):
             row=1, col=3
         )
 
-    jittered_x = []
-    jittered_y = []
-    jittered_labels = []
+    n_points = sum(len(dataframes[label]) for label in stats["labels"])
+    if density_threshold and n_points > density_threshold:
+        # Oberhalb der Schwelle: je Analyse eine Spalte mit der Anzahl je AEP-Klasse
+        # (gemeinsame Klassen, Aufwand unabhängig von der Iterationszahl)
+        edges = shared_bin_edges("aep_final", *(dataframes[label] for label in stats["labels"]), bins=DENSITY_BINS)
+        counts = np.column_stack([
+            np.histogram(dataframes[label]["aep_final"], bins=edges)[0] for label in stats["labels"]
+        ])
+        fig.add_trace(
+            density_heatmap(
+                np.arange(len(stats["labels"])),
+                (edges[:-1] + edges[1:]) / 2,
+                counts,
+                text=[list(stats["labels"])] * len(counts),
+                xgap=20,
+                hovertemplate="%{text}<br>AEP: %{y:.2f} GWh/yr<br>Anzahl: %{customdata:,.0f}<extra></extra>",
+                showlegend=False
+            ),
+            row=2, col=1
+        )
+        add_density_note(fig, n_points, row=2, col=1)
+    else:
+        jittered_x = []
+        jittered_y = []
+        jittered_labels = []
 
-    for i, label in enumerate(stats["labels"]):
-        x_jitter = np.random.normal(loc=i, scale=0.1, size=len(dataframes[label]))
-        jittered_x.extend(x_jitter)
-        jittered_y.extend(dataframes[label]["aep_final"])
-        jittered_labels.extend([label] * len(dataframes[label]))
+        for i, label in enumerate(stats["labels"]):
+            x_jitter = np.random.normal(loc=i, scale=0.1, size=len(dataframes[label]))
+            jittered_x.extend(x_jitter)
+            jittered_y.extend(dataframes[label]["aep_final"])
+            jittered_labels.extend([label] * len(dataframes[label]))
 
-    fig.add_trace(
-        go.Scatter(
-            x=jittered_x,
-            y=jittered_y,
-            mode="markers",
-            showlegend=False,
-            marker=dict(
-                color=[COLOR_MAP.get(l, "gray") for l in jittered_labels],
-                size=4,
-                opacity=0.5
+        fig.add_trace(
+            scatter_trace(
+                x=jittered_x,
+                y=jittered_y,
+                mode="markers",
+                showlegend=False,
+                marker=dict(
+                    color=[COLOR_MAP.get(l, "gray") for l in jittered_labels],
+                    size=4,
+                    opacity=0.5
+                )
+            ),
+            row=2, col=1
+        )
+
+    for i, label in enumerate(stats["labels"]):
+        if violins is not None:
+            summary = violins[label]["aep_final"]
+            add_summary_violin(
+                fig, summary, i, COLOR_MAP.get(label, "gray"), label,
+                show_box=True, points=summary["outliers"], opacity=0.5, row=2, col=3
             )
-        ),
-        row=2, col=1
-    )
+            continue
 
-    for label in stats["labels"]:
         fig.add_trace(
             go.Violin(
                 y=dataframes[label]["aep_final"],
@@ -142,7 +212,14 @@ def plot_aep_comparison(stats, dataframes):
     return fig
 
 
-def plot_core_aep_iteration_analysis(filtered_dfs, metric="aep_final"):
+def plot_core_aep_iteration_analysis(filtered_dfs, metric="aep_final", catalogs=None, density_threshold=None):
+    # Gemeinsame Klassengrenzen aller gewählten Analysen (aus den Kennzahl-Katalogen, falls übergeben)
+    if catalogs is not None:
+        bounds_sources = [catalogs[label] for label in filtered_dfs]
+    else:
+        bounds_sources = list(filtered_dfs.values())
+    edges = shared_bin_edges(metric, *bounds_sources, bins=AEP_HISTOGRAM_BINS) if bounds_sources else None
+
     fig = make_subplots(
         rows=2, cols=2,
         specs=[[{}, {}], [{"colspan": 2}, None]],
@@ -150,41 +227,46 @@ def plot_core_aep_iteration_analysis(filtered_dfs, metric="aep_final"):
         row_heights=[0.5, 0.5]
     )
 
+    # Oberhalb der Schwelle: IAV-Scatter aller gewählten Analysen als gemeinsame Dichte-Heatmap
+    n_points = sum(len(df) for df in filtered_dfs.values())
+    use_density = bool(density_threshold) and n_points > density_threshold
+
     for label, df in filtered_dfs.items():
         fig.add_trace(
-            go.Histogram(
-                x=df[metric],
+            histogram_bar(
+                df[metric],
+                edges,
                 name=label,
                 marker=dict(color=COLOR_MAP.get(label, "white")),
                 opacity=0.6,
-                nbinsx=100,
                 showlegend=False
             ),
             row=1, col=1
         )
 
-        fig.add_trace(
-            go.Scatter(
-                x=df["iav_nsim"],
-                y=df[metric],
-                name=label,
-                mode="markers",
-                showlegend=False,
-                marker=dict(
-                    color="rgba(0,0,0,0)",
-                    size=6,
-                    opacity=0.6,
-                    line=dict(
-                        color=COLOR_MAP.get(label, "white"),
-                        width=1.5
+        if not use_density:
+            fig.add_trace(
+                scatter_trace(
+                    x=df["iav_nsim"],
+                    y=df[metric],
+                    name=label,
+                    mode="markers",
+                    showlegend=False,
+                    marker=dict(
+                        color="rgba(0,0,0,0)",
+                        size=6,
+                        opacity=0.6,
+                        line=dict(
+                            color=COLOR_MAP.get(label, "white"),
+                            width=1.5
+                        )
                     )
-                )
-            ),
-            row=1, col=2
-        )
+                ),
+                row=1, col=2
+            )
 
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=df["i"],
                 y=df[metric],
                 name=label,
@@ -199,7 +281,7 @@ def plot_core_aep_iteration_analysis(filtered_dfs, metric="aep_final"):
         rolling = df[metric].rolling(window=50, center=True).mean()
 
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=df["i"],
                 y=rolling,
                 name=label,
@@ -210,6 +292,29 @@ def plot_core_aep_iteration_analysis(filtered_dfs, metric="aep_final"):
             row=2, col=1
         )
 
+    if use_density:
+        x_range = get_column_bounds("iav_nsim", *bounds_sources)
+        y_range = get_column_bounds(metric, *bounds_sources)
+        x_centers, y_centers, counts = density_grid(
+            np.concatenate([df["iav_nsim"].to_numpy(dtype=np.float64) for df in filtered_dfs.values()]),
+            np.concatenate([df[metric].to_numpy(dtype=np.float64) for df in filtered_dfs.values()]),
+            x_range, y_range, bins=DENSITY_BINS
+        )
+        fig.add_trace(
+            density_heatmap(
+                x_centers, y_centers, counts,
+                colorbar=density_colorbar(counts.max(), y=0.78, len=0.45),
+                hovertemplate=(
+                    "IAV-Faktor: %{x:.3f}<br>"
+                    f"{METRIC_INFO[metric]['metric_en']}: %{{y:.2f}}<br>"
+                    "Anzahl: %{customdata:,.0f}<extra></extra>"
+                ),
+                showlegend=False
+            ),
+            row=1, col=2
+        )
+        add_density_note(fig, n_points, row=1, col=2)
+
     fig.update_layout(
         height=750,
         title=dict(
@@ -1,5 +1,5 @@
 import plotly.graph_objects as go
-from utils.plot_utils.shared import apply_dark_mode_colors
+from utils.plot_utils.shared import apply_dark_mode_colors, scatter_trace
 from data.config import COLOR_MAP
 
 
@@ -7,22 +7,24 @@ def plot_reanalysis_timeseries(era5_ts, merra2_ts):
     fig = go.Figure()
 
     fig.add_trace(
-        go.Scatter(
+        scatter_trace(
             x=era5_ts["Date"],
             y=era5_ts["norm"],
             name="ERA5",
             mode="lines",
-            line=dict(width=1.5, color=COLOR_MAP["ERA5"])
+            line=dict(width=1.5, color=COLOR_MAP["ERA5"]),
+            webgl_threshold=0
         )
     )
 
     fig.add_trace(
-        go.Scatter(
+        scatter_trace(
             x=merra2_ts["Date"],
             y=merra2_ts["norm"],
             name="MERRA2",
             mode="lines",
-            line=dict(width=1.5, color=COLOR_MAP["MERRA2"])
+            line=dict(width=1.5, color=COLOR_MAP["MERRA2"]),
+            webgl_threshold=0
         )
     )
 
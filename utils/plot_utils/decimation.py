@@ -0,0 +1,155 @@
+import re
+
+import numpy as np
+
+
+# Raster, auf dem die Stichprobe geschichtet wird (Zellen je Achse)
+DECIMATION_GRID = 64
+
+# Geteilte y-Achsen der zweispaltigen Scatterplots (yaxis2 folgt yaxis)
+SHARED_Y_AXES = {"yaxis2": "yaxis"}
+
+RELAYOUT_RANGE_PATTERN = re.compile(r"^([xy]axis\d*)\.(range\[[01]\]|range|autorange)$")
+
+
+def decimate_indices(x, y, budget, x_range=None, y_range=None, grid=DECIMATION_GRID, seed=0):
+    """
+    Geschichtete Stichprobe eines Scatterplots mit höchstens `budget` Punkten.
+
+    Die Punkte im Ausschnitt (`x_range`/`y_range`) werden auf ein grid×grid-Raster verteilt.
+    Reicht das Budget für alle belegten Zellen, behält jede Zelle einen Punkt und der Rest
+    des Budgets wird nach größten Resten proportional zur Belegung verteilt; dichte Bereiche
+    werden so ausgedünnt, Ausreißer und Ränder bleiben sichtbar. Gibt es mehr belegte Zellen
+    als Budget, werden die Zellen proportional zu ihrer Belegung gezogen (je ein Punkt).
+    Die Auswahl ist deterministisch (`seed`), damit sich die Punkte beim erneuten Zeichnen
+    nicht ändern.
+
+    Parameters:
+        x, y (array-like): Koordinaten aller Punkte
+        budget (int): Punktbudget; None oder 0 = keine Ausdünnung
+        x_range, y_range (tuple): Optional, sichtbarer Ausschnitt (Zoom)
+
+    Returns:
+        tuple: (Indizes der gezeigten Punkte aufsteigend, Anzahl Punkte im Ausschnitt)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    inside = np.ones(len(x), dtype=bool)
+    for values, window in ((x, x_range), (y, y_range)):
+        if window is not None:
+            low, high = sorted(window)
+            inside &= (values >= low) & (values <= high)
+
+    idx = np.flatnonzero(inside)
+    total = len(idx)
+    if not budget or total <= budget:
+        return idx, total
+
+    # Rasterzelle je Punkt (NaN landen gemeinsam in Zelle 0)
+    cells = np.zeros(total, dtype=np.int64)
+    for values in (x[idx], y[idx]):
+        finite = np.isfinite(values)
+        low, high = (values[finite].min(), values[finite].max()) if finite.any() else (0.0, 0.0)
+        scaled = (values - low) / (high - low) * grid if high > low else np.zeros(total)
+        cells = cells * grid + np.clip(np.nan_to_num(scaled).astype(np.int64), 0, grid - 1)
+
+    counts = np.bincount(cells)
+    occupied = np.flatnonzero(counts)
+    rng = np.random.default_rng(seed)
+    quota = np.zeros(len(counts), dtype=np.int64)
+
+    if len(occupied) > budget:
+        chosen = rng.choice(occupied, size=budget, replace=False, p=counts[occupied] / total)
+        quota[chosen] = 1
+    else:
+        # Ein Punkt je Zelle, der Rest nach größten Resten (Summe der Quoten = budget)
+        extra = counts[occupied] - 1
+        rest = budget - len(occupied)
+        share = extra * rest / extra.sum() if extra.sum() else np.zeros(len(occupied))
+        base = np.floor(share).astype(np.int64)
+        remainders = np.argsort(-(share - base), kind="stable")[:rest - int(base.sum())]
+        base[remainders] += 1
+        quota[occupied] = 1 + base
+
+    # Zufällige Rangfolge innerhalb jeder Zelle; behalten wird, was unter der Quote liegt
+    order = np.lexsort((rng.random(total), cells))
+    sorted_cells = cells[order]
+    rank = np.arange(total) - np.searchsorted(sorted_cells, sorted_cells, side="left")
+    keep = order[rank < quota[sorted_cells]][:budget]
+
+    return np.sort(idx[keep]), total
+
+
+def relayout_view_ranges(relayout_data, previous=None, aliases=SHARED_Y_AXES):
+    """
+    Führt ein relayoutData-Ereignis mit dem bisherigen Zoom-Zustand zusammen.
+
+    Achsen in `aliases` (z. B. yaxis2 -> yaxis) werden unter dem Namen der führenden Achse
+    gespeichert. "autorange" (Doppelklick) entfernt den Ausschnitt einer Achse wieder.
+
+    Returns:
+        dict: Achse -> [min, max]; None, wenn das Ereignis keine Achsenbereiche betrifft
+    """
+    ranges = dict(previous or {})
+    changed = False
+
+    for key, value in (relayout_data or {}).items():
+        match = RELAYOUT_RANGE_PATTERN.match(key)
+        if match is None:
+            continue
+        axis, part = match.groups()
+        axis = aliases.get(axis, axis)
+        changed = True
+
+        if part == "autorange":
+            ranges.pop(axis, None)
+        elif part == "range":
+            ranges[axis] = [value[0], value[1]]
+        else:
+            current = list(ranges.get(axis, [None, None]))
+            current[int(part[-2])] = value
+            ranges[axis] = current
+
+    return ranges if changed else None
+
+
+def panel_window(view_ranges, col, aliases=SHARED_Y_AXES):
+    """Sichtbarer Ausschnitt (x_range, y_range) der Spalte `col` eines 1×n-Subplots."""
+    suffix = "" if col == 1 else str(col)
+    windows = []
+    for axis in (f"xaxis{suffix}", f"yaxis{suffix}"):
+        window = (view_ranges or {}).get(aliases.get(axis, axis))
+        windows.append(tuple(window) if window is not None and None not in window else None)
+    return tuple(windows)
+
+
+def apply_view_ranges(fig, view_ranges, aliases=SHARED_Y_AXES):
+    """Übernimmt den Zoom-Zustand in das Layout, damit die neu gezeichnete Figur ihn behält."""
+    for axis, window in (view_ranges or {}).items():
+        if None in window:
+            continue
+        fig.layout[axis].range = list(window)
+        for alias, target in aliases.items():
+            if target == axis:
+                fig.layout[alias].range = list(window)
+
+
+def format_count(value):
+    """Ganzzahl mit deutschem Tausendertrennzeichen (12.345)."""
+    return f"{value:,}".replace(",", ".")
+
+
+def add_decimation_note(fig, shown, total, col=1):
+    """Hinweis „n von N Punkten“ unten rechts in der Spalte `col` (nur bei ausgedünnten Daten)."""
+    if shown >= total:
+        return
+    suffix = "" if col == 1 else str(col)
+    fig.add_annotation(
+        text=f"{format_count(shown)} von {format_count(total)} Punkten – Zoom für volle Auflösung",
+        xref=f"x{suffix} domain", yref=f"y{suffix} domain",
+        x=0.99, y=0.01,
+        xanchor="right", yanchor="bottom",
+        showarrow=False,
+        font=dict(size=10, color="gray")
+    )
@@ -0,0 +1,80 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from utils.plot_utils.decimation import format_count
+
+
+# Wahrnehmungsgleichmäßige Farbskala der Dichte-Heatmaps (logarithmische Anzahl je Zelle)
+DENSITY_COLORSCALE = "Viridis"
+
+
+def density_grid(x, y, x_range, y_range, bins=150):
+    """
+    Zählt Punkte auf einem festen bins×bins-Raster (serverseitig, O(n); NaN entfallen).
+
+    Returns:
+        tuple[np.ndarray]: x-Zellmitten, y-Zellmitten, Anzahl je Zelle (Form (bins_y, bins_x))
+    """
+    counts, x_edges, y_edges = np.histogram2d(
+        np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64),
+        bins=bins, range=[sorted(x_range), sorted(y_range)]
+    )
+    return (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2, counts.T
+
+
+def density_colorbar(max_count, title="Anzahl Punkte", **colorbar_kwargs):
+    """Farbleiste mit Anzahlen als Beschriftung (die Farbe codiert log10 der Anzahl)."""
+    decades = np.arange(int(np.log10(max(max_count, 1))) + 1)
+    return dict(
+        title=dict(text=title, side="right"),
+        tickvals=decades,
+        ticktext=[format_count(10 ** int(d)) for d in decades],
+        **colorbar_kwargs
+    )
+
+
+def density_heatmap(x, y, counts, max_count=None, hovertemplate=None, colorbar=None, **heatmap_kwargs):
+    """
+    Heatmap-Trace einer Zählung (leere Zellen transparent).
+
+    Die Farbe folgt log10 der Anzahl, damit dünn besetzte Randbereiche neben dem dichten Kern
+    sichtbar bleiben; die Anzahl selbst steht in `customdata` für den Hover.
+
+    Parameters:
+        x, y (array-like): Zellmitten
+        counts (np.ndarray): Anzahl je Zelle (Form (len(y), len(x)))
+        max_count (int): Optional, gemeinsames Farbmaximum mehrerer Heatmaps
+        colorbar (dict): Optional, Farbleiste (sonst ohne Farbleiste)
+    """
+    counts = np.asarray(counts, dtype=np.float32)
+    max_count = counts.max() if max_count is None else max_count
+    with np.errstate(divide="ignore"):
+        z = np.where(counts > 0, np.log10(counts), np.nan).astype(np.float32)
+
+    return go.Heatmap(
+        x=x,
+        y=y,
+        z=z,
+        customdata=counts,
+        zmin=0,
+        zmax=max(np.log10(max(max_count, 1)), 1e-6),
+        colorscale=DENSITY_COLORSCALE,
+        showscale=colorbar is not None,
+        colorbar=colorbar,
+        hoverongaps=False,
+        hovertemplate=hovertemplate or "x: %{x}<br>y: %{y}<br>Anzahl: %{customdata:,.0f}<extra></extra>",
+        **heatmap_kwargs
+    )
+
+
+def add_density_note(fig, total, row=1, col=1):
+    """Hinweis auf die Dichtedarstellung unten rechts im Panel (row, col)."""
+    fig.add_annotation(
+        text=f"Dichte aus {format_count(total)} Punkten",
+        xref="x domain", yref="y domain",
+        x=0.99, y=0.01,
+        xanchor="right", yanchor="bottom",
+        showarrow=False,
+        font=dict(size=10, color="gray"),
+        row=row, col=col
+    )
@@ -1,18 +1,25 @@
 import numpy as np
-import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from data.config import COLOR_MAP
+from data.config import COLOR_MAP, DENSITY_BINS
+from utils.plot_utils.decimation import (
+    add_decimation_note,
+    apply_view_ranges,
+    decimate_indices,
+    panel_window
+)
+from utils.plot_utils.density import add_density_note, density_colorbar, density_grid, density_heatmap
 from utils.plot_utils.shared import (
     apply_dark_mode_colors,
     get_global_axis_range,
-    get_global_color_scale_bounds
+    get_global_color_scale_bounds,
+    scatter_trace
 )
 
 from utils.compute_stats import compute_lt_metrics, filter_lt_data
 
 
-def plot_lt_energy_evolution(dataframes, selected_labels, column="energy"):
+def plot_lt_energy_evolution(dataframes, selected_labels, column="energy", metric_table=None):
     title_left = "LT-Bruttoenergie" if column == "energy" else "LT-Wind"
     title_right = "IAV-Energie" if column == "energy" else "IAV-Wind"
 
@@ -24,11 +31,14 @@ def plot_lt_energy_evolution(dataframes, selected_labels, column="energy"):
     )
 
     for label in selected_labels:
-        df = dataframes[label]
-        years, non_cum_mean, cum_mean, cum_cv = compute_lt_metrics(df, column=column)
+        if metric_table is not None and label in metric_table:
+            # Vorberechnet für alle Labels (LT_METRIC_TABLES): nur Lookup
+            years, non_cum_mean, cum_mean, cum_cv = metric_table.get(label)
+        else:
+            years, non_cum_mean, cum_mean, cum_cv = compute_lt_metrics(dataframes[label], column=column)
 
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=years,
                 y=cum_mean,
                 mode="lines",
@@ -40,7 +50,7 @@ def plot_lt_energy_evolution(dataframes, selected_labels, column="energy"):
         )
 
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=years,
                 y=non_cum_mean,
                 mode="lines",
@@ -54,7 +64,7 @@ def plot_lt_energy_evolution(dataframes, selected_labels, column="energy"):
         )
 
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=years,
                 y=cum_cv,
                 mode="lines",
@@ -87,12 +97,19 @@ def plot_lt_energy_evolution(dataframes, selected_labels, column="energy"):
     return fig
 
 
-def plot_lt_energy_slope_comparison(left_df, right_df, selected_years, left_label, right_label):
+def plot_lt_energy_slope_comparison(left_df, right_df, selected_years, left_label, right_label,
+                                    left_stats=None, right_stats=None, point_budget=None, view_ranges=None,
+                                    density_threshold=None):
     left_filtered = filter_lt_data(left_df, selected_years)
     right_filtered = filter_lt_data(right_df, selected_years)
 
-    x_min, x_max = get_global_axis_range("slope", left_filtered, right_filtered)
-    color_min, color_max = get_global_color_scale_bounds("wind", left_filtered, right_filtered)
+    # Bereiche je Jahr aus den Kennzahl-Katalogen (falls übergeben)
+    if left_stats is not None and right_stats is not None:
+        bounds_sources, years = (left_stats, right_stats), selected_years
+    else:
+        bounds_sources, years = (left_filtered, right_filtered), None
+    x_min, x_max = get_global_axis_range("slope", *bounds_sources, years=years)
+    color_min, color_max = get_global_color_scale_bounds("wind", *bounds_sources, years=years)
 
     fig = make_subplots(
         rows=1,
@@ -102,60 +119,114 @@ def plot_lt_energy_slope_comparison(left_df, right_df, selected_years, left_labe
         shared_yaxes=True
     )
 
-    fig.add_trace(
-        go.Scatter(
-            x=left_filtered["slope"],
-            y=left_filtered["energy"],
-            mode="markers",
-            marker=dict(
-                color=left_filtered["wind"],
-                colorscale="RdBu",
-                cmin=color_min,
-                cmax=color_max,
-                colorbar=dict(
-                    title=dict(text="Average LT-Windspeed (m/s)", side="right")
+    # Punkte im sichtbaren Ausschnitt je Panel (Zoom)
+    windows = [panel_window(view_ranges, col) for col in (1, 2)]
+    visible = [
+        decimate_indices(filtered["slope"], filtered["energy"], None, x_range=x_range, y_range=y_range)[0]
+        for filtered, (x_range, y_range) in zip((left_filtered, right_filtered), windows)
+    ]
+    use_density = bool(density_threshold) and max(len(idx) for idx in visible) > density_threshold
+    shown_counts = []
+
+    if use_density:
+        # Oberhalb der Schwelle: Anzahl je Rasterzelle statt Einzelpunkte (Aufwand unabhängig
+        # von der Iterationszahl)
+        y_min, y_max = get_global_axis_range("energy", *bounds_sources, years=years)
+        grids = [
+            density_grid(
+                filtered["slope"].to_numpy()[idx], filtered["energy"].to_numpy()[idx],
+                x_range or (x_min, x_max), y_range or (y_min, y_max), bins=DENSITY_BINS
+            )
+            for filtered, idx, (x_range, y_range) in zip((left_filtered, right_filtered), visible, windows)
+        ]
+        max_count = max(counts.max() for _, _, counts in grids)
+
+        for col, (label, (x_centers, y_centers, counts), idx) in enumerate(
+            zip((left_label, right_label), grids, visible), start=1
+        ):
+            fig.add_trace(
+                density_heatmap(
+                    x_centers, y_centers, counts,
+                    max_count=max_count,
+                    colorbar=density_colorbar(max_count) if col == 1 else None,
+                    name=label,
+                    hovertemplate=(
+                        "Steigung: %{x:.3f} GWh/(m/s)<br>"
+                        "Energie: %{y:.2f} GWh/yr<br>"
+                        "Anzahl: %{customdata:,.0f}<extra></extra>"
+                    )
                 ),
-                showscale=True,
-                size=5,
-                line=dict(color="rgba(255,255,255,0.4)", width=0.2)
-            ),
-            name=left_label,
-            customdata=np.stack((left_filtered["year"],), axis=-1),
-            hovertemplate=(
-                "Jahr: %{customdata[0]}<br>"
-                "Steigung: %{x:.3f} GWh/(m/s)<br>"
-                "Energie: %{y:.2f} GWh/yr<br>"
-                "Wind: %{marker.color:.2f} m/s<br><extra></extra>"
-            ),
-            showlegend=False
-        ),
-        row=1, col=1
-    )
+                row=1, col=col
+            )
+            add_density_note(fig, len(idx), col=col)
+    else:
+        # Oberhalb des Punktbudgets geschichtet ausdünnen (je Panel, nur der sichtbare Ausschnitt)
+        panels = []
+        for filtered, idx in zip((left_filtered, right_filtered), visible):
+            shown = idx
+            if point_budget and len(idx) > point_budget:
+                keep, _ = decimate_indices(
+                    filtered["slope"].to_numpy()[idx], filtered["energy"].to_numpy()[idx], point_budget
+                )
+                shown = idx[keep]
+            panels.append(filtered.iloc[shown] if len(shown) < len(filtered) else filtered)
+            shown_counts.append((len(shown), len(idx)))
+        left_filtered, right_filtered = panels
 
-    fig.add_trace(
-        go.Scatter(
-            x=right_filtered["slope"],
-            y=right_filtered["energy"],
-            mode="markers",
-            marker=dict(
-                color=right_filtered["wind"],
-                colorscale="RdBu",
-                showscale=False,
-                size=5,
-                line=dict(color="rgba(255,255,255,0.5)", width=0.2)
+        fig.add_trace(
+            scatter_trace(
+                x=left_filtered["slope"],
+                y=left_filtered["energy"],
+                mode="markers",
+                marker=dict(
+                    color=left_filtered["wind"],
+                    colorscale="RdBu",
+                    cmin=color_min,
+                    cmax=color_max,
+                    colorbar=dict(
+                        title=dict(text="Average LT-Windspeed (m/s)", side="right")
+                    ),
+                    showscale=True,
+                    size=5,
+                    line=dict(color="rgba(255,255,255,0.4)", width=0.2)
+                ),
+                name=left_label,
+                customdata=np.stack((left_filtered["year"], left_filtered["wind"]), axis=-1),
+                hovertemplate=(
+                    "Jahr: %{customdata[0]}<br>"
+                    "Steigung: %{x:.3f} GWh/(m/s)<br>"
+                    "Energie: %{y:.2f} GWh/yr<br>"
+                    "Wind: %{customdata[1]:.2f} m/s<br><extra></extra>"
+                ),
+                showlegend=False
             ),
-            name=right_label,
-            customdata=np.stack((right_filtered["year"],), axis=-1),
-            hovertemplate=(
-                "Jahr: %{customdata[0]}<br>"
-                "Steigung: %{x:.3f} GWh/(m/s)<br>"
-                "Energie: %{y:.2f} GWh/yr<br>"
-                "Wind: %{marker.color:.2f} m/s<br><extra></extra>"
+            row=1, col=1
+        )
+
+        fig.add_trace(
+            scatter_trace(
+                x=right_filtered["slope"],
+                y=right_filtered["energy"],
+                mode="markers",
+                marker=dict(
+                    color=right_filtered["wind"],
+                    colorscale="RdBu",
+                    showscale=False,
+                    size=5,
+                    line=dict(color="rgba(255,255,255,0.5)", width=0.2)
+                ),
+                name=right_label,
+                customdata=np.stack((right_filtered["year"], right_filtered["wind"]), axis=-1),
+                hovertemplate=(
+                    "Jahr: %{customdata[0]}<br>"
+                    "Steigung: %{x:.3f} GWh/(m/s)<br>"
+                    "Energie: %{y:.2f} GWh/yr<br>"
+                    "Wind: %{customdata[1]:.2f} m/s<br><extra></extra>"
+                ),
+                showlegend=False
             ),
-            showlegend=False
-        ),
-        row=1, col=2
-    )
+            row=1, col=2
+        )
 
     fig.update_layout(
         height=500,
@@ -174,6 +245,10 @@ def plot_lt_energy_slope_comparison(left_df, right_df, selected_years, left_labe
     fig.update_xaxes(showline=True, linewidth=2, linecolor='gray', mirror=True)
     fig.update_yaxes(showline=True, linewidth=2, linecolor='gray', mirror=True)
 
+    for col, (shown, total) in enumerate(shown_counts, start=1):
+        add_decimation_note(fig, shown, total, col=col)
+    apply_view_ranges(fig, view_ranges)
+
     apply_dark_mode_colors(fig)
 
-    return fig
\ No newline at end of file
+    return fig
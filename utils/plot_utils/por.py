@@ -2,13 +2,26 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from utils.plot_utils.shared import apply_dark_mode_colors, get_global_axis_range
-from data.config import COLOR_MAP, METRIC_INFO
+from utils.plot_utils.shared import (
+    add_summary_violin,
+    apply_dark_mode_colors,
+    get_global_axis_range,
+    histogram_bar,
+    scatter_trace,
+    shared_bin_edges
+)
+from data.config import COLOR_MAP, HISTOGRAM_BINS, METRIC_INFO
 from utils.compute_stats import get_iteration
+from utils.por_model import PORModel
 
 
 
-def plot_por_energy_distribution(df1, df2, label1, label2, observed_value, options):
+def plot_por_energy_distribution(df1, df2, label1, label2, observed_value, options, stats1=None, stats2=None,
+                                 violins1=None, violins2=None):
+    use_stats = stats1 is not None and stats2 is not None
+    # Gemeinsame Klassengrenzen beider Analysen
+    edges = shared_bin_edges("gps", *((stats1, stats2) if use_stats else (df1, df2)), bins=HISTOGRAM_BINS)
+
     fig = make_subplots(
         rows=1, cols=2,
         subplot_titles=["Histogramm", "Split-Violinplot"],
@@ -16,19 +29,22 @@ def plot_por_energy_distribution(df1, df2, label1, label2, observed_value, optio
         column_widths=[0.5, 0.5]
     )
 
-    for df, label, color, side in zip(
+    for df, stats, violins, label, color, side in zip(
         [df1, df2],
+        [stats1, stats2],
+        [violins1, violins2],
         [label1, label2],
         [COLOR_MAP.get(label1, "gray"), COLOR_MAP.get(label2, "gray")],
         ["negative", "positive"]
     ):
         gps_vals = df["gps"]
-        mean_val = np.mean(gps_vals)
+        mean_val = stats["gps"]["mean"] if use_stats else np.mean(gps_vals)
         label_with_mean = f"{label} (μ={mean_val:.2f})"
 
         fig.add_trace(
-            go.Histogram(
-                x=gps_vals,
+            histogram_bar(
+                gps_vals,
+                edges,
                 name=label,
                 marker_color=color,
                 opacity=0.6,
@@ -44,21 +60,28 @@ def plot_por_energy_distribution(df1, df2, label1, label2, observed_value, optio
                 row=1, col=1
             )
 
-        fig.add_trace(
-            go.Violin(
-                y=gps_vals,
-                x=["Vergleich"] * len(gps_vals),
-                side=side,
-                name=label_with_mean,
-                line_color=color,
-                fillcolor=color,
-                opacity=0.7,
-                points="all",
-                meanline_visible=True,
-                showlegend=True
-            ),
-            row=1, col=2
-        )
+        if violins is not None:
+            # Vorberechnete Dichte statt aller Punkte
+            add_summary_violin(
+                fig, violins["gps"], 0, color, label_with_mean, side=side,
+                points=violins["gps"]["points"], showlegend=True, row=1, col=2
+            )
+        else:
+            fig.add_trace(
+                go.Violin(
+                    y=gps_vals,
+                    x=["Vergleich"] * len(gps_vals),
+                    side=side,
+                    name=label_with_mean,
+                    line_color=color,
+                    fillcolor=color,
+                    opacity=0.7,
+                    points="all",
+                    meanline_visible=True,
+                    showlegend=True
+                ),
+                row=1, col=2
+            )
 
         if "show-means" in options:
             fig.add_hline(
@@ -102,16 +125,18 @@ def plot_por_energy_distribution(df1, df2, label1, label2, observed_value, optio
 
     fig.update_xaxes(showline=True, linewidth=2, linecolor='gray', mirror=True)
     fig.update_yaxes(showline=True, linewidth=2, linecolor='gray', mirror=True)
+    if violins1 is not None:
+        fig.update_xaxes(tickvals=[0], ticktext=["Vergleich"], row=1, col=2)
 
     apply_dark_mode_colors(fig)
     return fig
 
 
-def plot_por_regression_analysis(df1, df2, metric, value, label1, label2):
+def plot_por_regression_analysis(df1, df2, metric, value, label1, label2, index1=None, index2=None):
     def add_trace(fig, df, source, color, symbol, name, row=1, col=1, showlegend=True):
         filtered = df[df["source"] == source]
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=filtered["wind_speed"],
                 y=filtered["energy"],
                 mode="markers",
@@ -122,8 +147,8 @@ def plot_por_regression_analysis(df1, df2, metric, value, label1, label2):
             row=row, col=col
         )
 
-    iter1 = get_iteration(df1, metric, method=value)
-    iter2 = get_iteration(df2, metric, method=value)
+    iter1 = get_iteration(df1, metric, method=value, index=index1)
+    iter2 = get_iteration(df2, metric, method=value, index=index2)
     df1_filtered = df1[df1["iteration"] == iter1]
     df2_filtered = df2[df2["iteration"] == iter2]
 
@@ -141,7 +166,7 @@ def plot_por_regression_analysis(df1, df2, metric, value, label1, label2):
     y_vals1 = slope1 * x_vals1 + intercept1
 
     fig.add_trace(
-        go.Scatter(
+        scatter_trace(
             x=x_vals1,
             y=y_vals1,
             mode="lines",
@@ -161,7 +186,7 @@ def plot_por_regression_analysis(df1, df2, metric, value, label1, label2):
     y_vals2 = slope2 * x_vals2 + intercept2
 
     fig.add_trace(
-        go.Scatter(
+        scatter_trace(
             x=x_vals2,
             y=y_vals2,
             mode="lines",
@@ -218,37 +243,49 @@ def plot_por_regression_analysis(df1, df2, metric, value, label1, label2):
     return fig
 
 
-def plot_por_energy_timeseries(df_dict, selected_labels, metric="r2", method="max"):
+def plot_por_energy_timeseries(df_dict, selected_labels, metric="r2", method="max", indexes=None):
     fig = go.Figure()
 
     for label in selected_labels:
         df_label = df_dict[label]
-        best_iter = get_iteration(df_label, metric, method)
-        df_iter = df_label[df_label["iteration"] == best_iter].copy().sort_values("time")
-
-        fig.add_trace(go.Scatter(
+        index = indexes[label] if indexes is not None else None
+        if isinstance(df_label, PORModel):
+            # Parameter je Iteration statt materialisierter Zeitreihe: pred_energy on demand
+            best_iter = get_iteration(df_label.params.reset_index(), metric, method, index=index)
+            df_iter = df_label.get_iteration(best_iter).sort_values("time")
+        else:
+            best_iter = get_iteration(df_label, metric, method, index=index)
+            df_iter = df_label[df_label["iteration"] == best_iter].copy().sort_values("time")
+
+        fig.add_trace(scatter_trace(
             x=df_iter["time"],
             y=df_iter["pred_energy"],
             mode="lines+markers",
             name=f"{label} (modelliert)",
             line=dict(color=COLOR_MAP.get(label, "gray"), width=2),
-            marker=dict(size=6)
+            marker=dict(size=6),
+            webgl_threshold=0
         ))
 
-    any_df = list(df_dict.values())[0]
-    ref = (
-        any_df.groupby("time", as_index=False)["gross_energy_gwh"]
-        .first()
-        .sort_values("time")
-    )
+    # Referenz aus einem bereits geladenen (ausgewählten) Datensatz
+    any_df = df_dict[selected_labels[0]] if selected_labels else next(iter(df_dict.values()))
+    if isinstance(any_df, PORModel):
+        ref = any_df.reference()
+    else:
+        ref = (
+            any_df.groupby("time", as_index=False)["gross_energy_gwh"]
+            .first()
+            .sort_values("time")
+        )
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter_trace(
         x=ref["time"],
         y=ref["gross_energy_gwh"],
         mode="lines+markers",
         name="Beobachtete Energie (Referenz)",
         line=dict(color="white", width=2, dash="dot"),
-        marker=dict(size=6)
+        marker=dict(size=6),
+        webgl_threshold=0
     ))
 
     fig.update_layout(
@@ -1,19 +1,37 @@
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from data.config import COLOR_MAP, METRIC_INFO
+from data.config import COLOR_MAP, HISTOGRAM_BINS, METRIC_INFO
+from utils.correlation import CorrelationMatrices, cluster_order
+from utils.plot_utils.decimation import (
+    add_decimation_note,
+    apply_view_ranges,
+    decimate_indices,
+    panel_window
+)
 from utils.plot_utils.shared import (
+    add_summary_violin,
     apply_dark_mode_colors,
     get_global_axis_range,
     get_global_color_scale_bounds,
     get_global_size_bounds,
     break_label,
-    normalize_bubble_size
+    histogram_bar,
+    normalize_bubble_size,
+    scatter_trace,
+    shared_bin_edges
 )
 
 
 
-def plot_reg_model_distribution(df1, df2, metric, label1, label2):
+def plot_reg_model_distribution(df1, df2, metric, label1, label2, stats1=None, stats2=None,
+                                violins1=None, violins2=None):
+    # Gemeinsame Klassengrenzen beider Analysen (aus den Kennzahl-Katalogen, falls übergeben)
+    edges = shared_bin_edges(
+        metric, *((stats1, stats2) if stats1 is not None and stats2 is not None else (df1, df2)),
+        bins=HISTOGRAM_BINS
+    )
+
     fig = make_subplots(
         rows=1,
         cols=2,
@@ -22,15 +40,17 @@ def plot_reg_model_distribution(df1, df2, metric, label1, label2):
         column_widths=[0.5, 0.5],
     )
 
-    for df, label, color, side in zip(
+    for df, violins, label, color, side in zip(
         [df1, df2],
+        [violins1, violins2],
         [label1, label2],
         [COLOR_MAP.get(label1, "gray"), COLOR_MAP.get(label2, "gray")],
         ["negative", "positive"]
     ):
         fig.add_trace(
-            go.Histogram(
-                x=df[metric],
+            histogram_bar(
+                df[metric],
+                edges,
                 name=label,
                 opacity=0.6,
                 marker_color=color,
@@ -38,21 +58,28 @@ def plot_reg_model_distribution(df1, df2, metric, label1, label2):
             ),
             row=1, col=1
         )
-        fig.add_trace(
-            go.Violin(
-                y=df[metric],
-                x=["Vergleich"] * len(df),
-                side=side,
-                name=label,
-                line_color=color,
-                fillcolor=color,
-                opacity=0.7,
-                meanline_visible=True,
-                showlegend=True,
-                points="all"
-            ),
-            row=1, col=2
-        )
+        if violins is not None:
+            # Vorberechnete Dichte statt aller Punkte
+            add_summary_violin(
+                fig, violins[metric], 0, color, label, side=side,
+                points=violins[metric]["points"], showlegend=True, row=1, col=2
+            )
+        else:
+            fig.add_trace(
+                go.Violin(
+                    y=df[metric],
+                    x=["Vergleich"] * len(df),
+                    side=side,
+                    name=label,
+                    line_color=color,
+                    fillcolor=color,
+                    opacity=0.7,
+                    meanline_visible=True,
+                    showlegend=True,
+                    points="all"
+                ),
+                row=1, col=2
+            )
 
     fig.update_layout(
         height=500,
@@ -71,16 +98,21 @@ def plot_reg_model_distribution(df1, df2, metric, label1, label2):
 
     fig.update_xaxes(showline=True, linewidth=2, linecolor='gray', mirror=True)
     fig.update_yaxes(showline=True, linewidth=2, linecolor='gray', mirror=True)
+    if violins1 is not None:
+        fig.update_xaxes(tickvals=[0], ticktext=["Vergleich"], row=1, col=2)
 
     apply_dark_mode_colors(fig)
     return fig
 
 
-def plot_reg_model_metric_scatter(df1, df2, x_metric, y_metric, z_metric, size_metric, label1, label2):
-    x_min, x_max = get_global_axis_range(x_metric, df1, df2)
-    y_min, y_max = get_global_axis_range(y_metric, df1, df2)
-    cmin, cmax = get_global_color_scale_bounds(z_metric, df1, df2)
-    size_min, size_max = get_global_size_bounds(size_metric, df1, df2)
+def plot_reg_model_metric_scatter(df1, df2, x_metric, y_metric, z_metric, size_metric, label1, label2,
+                                  stats1=None, stats2=None, point_budget=None, view_ranges=None):
+    # Achsen-, Farb- und Größenbereiche aus den Kennzahl-Katalogen (falls übergeben)
+    bounds_sources = (stats1, stats2) if stats1 is not None and stats2 is not None else (df1, df2)
+    x_min, x_max = get_global_axis_range(x_metric, *bounds_sources)
+    y_min, y_max = get_global_axis_range(y_metric, *bounds_sources)
+    cmin, cmax = get_global_color_scale_bounds(z_metric, *bounds_sources)
+    size_min, size_max = get_global_size_bounds(size_metric, *bounds_sources)
 
     fig = make_subplots(
         rows=1,
@@ -94,9 +126,16 @@ def plot_reg_model_metric_scatter(df1, df2, x_metric, y_metric, z_metric, size_m
     for df, label, col in zip(
         [df1, df2], [label1, label2], [1, 2]
     ):
+        # Oberhalb des Punktbudgets geschichtet ausdünnen (nur der sichtbare Ausschnitt)
+        x_range, y_range = panel_window(view_ranges, col)
+        idx, total = decimate_indices(df[x_metric], df[y_metric], point_budget, x_range=x_range, y_range=y_range)
+        if len(idx) < len(df):
+            df = df[list(dict.fromkeys([x_metric, y_metric, z_metric, size_metric]))].iloc[idx]
+        add_decimation_note(fig, len(idx), total, col=col)
+
         show_colorbar = (label == label2)
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=df[x_metric],
                 y=df[y_metric],
                 mode="markers",
@@ -145,18 +184,30 @@ def plot_reg_model_metric_scatter(df1, df2, x_metric, y_metric, z_metric, size_m
 
     fig.update_xaxes(showline=True, linewidth=2, linecolor='gray', mirror=True)
     fig.update_yaxes(showline=True, linewidth=2, linecolor='gray', mirror=True)
+    apply_view_ranges(fig, view_ranges)
 
     apply_dark_mode_colors(fig)
     return fig
 
 
-def plot_reg_model_correlation_matrix(left_df, right_df, title_left, title_right, metrics):
-    def compute_corr(df):
-        return df[metrics].corr()
+def plot_reg_model_correlation_matrix(left_df, right_df, title_left, title_right, metrics,
+                                      method="pearson", cluster=False):
+    # CorrelationMatrices (vorberechnet): nur Ausschnitt; DataFrame: direkt berechnen
+    def compute_corr(data):
+        if isinstance(data, CorrelationMatrices):
+            return data.matrix(metrics, method=method)
+        return data[metrics].corr(method=method)
 
     corr_left = compute_corr(left_df)
     corr_right = compute_corr(right_df)
 
+    # Nur Metriken, die in beiden Analysen vorhanden sind, in gemeinsamer Reihenfolge
+    metrics = [m for m in corr_left.columns if m in corr_right.columns]
+    if cluster:
+        metrics = cluster_order(corr_left.loc[metrics, metrics], corr_right.loc[metrics, metrics])
+    corr_left = corr_left.loc[metrics, metrics]
+    corr_right = corr_right.loc[metrics, metrics]
+
     x_labels = [break_label(METRIC_INFO[m]["metric_en"]) for m in metrics]
     y_labels = [break_label(METRIC_INFO[m]["metric_en"]) for m in metrics]
 
@@ -201,7 +252,7 @@ def plot_reg_model_correlation_matrix(left_df, right_df, title_left, title_right
 
     fig.update_layout(
         height=500,
-        title="Korrelationen zwischen Modellkoeffizienten",
+        title=f"Korrelationen zwischen Modellkoeffizienten ({method.capitalize()})",
         title_x=0.5,
     )
 
@@ -1,4 +1,8 @@
-import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from data.config import WEBGL_POINT_THRESHOLD
+from utils.stats_catalog import StatsCatalog
 
 def apply_dark_mode_colors(fig):
     layout_updates = {
@@ -29,10 +33,47 @@ def normalize_bubble_size(series, min_size=3, max_size=20, global_min=None, glob
 
 
 
-def get_global_axis_range(column, *dfs, padding_factor=0.05):
-    all_values = pd.concat([df[column] for df in dfs])
-    min_val = all_values.min()
-    max_val = all_values.max()
+def scatter_trace(x=None, y=None, webgl_threshold=None, **scatter_kwargs):
+    """
+    Scatter-Trace mit automatischer Renderer-Wahl.
+
+    Ab mehr als `webgl_threshold` Punkten (Standard WEBGL_POINT_THRESHOLD, 0 = immer SVG) wird
+    go.Scattergl statt go.Scatter erzeugt, mit denselben Eigenschaften (Stil, Hovertemplate,
+    Farbleiste). Pan/Zoom bleiben damit auch bei vielen Punkten flüssig.
+
+    Parameters:
+        x, y (array-like): Koordinaten
+        webgl_threshold (int): Optional, Punktzahl, ab der Scattergl gewählt wird; 0 = immer
+            SVG. Nötig für Traces auf einer x-Achse mit Rangeslider, da Plotly Scattergl
+            dort nicht zeichnet (z. B. Zeitreihen in data.py und por.py).
+        **scatter_kwargs: Eigenschaften des Traces wie bei go.Scatter
+    """
+    threshold = WEBGL_POINT_THRESHOLD if webgl_threshold is None else webgl_threshold
+    n_points = len(x) if x is not None else len(y) if y is not None else 0
+    trace_type = go.Scattergl if threshold and n_points > threshold else go.Scatter
+    return trace_type(x=x, y=y, **scatter_kwargs)
+
+
+def get_column_bounds(column, *sources, years=None):
+    """
+    Globales (min, max) einer Spalte über mehrere Datensätze, ohne die Spalten zu verketten.
+
+    Quellen sind StatsCatalogs (O(1)-Lookup, mit `years` über die gewählten LT-Jahre) oder
+    DataFrames (z. B. bereits auf eine Iteration gefilterte Daten).
+    """
+    minima, maxima = [], []
+    for source in sources:
+        if isinstance(source, StatsCatalog):
+            min_val, max_val = source.bounds(column, years=years)
+        else:
+            min_val, max_val = source[column].min(), source[column].max()
+        minima.append(min_val)
+        maxima.append(max_val)
+    return np.fmin.reduce(minima), np.fmax.reduce(maxima)
+
+
+def get_global_axis_range(column, *sources, padding_factor=0.05, years=None):
+    min_val, max_val = get_column_bounds(column, *sources, years=years)
 
     range_span = max_val - min_val
     padding = range_span * padding_factor
@@ -40,13 +81,162 @@ def get_global_axis_range(column, *dfs, padding_factor=0.05):
     return min_val - padding, max_val + padding
 
 
-def get_global_color_scale_bounds(column, *dfs):
-    all_values = pd.concat([df[column] for df in dfs])
-    return all_values.min(), all_values.max()
-
-def get_global_size_bounds(column, *dfs):
-    all_values = pd.concat([df[column] for df in dfs])
-    return all_values.min(), all_values.max()
+def get_global_color_scale_bounds(column, *sources, years=None):
+    return get_column_bounds(column, *sources, years=years)
+
+def get_global_size_bounds(column, *sources, years=None):
+    return get_column_bounds(column, *sources, years=years)
+
+
+def shared_bin_edges(column, *sources, bins=50):
+    """
+    Gemeinsame Histogrammgrenzen einer Spalte für alle verglichenen Datensätze.
+
+    Der Bereich kommt wie bei get_column_bounds aus den StatsCatalogs (bzw. DataFrames), die
+    Grenzen hängen daher nicht von der Anzahl der Iterationen ab.
+    """
+    min_val, max_val = get_column_bounds(column, *sources)
+    if not np.isfinite(min_val) or not np.isfinite(max_val):
+        min_val, max_val = 0.0, 1.0
+    if min_val == max_val:
+        min_val, max_val = min_val - 0.5, max_val + 0.5
+    return np.linspace(min_val, max_val, bins + 1)
+
+
+def histogram_bar(values, edges, **bar_kwargs):
+    """
+    Serverseitig gebinntes Histogramm als Bar-Trace (eine Säule je Klasse, Breite = Klassenbreite).
+
+    Übertragen werden nur Klassenmitten und Häufigkeiten statt aller Einzelwerte.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    counts, _ = np.histogram(values[np.isfinite(values)], bins=edges)
+
+    bar_kwargs.setdefault(
+        "hovertemplate",
+        "%{customdata[0]:.4g} – %{customdata[1]:.4g}<br>Anzahl: %{y}<extra>%{fullData.name}</extra>"
+    )
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        customdata=np.stack([edges[:-1], edges[1:]], axis=-1),
+        **bar_kwargs
+    )
+
+
+def add_summary_violin(fig, summary, position, color, name, side="both", width=0.4,
+                       show_box=False, show_mean=True, points=None, showlegend=False,
+                       opacity=0.7, row=None, col=None):
+    """
+    Zeichnet eine Violine aus einer vorberechneten Zusammenfassung (utils.kde.violin_summary).
+
+    Übertragen werden nur Dichtekurve, Quartile, Mittelwert und optional wenige Punkte; die
+    x-Achse ist numerisch (Position je Violine, Beschriftung über tickvals/ticktext).
+
+    Parameters:
+        summary (dict): violin_summary(...) einer Metrik
+        position (float): x-Position der Violine
+        side (str): "both", "negative" (links) oder "positive" (rechts) für Split-Violinen
+        points (array): Optional, einzelne Werte zum Einblenden (z. B. summary["points"])
+    """
+    grid, density = summary["grid"], summary["density"]
+    scale = width / density.max() if density.max() > 0 else 0.0
+    half = density * scale
+
+    if side == "both":
+        x = np.concatenate([position + half, (position - half)[::-1]])
+        y = np.concatenate([grid, grid[::-1]])
+    else:
+        sign = 1 if side == "positive" else -1
+        x = np.concatenate([position + sign * half, [position, position]])
+        y = np.concatenate([grid, [grid[-1], grid[0]]])
+
+    hover_text = (
+        f"{name}<br>n = {summary['n']}<br>Mittelwert: {summary['mean']:.4g}<br>"
+        f"Median: {summary['median']:.4g}<br>Q1 / Q3: {summary['q1']:.4g} / {summary['q3']:.4g}<br>"
+        f"Min / Max: {summary['min']:.4g} / {summary['max']:.4g}"
+    )
+    fig.add_trace(
+        go.Scatter(
+            # float32 genügt für die Darstellung und halbiert die Übertragung
+            x=x.astype(np.float32), y=y.astype(np.float32),
+            mode="lines",
+            fill="toself",
+            fillcolor=color,
+            line=dict(color=color, width=1),
+            opacity=opacity,
+            name=name,
+            legendgroup=name,
+            showlegend=showlegend,
+            hoveron="fills",
+            hoverinfo="text",
+            text=hover_text
+        ),
+        row=row, col=col
+    )
+
+    sign = {"both": 0, "negative": -1, "positive": 1}[side]
+
+    if show_box:
+        box_x = position + sign * width * 0.1
+        fig.add_trace(
+            go.Scatter(
+                x=[box_x, box_x, None, box_x, box_x],
+                y=[summary["lowerfence"], summary["upperfence"], None, summary["q1"], summary["q3"]],
+                mode="lines",
+                line=dict(color="white", width=1.5),
+                legendgroup=name,
+                showlegend=False,
+                hoverinfo="skip"
+            ),
+            row=row, col=col
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=[box_x, box_x, box_x], y=[summary["q1"], summary["median"], summary["q3"]],
+                mode="markers",
+                marker=dict(color=color, size=[0, 7, 0], line=dict(color="white", width=1)),
+                legendgroup=name,
+                showlegend=False,
+                hovertemplate="%{y:.4g}<extra>" + name + "</extra>"
+            ),
+            row=row, col=col
+        )
+
+    if show_mean:
+        mean_half = np.interp(summary["mean"], grid, half)
+        left = position if side == "positive" else position - mean_half
+        right = position if side == "negative" else position + mean_half
+        fig.add_trace(
+            go.Scatter(
+                x=[left, right], y=[summary["mean"], summary["mean"]],
+                mode="lines",
+                line=dict(color="white", width=1.5),
+                legendgroup=name,
+                showlegend=False,
+                hovertemplate="Mittelwert: %{y:.4g}<extra>" + name + "</extra>"
+            ),
+            row=row, col=col
+        )
+
+    if points is not None and len(points):
+        points = np.asarray(points, dtype=np.float64)
+        # Punkte innerhalb der Violine streuen (fester Seed: gleiche Darstellung je Aufruf)
+        rng = np.random.default_rng(0)
+        spread = np.interp(points, grid, half) * rng.uniform(0, 1, len(points))
+        direction = rng.choice([-1, 1], len(points)) if side == "both" else sign
+        fig.add_trace(
+            scatter_trace(
+                x=(position + direction * spread).astype(np.float32), y=points.astype(np.float32),
+                mode="markers",
+                marker=dict(color=color, size=3, opacity=0.6),
+                legendgroup=name,
+                showlegend=False,
+                hovertemplate="%{y:.4g}<extra>" + name + "</extra>"
+            ),
+            row=row, col=col
+        )
 
 
 def break_label(text, threshold=10):
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+from utils.cache import read_csv_cached
+from utils.transform_por import FULL_METRICS, predict_energy_matrix, transform_reg_data_combined
+
+
+class PORModel:
+    """
+    Modellierte POR-Zeitreihe aller Iterationen, ohne sie zu materialisieren.
+
+    Enthält nur die Regressionsparameter je Iteration (`params`, Index = Iteration) und
+    die Aggregat-Zeitreihe (time, gross_energy_gwh, wind_speed). `pred_energy` wird erst
+    beim Zugriff auf eine Iteration berechnet (slope * wind_speed + intercept).
+    """
+
+    def __init__(self, params, aggregate, name=None):
+        self.params = params
+        self.aggregate = aggregate
+        self.name = name
+
+    @property
+    def n_iterations(self):
+        return len(self.params)
+
+    @property
+    def n_times(self):
+        return len(self.aggregate)
+
+    @property
+    def nbytes(self):
+        return int(self.params.memory_usage(deep=True).sum() + self.aggregate.memory_usage(deep=True).sum())
+
+    def __repr__(self):
+        return f"PORModel(name={self.name!r}, n_iterations={self.n_iterations}, n_times={self.n_times})"
+
+    def get_iteration(self, iteration):
+        """
+        Zeilen einer Iteration wie in der materialisierten POR-Tabelle (mode="full").
+
+        Returns:
+            pd.DataFrame: time, gross_energy_gwh, wind_speed, pred_energy, iteration,
+            slope, intercept, r2, mse, yearly_bias, dataset
+        """
+        if iteration not in self.params.index:
+            raise KeyError(f"Iteration {iteration} nicht vorhanden (0..{self.n_iterations - 1}).")
+
+        row = self.params.loc[iteration]
+        iter_df = self.aggregate.copy()
+        iter_df["pred_energy"] = predict_energy_matrix(
+            [row["slope"]], [row["intercept"]], iter_df["wind_speed"]
+        )[0]
+        iter_df["iteration"] = iteration
+        for metric in FULL_METRICS:
+            iter_df[metric] = row[metric]
+        iter_df["dataset"] = self.name
+
+        return iter_df
+
+    def reference(self):
+        """Beobachtete Bruttoenergie je Zeitpunkt (time, gross_energy_gwh), zeitlich sortiert."""
+        return self.aggregate[["time", "gross_energy_gwh"]].sort_values("time").reset_index(drop=True)
+
+    def to_frame(self):
+        """Vollständige Langtabelle aller Iterationen (nur für Export/Vergleich)."""
+        return transform_reg_data_combined(
+            self.params.reset_index(drop=True), self.aggregate, "wind_speed",
+            dataset_name=self.name,
+            mode="full"
+        )
+
+
+def load_por_model(mc_path, aggregate_path, wind_column, cache_dir, name=None, engine="pandas"):
+    """
+    Lädt die Regressionsparameter (MC-Ergebnisse) und die Aggregat-Zeitreihe eines Datensatzes.
+
+    Beide Dateien laufen über den Feather-Cache; ein geändertes Aggregat wird daher beim
+    nächsten Laden ohne weiteren Build-Schritt berücksichtigt.
+
+    Parameters:
+        mc_path (str): MC-Ergebnisse (data/raw/mc_*.csv)
+        aggregate_path (str): Aggregat-Zeitreihe (data/raw/mc_*_aggregate.csv)
+        wind_column (str): Windspalte im Aggregat (z. B. "era5")
+        cache_dir (str): Verzeichnis des Feather-Caches
+        name (str): Datensatzname (Spalte `dataset`)
+        engine (str): CSV-Parser beim Neuaufbau des Caches
+
+    Returns:
+        PORModel
+    """
+    params = read_csv_cached(mc_path, cache_dir, engine=engine, usecols=FULL_METRICS)
+    aggregate_df = read_csv_cached(aggregate_path, cache_dir, engine=engine, parse_dates=["time"])
+
+    if wind_column not in aggregate_df.columns:
+        raise ValueError(f"Spalte '{wind_column}' nicht in {aggregate_path} gefunden!")
+
+    params = params[FULL_METRICS].reset_index(drop=True)
+    params.index = np.arange(len(params), dtype=np.int64)
+    params.index.name = "iteration"
+
+    aggregate = (
+        aggregate_df[["time", "gross_energy_gwh", wind_column]]
+        .rename(columns={wind_column: "wind_speed"})
+        .reset_index(drop=True)
+    )
+    aggregate["time"] = pd.to_datetime(aggregate["time"])
+
+    return PORModel(params, aggregate, name=name)
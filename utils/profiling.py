@@ -0,0 +1,131 @@
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+# Aktiv über `python app.py --profile-startup` oder OPENOA_PROFILE_STARTUP=1
+PROFILE_STARTUP = (
+    os.environ.get("OPENOA_PROFILE_STARTUP", "0") == "1"
+    or "--profile-startup" in sys.argv
+)
+PROFILE_OUTPUT = os.environ.get("OPENOA_PROFILE_OUTPUT", "")
+
+_records = []
+_local = threading.local()
+_lock = threading.Lock()
+_origin = time.perf_counter()
+
+
+def is_profiling():
+    return PROFILE_STARTUP
+
+
+@contextmanager
+def profile_section(kind, name):
+    """
+    Misst Wall-Zeit und netto allokierten Speicher eines Abschnitts.
+
+    Verschachtelte Abschnitte (z. B. Datensatz-Laden innerhalb eines Layout-Imports)
+    werden erkannt; `self_s` enthält die Zeit ohne die Kind-Abschnitte.
+    Ohne aktives Profiling ist der Kontextmanager wirkungslos.
+    """
+    if not PROFILE_STARTUP:
+        yield
+        return
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+
+    record = {
+        "kind": kind,
+        "name": name,
+        "thread": threading.current_thread().name,
+        "depth": len(stack),
+        "child_s": 0.0,
+    }
+    stack.append(record)
+    mem_start = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        stack.pop()
+
+        record["start_s"] = start - _origin
+        record["wall_s"] = end - start
+        record["self_s"] = record["wall_s"] - record.pop("child_s")
+        record["alloc_mb"] = (tracemalloc.get_traced_memory()[0] - mem_start) / 1e6
+        if stack:
+            stack[-1]["child_s"] += record["wall_s"]
+
+        with _lock:
+            _records.append(record)
+
+
+def get_records():
+    with _lock:
+        return list(_records)
+
+
+def format_report(records, top=None):
+    """Nach Wall-Zeit absteigend sortierte Tabelle aller Abschnitte."""
+    ranked = sorted(records, key=lambda r: r["wall_s"], reverse=True)[:top]
+
+    lines = [f"{'Typ':<10} {'Abschnitt':<48} {'Wall (s)':>9} {'Eigen (s)':>9} {'Alloc (MB)':>10}"]
+    lines.append("-" * len(lines[0]))
+    for r in ranked:
+        lines.append(
+            f"{r['kind']:<10} {r['name'][:48]:<48} {r['wall_s']:>9.3f} "
+            f"{r['self_s']:>9.3f} {r['alloc_mb']:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def write_trace(path, records):
+    """
+    Schreibt die Abschnitte als JSON: eigene Liste (`sections`) plus Chrome-Trace-Events
+    (`traceEvents`, ladbar in chrome://tracing bzw. Perfetto).
+    """
+    events = [
+        {
+            "name": r["name"],
+            "cat": r["kind"],
+            "ph": "X",
+            "ts": r["start_s"] * 1e6,
+            "dur": r["wall_s"] * 1e6,
+            "pid": os.getpid(),
+            "tid": r["thread"],
+            "args": {"alloc_mb": r["alloc_mb"], "self_s": r["self_s"]},
+        }
+        for r in records
+    ]
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"sections": records, "traceEvents": events}, f, indent=2)
+
+
+def finish_startup_profile(total_name="import app"):
+    """Gibt die Rangliste aus und schreibt ggf. die JSON-Trace-Datei (OPENOA_PROFILE_OUTPUT)."""
+    if not PROFILE_STARTUP:
+        return
+
+    records = get_records()
+    total = time.perf_counter() - _origin
+    peak_mb = tracemalloc.get_traced_memory()[1] / 1e6 if tracemalloc.is_tracing() else 0.0
+
+    print(f"\n⏱  Startprofil ({total_name}): {total:.3f} s gesamt, Peak {peak_mb:.1f} MB (tracemalloc)")
+    print(format_report(records))
+
+    if PROFILE_OUTPUT:
+        write_trace(PROFILE_OUTPUT, records)
+        print(f"Trace gespeichert: {PROFILE_OUTPUT}")
@@ -0,0 +1,143 @@
+import math
+import re
+
+import numpy as np
+
+from utils.por_model import PORModel
+
+
+# Feste Auswahlwerte der Dropdowns -> Quantil
+NAMED_QUANTILES = {
+    "min": 0.0,
+    "q1": 0.25,
+    "median": 0.5,
+    "q3": 0.75,
+    "max": 1.0,
+}
+
+PERCENTILE_PATTERN = re.compile(r"^\s*p?\s*(\d+(?:[.,]\d+)?)\s*%?\s*$", re.IGNORECASE)
+
+
+def parse_iteration_method(method):
+    """
+    Übersetzt eine Auswahl ("max", "median", "q1", "p5", "p95", "12.5", "p2,5" …) in ein Quantil.
+
+    Returns:
+        float: Quantil in [0, 1]
+    """
+    if not isinstance(method, str):
+        raise ValueError(f"Unbekannte Methode: {method}")
+
+    key = method.strip().lower()
+    if key in NAMED_QUANTILES:
+        return NAMED_QUANTILES[key]
+
+    match = PERCENTILE_PATTERN.match(key)
+    if match is None:
+        raise ValueError(f"Unbekannte Methode: {method}")
+    percentile = float(match.group(1).replace(",", "."))
+    if not 0 <= percentile <= 100:
+        raise ValueError(f"Perzentil muss zwischen 0 und 100 liegen: {method}")
+    return percentile / 100
+
+
+def format_percentile(method):
+    """Normierter Wert ("p95", "p12.5") und Anzeigetext einer Perzentil-Auswahl."""
+    percentile = parse_iteration_method(method) * 100
+    text = f"{percentile:g}"
+    return f"p{text}", f"p{text} – {text}. Perzentil"
+
+
+class IterationRankIndex:
+    """
+    Je Metrik nach Wert sortierte Iterationen (eine Zeile je Iteration).
+
+    Quantile werden wie bei pandas linear interpoliert (O(1) auf den sortierten Werten),
+    die Iteration mit dem nächstgelegenen Wert per binärer Suche bestimmt. Bei gleichem
+    Abstand gewinnt wie bei `idxmin` die kleinere Iteration.
+
+    Parameters:
+        iterations (np.ndarray): Iterations-IDs
+        values (dict): Metrik -> Werte je Iteration (gleiche Reihenfolge wie `iterations`)
+    """
+
+    def __init__(self, iterations, values):
+        iterations = np.asarray(iterations)
+        self._sorted = {}
+
+        for metric, metric_values in values.items():
+            metric_values = np.asarray(metric_values, dtype=np.float64)
+            valid = ~np.isnan(metric_values)
+            # Sortiert nach (Wert, Iteration): gleiche Werte in aufsteigender Iteration
+            order = np.lexsort((iterations[valid], metric_values[valid]))
+            self._sorted[metric] = (metric_values[valid][order], iterations[valid][order])
+
+    @property
+    def metrics(self):
+        return list(self._sorted)
+
+    @property
+    def nbytes(self):
+        return sum(v.nbytes + it.nbytes for v, it in self._sorted.values())
+
+    def __repr__(self):
+        return f"IterationRankIndex(metrics={self.metrics})"
+
+    def _get(self, metric):
+        if metric not in self._sorted:
+            raise ValueError(f"Metrik '{metric}' nicht im Rang-Index.")
+        values, iterations = self._sorted[metric]
+        if len(values) == 0:
+            raise ValueError(f"Keine Werte für Metrik '{metric}'.")
+        return values, iterations
+
+    def quantile(self, metric, q):
+        """Quantil einer Metrik (lineare Interpolation wie pd.Series.quantile)."""
+        values, _ = self._get(metric)
+        position = q * (len(values) - 1)
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (position - lower) * (values[upper] - values[lower])
+
+    def nearest_iteration(self, metric, target):
+        """Iteration, deren Wert `target` am nächsten liegt."""
+        values, iterations = self._get(metric)
+        position = np.searchsorted(values, target, side="left")
+
+        candidates = []
+        if position < len(values):
+            candidates.append(position)
+        if position > 0:
+            # Erste Iteration mit dem nächstkleineren Wert
+            candidates.append(np.searchsorted(values, values[position - 1], side="left"))
+
+        return min(candidates, key=lambda k: (abs(values[k] - target), iterations[k]))
+
+    def get_iteration(self, metric, method="max"):
+        """Iteration für max/min/median/q1/q3 oder ein beliebiges Perzentil (z. B. "p95")."""
+        _, iterations = self._get(metric)
+        target = self.quantile(metric, parse_iteration_method(method))
+        return iterations[self.nearest_iteration(metric, target)]
+
+
+def build_iteration_index(data, metrics, iteration_column="iteration"):
+    """
+    Rang-Index aus einem PORModel (Parameter je Iteration) oder einer Langtabelle mit
+    `iteration`-Spalte (z. B. POR-Scatterdaten); dort zählt die erste Zeile je Iteration.
+    """
+    if isinstance(data, PORModel):
+        per_iteration = data.params
+        iterations = per_iteration.index.to_numpy()
+    else:
+        per_iteration = data.drop_duplicates(iteration_column)
+        iterations = per_iteration[iteration_column].to_numpy()
+
+    return IterationRankIndex(
+        iterations,
+        {metric: per_iteration[metric].to_numpy() for metric in metrics if metric in per_iteration.columns}
+    )
+
+
+def load_iteration_index(registry, label, metrics):
+    """Loader für eine Index-Registry: Rang-Index des geladenen Datensatzes `registry[label]`."""
+    return build_iteration_index(registry[label], metrics)
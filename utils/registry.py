@@ -0,0 +1,257 @@
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import numpy as np
+
+from utils.profiling import profile_section
+
+
+def _is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, (np.memmap, mmap.mmap)):
+            return True
+        array = getattr(array, "base", None)
+    return False
+
+
+def estimate_nbytes(obj):
+    """
+    Schätzt den Speicherbedarf eines geladenen Datensatzes in Bytes.
+
+    Memory-mapped Arrays (z. B. einer LTMatrix aus dem .npy-Cache) zählen nicht: ihre Seiten
+    liegen im Page-Cache und kann das Betriebssystem jederzeit wieder freigeben.
+    """
+    if hasattr(obj, "memory_usage"):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if isinstance(obj, np.ndarray):
+        return 0 if _is_memory_mapped(obj) else int(obj.nbytes)
+    if hasattr(obj, "nbytes"):
+        mapped = sum(
+            value.nbytes for value in getattr(obj, "__dict__", {}).values()
+            if isinstance(value, np.ndarray) and _is_memory_mapped(value)
+        )
+        return int(obj.nbytes) - int(mapped)
+    return 0
+
+
+class MemoryBudget:
+    """
+    Speicherbudget mit LRU-Reihenfolge, das sich mehrere DatasetRegistries teilen können.
+
+    Jede Registry meldet geladene Datensätze an (`charge`) und Zugriffe (`touch`). Übersteigt
+    die Summe das Budget, liefert `charge` die am längsten nicht genutzten Einträge aller
+    beteiligten Registries, die verdrängt werden sollen.
+
+    Parameters:
+        budget_mb (float): Speicherbudget in MB (None = unbegrenzt)
+    """
+
+    def __init__(self, budget_mb=None):
+        self.budget_mb = budget_mb
+        self._entries = OrderedDict()  # (id(registry), label) -> (registry, label, Bytes)
+        self._lock = threading.Lock()
+
+    def charge(self, registry, label, nbytes):
+        """
+        Trägt einen geladenen Datensatz ein.
+
+        Returns:
+            list[tuple]: (registry, label) der zu verdrängenden Einträge, ältester zuerst
+        """
+        key = (id(registry), label)
+        with self._lock:
+            self._entries[key] = (registry, label, nbytes)
+            self._entries.move_to_end(key)
+            if self.budget_mb is None:
+                return []
+
+            budget = self.budget_mb * 1e6
+            total = sum(entry[2] for entry in self._entries.values())
+            victims = []
+            for other, (other_registry, other_label, other_nbytes) in list(self._entries.items()):
+                if total <= budget or other == key:
+                    break
+                victims.append((other_registry, other_label))
+                total -= other_nbytes
+                del self._entries[other]
+            return victims
+
+    def touch(self, registry, label):
+        key = (id(registry), label)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def release(self, registry, label):
+        with self._lock:
+            self._entries.pop((id(registry), label), None)
+
+    def usage_mb(self):
+        with self._lock:
+            return sum(entry[2] for entry in self._entries.values()) / 1e6
+
+
+class DatasetRegistry(Mapping):
+    """
+    Lazy geladenes Mapping Label -> Datensatz mit LRU-Verdrängung.
+
+    Jedes Label wird erst beim ersten Zugriff über seine Loader-Funktion geladen.
+    Ist ein Speicherbudget gesetzt, werden die am längsten nicht genutzten Labels
+    verworfen, sobald die Summe der geladenen Datensätze das Budget überschreitet.
+    Verworfene Labels werden beim nächsten Zugriff erneut geladen.
+
+    Parameters:
+        loaders (dict): Label -> Funktion ohne Argumente, die den Datensatz liefert
+        memory_budget_mb (float): Eigenes Speicherbudget in MB (None = unbegrenzt)
+        memory_budget (MemoryBudget): Optional, mit anderen Registries geteiltes Budget
+            (hat Vorrang vor `memory_budget_mb`)
+        name (str): Für Logging
+        postprocess (callable): Optional, wird nach dem Laden auf jeden Datensatz
+            angewendet (z. B. compact_dataframe); Speicher vorher/nachher wird geloggt
+        sources (dict): Optional Label -> Liste der Quelldateien; ändern sich Größe oder
+            mtime einer Datei (z. B. nach ingest_iterations), wird das Label neu geladen
+    """
+
+    def __init__(self, loaders=None, memory_budget_mb=None, name=None, postprocess=None, sources=None,
+                 memory_budget=None):
+        self._loaders = dict(loaders or {})
+        self._loaded = OrderedDict()
+        self._sizes = {}
+        self._label_locks = {}
+        self._lock = threading.RLock()
+        self.memory_budget = memory_budget if memory_budget is not None else MemoryBudget(memory_budget_mb)
+        self.name = name or "Datensätze"
+        self.postprocess = postprocess
+        self._sources = dict(sources or {})
+        self._signatures = {}
+
+    # --- Mapping-Schnittstelle ---
+    def __getitem__(self, label):
+        if label not in self._loaders:
+            raise KeyError(label)
+
+        with self._lock:
+            if label in self._loaded and self._sources_changed(label):
+                print(f"{self.name}[{label}]: Quelldatei geändert, wird neu geladen.")
+                self._drop(label)
+            if label in self._loaded:
+                self._loaded.move_to_end(label)
+                self.memory_budget.touch(self, label)
+                return self._loaded[label]
+            label_lock = self._label_locks.setdefault(label, threading.Lock())
+
+        # Laden außerhalb der Registry-Sperre, damit verschiedene Labels parallel laden können
+        with label_lock:
+            with self._lock:
+                if label in self._loaded:
+                    self._loaded.move_to_end(label)
+                    self.memory_budget.touch(self, label)
+                    return self._loaded[label]
+
+            signature = self._source_signature(label)
+            with profile_section("dataset", f"{self.name}[{label}]"):
+                data = self._loaders[label]()
+                if self.postprocess is not None:
+                    data = self._apply_postprocess(label, data)
+
+            with self._lock:
+                self._loaded[label] = data
+                self._sizes[label] = estimate_nbytes(data)
+                self._signatures[label] = signature
+
+            # Verdrängen ohne gehaltene Registry-Sperre: das Budget kann Einträge anderer
+            # Registries betreffen, die ihre eigene Sperre nehmen
+            for registry, victim in self.memory_budget.charge(self, label, self._sizes[label]):
+                print(
+                    f"{registry.name}: '{victim}' aus dem Speicher verdrängt "
+                    f"(Budget {self.memory_budget.budget_mb} MB)."
+                )
+                registry.evict(victim)
+            return data
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def __contains__(self, label):
+        # Ohne Laden beantworten (Mapping.__contains__ würde __getitem__ aufrufen)
+        return label in self._loaders
+
+    def __repr__(self):
+        return (
+            f"DatasetRegistry({self.name!r}, labels={list(self._loaders)}, "
+            f"geladen={list(self._loaded)})"
+        )
+
+    # --- Verwaltung ---
+    def register(self, label, loader):
+        """Registriert (oder ersetzt) einen Loader. Ein bereits geladener Stand wird verworfen."""
+        with self._lock:
+            self._loaders[label] = loader
+            self._drop(label)
+
+    def loader(self, label):
+        """Loader-Funktion eines Labels (z. B. für das Laden in einem anderen Prozess)."""
+        return self._loaders[label]
+
+    def is_loaded(self, label):
+        return label in self._loaded
+
+    def loaded_labels(self):
+        with self._lock:
+            return list(self._loaded)
+
+    def evict(self, label):
+        """Verwirft den geladenen Stand eines Labels (wird beim nächsten Zugriff neu geladen)."""
+        with self._lock:
+            self._drop(label)
+
+    @property
+    def memory_budget_mb(self):
+        return self.memory_budget.budget_mb
+
+    def clear(self):
+        with self._lock:
+            for label in self._loaded:
+                self.memory_budget.release(self, label)
+            self._loaded.clear()
+            self._sizes.clear()
+
+    def memory_usage_mb(self):
+        with self._lock:
+            return sum(self._sizes.values()) / 1e6
+
+    def _apply_postprocess(self, label, data):
+        before = estimate_nbytes(data)
+        data = self.postprocess(data)
+        after = estimate_nbytes(data)
+        if before != after:
+            print(f"{self.name}[{label}]: {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB")
+        return data
+
+    def _drop(self, label):
+        self.memory_budget.release(self, label)
+        self._loaded.pop(label, None)
+        self._sizes.pop(label, None)
+        self._signatures.pop(label, None)
+
+    def _source_signature(self, label):
+        signature = []
+        for path in self._sources.get(label, []):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _sources_changed(self, label):
+        if label not in self._sources:
+            return False
+        return self._signatures.get(label) != self._source_signature(label)
@@ -0,0 +1,288 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import is_cache_valid, write_atomic_json
+
+
+def _finite(values):
+    values = np.asarray(values, dtype=np.float64).ravel()
+    return values[np.isfinite(values)]
+
+
+class RunningMoments:
+    """
+    Anzahl, Mittelwert, Varianz (Welford/Chan), Minimum und Maximum einer Kennzahl.
+
+    Neue Werte werden blockweise eingearbeitet; das Ergebnis entspricht der Berechnung
+    über alle Werte (NaN werden wie bei pandas ignoriert, std mit ddof=1).
+    """
+
+    def __init__(self, count=0, mean=0.0, m2=0.0, minimum=np.inf, maximum=-np.inf):
+        self.count = int(count)
+        self.mean = float(mean)
+        self.m2 = float(m2)
+        self.minimum = float(minimum)
+        self.maximum = float(maximum)
+
+    def update(self, values):
+        values = _finite(values)
+        if len(values) == 0:
+            return self
+
+        n_b = len(values)
+        mean_b = values.mean()
+        m2_b = ((values - mean_b) ** 2).sum()
+
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta ** 2 * self.count * n_b / n
+        self.count = n
+        self.minimum = min(self.minimum, values.min())
+        self.maximum = max(self.maximum, values.max())
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.variance))
+
+    @property
+    def cv(self):
+        return self.std / self.mean if self.mean else np.nan
+
+    def to_dict(self):
+        return {"count": self.count, "mean": self.mean, "m2": self.m2, "minimum": self.minimum, "maximum": self.maximum}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+class QuantileSketch:
+    """
+    Zusammenfassung einer Verteilung für Quantile in begrenztem Speicher.
+
+    Solange höchstens `max_size` Werte vorliegen, sind die Quantile exakt (lineare
+    Interpolation wie pandas). Darüber werden benachbarte Werte paarweise zu gewichteten
+    Zentren zusammengefasst; der Fehler bleibt auf wenige Ränge begrenzt.
+    """
+
+    def __init__(self, max_size=4096, means=None, weights=None):
+        self.max_size = int(max_size)
+        self.means = np.asarray(means if means is not None else [], dtype=np.float64)
+        self.weights = np.asarray(weights if weights is not None else [], dtype=np.float64)
+
+    @property
+    def count(self):
+        return float(self.weights.sum())
+
+    def update(self, values):
+        values = _finite(values)
+        if len(values) == 0:
+            return self
+
+        means = np.concatenate([self.means, values])
+        weights = np.concatenate([self.weights, np.ones(len(values))])
+        order = np.argsort(means, kind="stable")
+        self.means, self.weights = means[order], weights[order]
+
+        while len(self.means) > self.max_size:
+            self._compress()
+        return self
+
+    def _compress(self):
+        n_pairs = len(self.means) // 2
+        head_w = self.weights[:2 * n_pairs].reshape(n_pairs, 2)
+        head_m = self.means[:2 * n_pairs].reshape(n_pairs, 2)
+        weights = head_w.sum(axis=1)
+        means = (head_m * head_w).sum(axis=1) / weights
+
+        if len(self.means) % 2:
+            means = np.append(means, self.means[-1])
+            weights = np.append(weights, self.weights[-1])
+        self.means, self.weights = means, weights
+
+    def quantile(self, q):
+        if len(self.means) == 0:
+            return np.nan
+        # Rang (0-basiert) der Zentren; Zielrang wie pandas: q * (n - 1)
+        ranks = np.cumsum(self.weights) - self.weights / 2 - 0.5
+        return float(np.interp(np.asarray(q) * (self.count - 1), ranks, self.means))
+
+    def to_dict(self):
+        return {"max_size": self.max_size, "means": self.means.tolist(), "weights": self.weights.tolist()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+class RunningCovariance:
+    """
+    Mittelwerte und Ko-Momente mehrerer Kennzahlen für laufende Korrelationen.
+
+    Berücksichtigt nur Zeilen, in denen alle Kennzahlen endlich sind.
+    """
+
+    def __init__(self, columns, count=0, mean=None, comoment=None):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.count = int(count)
+        self.mean = np.asarray(mean if mean is not None else np.zeros(k), dtype=np.float64)
+        self.comoment = np.asarray(comoment if comoment is not None else np.zeros((k, k)), dtype=np.float64)
+
+    def update(self, df):
+        values = df[self.columns].to_numpy(np.float64)
+        values = values[np.isfinite(values).all(axis=1)]
+        if len(values) == 0:
+            return self
+
+        n_b = len(values)
+        mean_b = values.mean(axis=0)
+        centered = values - mean_b
+        comoment_b = centered.T @ centered
+
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.comoment = self.comoment + comoment_b + np.outer(delta, delta) * self.count * n_b / n
+        self.mean = self.mean + delta * n_b / n
+        self.count = n
+        return self
+
+    def correlation(self):
+        """Pearson-Korrelationsmatrix als DataFrame (Spalten = Kennzahlen)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scale = np.sqrt(np.diag(self.comoment))
+            corr = self.comoment / np.outer(scale, scale)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def to_dict(self):
+        return {
+            "columns": self.columns,
+            "count": self.count,
+            "mean": self.mean.tolist(),
+            "comoment": self.comoment.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+class DatasetStats:
+    """
+    Laufende Kennzahlen eines MC-Datensatzes (eine Zeile je Iteration).
+
+    Je Kennzahl: RunningMoments und QuantileSketch; zusätzlich RunningCovariance über
+    `correlation_metrics`. Neue Iterationen werden mit `update` eingearbeitet, ohne die
+    bisherigen Zeilen erneut zu lesen. `source` hält die Signatur der Rohdatei (siehe
+    utils/cache.source_metadata), auf die sich die Kennzahlen beziehen.
+    """
+
+    QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+    def __init__(self, metrics, correlation_metrics=None, sketch_size=4096):
+        self.metrics = list(metrics)
+        self.n_iterations = 0
+        self.moments = {metric: RunningMoments() for metric in self.metrics}
+        self.sketches = {metric: QuantileSketch(sketch_size) for metric in self.metrics}
+        self.covariance = RunningCovariance(correlation_metrics or [])
+        self.source = None
+
+    def update(self, df):
+        for metric in self.metrics:
+            if metric in df.columns:
+                self.moments[metric].update(df[metric])
+                self.sketches[metric].update(df[metric])
+        if self.covariance.columns:
+            self.covariance.update(df)
+        self.n_iterations += len(df)
+        return self
+
+    def summary(self, metric):
+        """count, mean, std, cv, min, max und Quantile (q05 … q95) einer Kennzahl."""
+        moments = self.moments[metric]
+        result = {
+            "count": moments.count,
+            "mean": moments.mean if moments.count else np.nan,
+            "std": moments.std,
+            "cv": moments.cv,
+            "min": moments.minimum if moments.count else np.nan,
+            "max": moments.maximum if moments.count else np.nan,
+        }
+        for q in self.QUANTILES:
+            result[f"q{round(q * 100):02d}"] = self.sketches[metric].quantile(q)
+        return result
+
+    def summary_frame(self):
+        return pd.DataFrame({metric: self.summary(metric) for metric in self.metrics}).T
+
+    def correlation(self):
+        return self.covariance.correlation()
+
+    # --- Speichern/Laden ---
+    def to_dict(self):
+        return {
+            "metrics": self.metrics,
+            "n_iterations": self.n_iterations,
+            "moments": {metric: m.to_dict() for metric, m in self.moments.items()},
+            "sketches": {metric: s.to_dict() for metric, s in self.sketches.items()},
+            "covariance": self.covariance.to_dict(),
+            "source": self.source,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data["metrics"])
+        stats.n_iterations = data["n_iterations"]
+        stats.moments = {metric: RunningMoments.from_dict(m) for metric, m in data["moments"].items()}
+        stats.sketches = {metric: QuantileSketch.from_dict(s) for metric, s in data["sketches"].items()}
+        stats.covariance = RunningCovariance.from_dict(data["covariance"])
+        stats.source = data.get("source")
+        return stats
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        write_atomic_json(path, self.to_dict())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def load_dataset_stats(path, source_path):
+    """
+    Gespeicherte Kennzahlen, sofern sie zum aktuellen Stand von `source_path` passen.
+
+    Returns:
+        DatasetStats oder None (fehlt, unlesbar oder zu einem anderen Rohdatenstand)
+    """
+    if not os.path.exists(path) or not os.path.exists(source_path):
+        return None
+    try:
+        stats = DatasetStats.load(path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"⚠️  Kennzahlen {path} nicht lesbar: {e}")
+        return None
+    if not stats.source or not is_cache_valid(source_path, stats.source):
+        return None
+    return stats
+
+
+def stats_metrics(df, exclude=("i",)):
+    """Numerische Kennzahlen eines MC-Datensatzes (ohne Laufindex)."""
+    return [column for column in df.select_dtypes("number").columns if column not in exclude]
+
+
+def compute_dataset_stats(df, sketch_size=4096):
+    """DatasetStats über alle numerischen Kennzahlen (inkl. Korrelationen) eines MC-Datensatzes."""
+    metrics = stats_metrics(df)
+    return DatasetStats(metrics, correlation_metrics=metrics, sketch_size=sketch_size).update(df)
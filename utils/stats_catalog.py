@@ -0,0 +1,200 @@
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from utils.lt_store import LTMatrix
+from utils.running_stats import load_dataset_stats
+
+
+# Quantile und Histogramm-Klassen je Kennzahl
+CATALOG_QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+CATALOG_HIST_BINS = 50
+
+# Felder einer LTMatrix: 2-D (Iteration x Jahr) bzw. 1-D (je Iteration)
+LT_YEARLY_FIELDS = ["energy", "wind"]
+LT_ITERATION_FIELDS = ["slope", "intercept", "yearly_bias"]
+
+
+def column_stats(values, bins=CATALOG_HIST_BINS):
+    """
+    Kennzahlen einer Werte-Reihe (NaN/inf werden ignoriert, std mit ddof=1 wie pandas).
+
+    Returns:
+        dict: count, min, max, mean, std, q05 … q95, hist_edges (np.ndarray)
+    """
+    values = np.asarray(values, dtype=np.float64).ravel()
+    values = values[np.isfinite(values)]
+    count = len(values)
+
+    stats = {
+        "count": count,
+        "min": float(values.min()) if count else np.nan,
+        "max": float(values.max()) if count else np.nan,
+        "mean": float(values.mean()) if count else np.nan,
+        "std": float(values.std(ddof=1)) if count > 1 else np.nan,
+    }
+    quantiles = np.quantile(values, CATALOG_QUANTILES) if count else [np.nan] * len(CATALOG_QUANTILES)
+    for q, value in zip(CATALOG_QUANTILES, quantiles):
+        stats[f"q{round(q * 100):02d}"] = float(value)
+    stats["hist_edges"] = np.histogram_bin_edges(values, bins=bins) if count else np.array([])
+    return stats
+
+
+class StatsCatalog(Mapping):
+    """
+    Kennzahlen aller Metriken eines Datensatzes, einmal beim Laden berechnet.
+
+    Mapping Metrik -> dict (siehe column_stats). Für LT-Daten liegen zusätzlich Minimum
+    und Maximum je Jahr vor, sodass auch Achsenbereiche für eine Jahresauswahl ohne
+    Zugriff auf die Daten beantwortet werden.
+
+    Parameters:
+        stats (dict): Metrik -> column_stats(...)
+        name (str): Datensatzname (für Logging)
+        years (np.ndarray): Optional, Jahre der Spalten von `by_year`
+        by_year (dict): Optional, Metrik -> {"min": Array je Jahr, "max": Array je Jahr}
+    """
+
+    def __init__(self, stats, name=None, years=None, by_year=None):
+        self._stats = dict(stats)
+        self.name = name
+        self.years = np.asarray(years) if years is not None else None
+        self.by_year = dict(by_year or {})
+
+    def __getitem__(self, metric):
+        if metric not in self._stats:
+            raise KeyError(f"Metrik '{metric}' nicht im Kennzahl-Katalog ({self.name}).")
+        return self._stats[metric]
+
+    def __iter__(self):
+        return iter(self._stats)
+
+    def __len__(self):
+        return len(self._stats)
+
+    def __repr__(self):
+        return f"StatsCatalog(name={self.name!r}, metrics={list(self._stats)})"
+
+    @property
+    def nbytes(self):
+        return sum(s["hist_edges"].nbytes for s in self._stats.values())
+
+    def get(self, metric, stat=None, default=None):
+        if metric not in self._stats:
+            return default
+        return self._stats[metric] if stat is None else self._stats[metric].get(stat, default)
+
+    def bounds(self, metric, years=None):
+        """
+        (min, max) einer Metrik; mit `years` nur über die gewählten Jahre (LT-Daten).
+        """
+        if years is None or metric not in self.by_year:
+            return self[metric]["min"], self[metric]["max"]
+
+        mask = np.isin(self.years, list(years))
+        if not mask.any():
+            return np.nan, np.nan
+        return (
+            float(np.fmin.reduce(self.by_year[metric]["min"][mask])),
+            float(np.fmax.reduce(self.by_year[metric]["max"][mask]))
+        )
+
+    def summary_frame(self):
+        """Übersicht als DataFrame (eine Zeile je Metrik, ohne Histogrammgrenzen)."""
+        return pd.DataFrame({
+            metric: {key: value for key, value in stats.items() if key != "hist_edges"}
+            for metric, stats in self._stats.items()
+        }).T
+
+
+def build_stats_catalog(df, metrics, name=None, bins=CATALOG_HIST_BINS):
+    """
+    Kennzahl-Katalog eines MC-Datensatzes (eine Zeile je Iteration).
+
+    Parameters:
+        df (pd.DataFrame): Datensatz
+        metrics (list): Zu erfassende Metriken (z. B. METRIC_INFO); fehlende bzw.
+            nicht numerische Spalten werden übersprungen
+        name (str): Datensatzname
+
+    Returns:
+        StatsCatalog
+    """
+    stats = {
+        metric: column_stats(df[metric], bins=bins)
+        for metric in metrics
+        if metric in df.columns and pd.api.types.is_numeric_dtype(df[metric])
+    }
+    return StatsCatalog(stats, name=name)
+
+
+def build_stats_catalog_from_dataset_stats(dataset_stats, metrics, name=None, bins=CATALOG_HIST_BINS):
+    """
+    Kennzahl-Katalog aus gespeicherten laufenden Kennzahlen (DatasetStats), ohne die Daten zu lesen.
+
+    count, mean, std, min und max sind exakt; die Quantile stammen aus dem QuantileSketch
+    (exakt bis zu dessen Größe, darüber auf wenige Ränge genau). Die Histogrammgrenzen
+    ergeben sich wie bei np.histogram_bin_edges aus min und max.
+    """
+    stats = {}
+    for metric in metrics:
+        if metric not in dataset_stats.metrics:
+            continue
+        summary = dataset_stats.summary(metric)
+        entry = {key: summary[key] for key in ("count", "min", "max", "mean", "std")}
+        entry["std"] = entry["std"] if entry["count"] > 1 else np.nan
+        for q in CATALOG_QUANTILES:
+            key = f"q{round(q * 100):02d}"
+            entry[key] = float(summary[key]) if entry["count"] else np.nan
+        entry["hist_edges"] = (
+            np.histogram_bin_edges(np.array([entry["min"], entry["max"]]), bins=bins)
+            if entry["count"] else np.array([])
+        )
+        stats[metric] = entry
+    return StatsCatalog(stats, name=name)
+
+
+def build_lt_stats_catalog(matrix, metrics, name=None, bins=CATALOG_HIST_BINS):
+    """
+    Kennzahl-Katalog einer LTMatrix inkl. Minimum/Maximum je Jahr.
+
+    Kennzahlen beziehen sich wie in der Langtabelle auf alle (Iteration, Jahr)-Zeilen;
+    die Parameter je Iteration (slope, …) zählen daher je abgedecktem Jahr einmal.
+    """
+    energy = np.asarray(matrix.energy)
+    has_value = ~np.isnan(energy)
+    stats, by_year = {}, {}
+
+    for metric in metrics:
+        if metric in LT_YEARLY_FIELDS:
+            values = np.asarray(getattr(matrix, metric))
+        elif metric in LT_ITERATION_FIELDS:
+            values = np.where(has_value, np.asarray(getattr(matrix, metric))[:, None], np.nan)
+        else:
+            continue
+
+        stats[metric] = column_stats(values, bins=bins)
+        # fmin/fmax ignorieren NaN ohne Warnung; Jahre ohne Werte bleiben NaN
+        by_year[metric] = {"min": np.fmin.reduce(values, axis=0), "max": np.fmax.reduce(values, axis=0)}
+
+    return StatsCatalog(stats, name=name, years=matrix.years, by_year=by_year)
+
+
+def load_stats_catalog(registry, label, metrics, stats_path=None, source_path=None):
+    """
+    Loader für eine Katalog-Registry.
+
+    Passen die gespeicherten Kennzahlen unter `stats_path` (build_artifacts bzw.
+    ingest_iterations) zum Stand der Rohdatei `source_path`, wird der Katalog daraus gebildet,
+    ohne den Datensatz zu laden. Sonst wird der geladene Datensatz `registry[label]` gescannt.
+    """
+    if stats_path is not None:
+        dataset_stats = load_dataset_stats(stats_path, source_path)
+        if dataset_stats is not None:
+            return build_stats_catalog_from_dataset_stats(dataset_stats, metrics, name=label)
+
+    data = registry[label]
+    if isinstance(data, LTMatrix):
+        return build_lt_stats_catalog(data, metrics, name=label)
+    return build_stats_catalog(data, metrics, name=label)
@@ -1,57 +1,112 @@
+import warnings
+
 import numpy as np
 import pandas as pd
 import ast  # Für sicheres Parsen von Strings zu Listen
 
-def transform_energy_wind_data(df, dataset_name=None):
-    data = []
 
-    for iteration in range(len(df)):
-        try:
-            # Sicheres Parsen
-            energy_raw = df.iloc[iteration]["yearly_gross_energy"]
-            wind_raw = df.iloc[iteration]["yearly_wind_speeds"]
+LT_COLUMNS = ["Iteration", "year", "energy", "wind", "slope", "intercept", "yearly_bias"]
 
-            # Konvertieren, wenn nötig, von String zu Liste
-            if isinstance(energy_raw, str):
-                energy_values = ast.literal_eval(energy_raw)
-            else:
-                energy_values = energy_raw
 
-            if isinstance(wind_raw, str):
-                wind_values = ast.literal_eval(wind_raw)
+# --- Schneller Parser für verschachtelte Listen-Spalten ---
+def parse_nested_float_lists(values):
+    """
+    Parst eine Spalte mit (ggf. verschachtelten) Zahlenlisten in einem Durchgang.
+
+    Strings wie "[1.0, 2.0]" oder "[[1.0], [2.0]]" werden ohne ast.literal_eval gelesen:
+    Klammern entfernen, alle Zeilen zu einem Text verbinden und mit np.fromstring parsen.
+    Bereits geparste Listen/Arrays werden flach übernommen.
+
+    Parameters:
+        values (pd.Series | array-like): Ein Eintrag pro Iteration
+
+    Returns:
+        tuple: (flat float64-Array, starts int64, counts int64); counts = -1 für Zeilen,
+        die nicht gelesen werden konnten
+    """
+    values = np.asarray(values, dtype=object)
+    is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+
+    flat = None
+    if is_str.all():
+        text = pd.Series(values, dtype=object).str.replace(r"[\[\]]", "", regex=True).str.strip()
+        counts = np.where(text.str.len().to_numpy() == 0, 0, text.str.count(",").to_numpy() + 1)
+        joined = ",".join(t for t in text if t)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            flat = np.fromstring(joined, sep=",") if joined else np.empty(0)
+        if len(flat) != counts.sum():
+            flat = None  # Nicht-numerische Einträge: zeilenweise lesen, um sie zu überspringen
+
+    if flat is None:
+        # Gemischte Spalte (z. B. bereits geparste Listen oder NaN): zeilenweise
+        arrays, counts = [], []
+        for value in values:
+            try:
+                if isinstance(value, str):
+                    value = ast.literal_eval(value)
+                if np.ndim(value) == 0:
+                    raise TypeError("kein Listenwert")
+                array = np.asarray(value, dtype=np.float64).ravel()
+            except (ValueError, TypeError, SyntaxError):
+                array, count = np.empty(0), -1
             else:
-                wind_values = wind_raw
+                count = len(array)
+            arrays.append(array)
+            counts.append(count)
+        counts = np.asarray(counts, dtype=np.int64)
+        flat = np.concatenate(arrays) if arrays else np.empty(0)
+
+    counts = np.asarray(counts, dtype=np.int64)
+    sizes = np.maximum(counts, 0)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64)
+    return flat, starts, counts
+
+
+def transform_energy_wind_data(df, dataset_name=None):
+    """
+    Wandelt die MC-Ergebnisse (eine Zeile je Iteration) in eine Langtabelle mit einer
+    Zeile je Iteration und Jahr um.
 
-            wind_values = np.array(wind_values).flatten()
+    Die Listen-Spalten `yearly_gross_energy` und `yearly_wind_speeds` werden gesammelt
+    geparst; die Ausgabe entsteht über Index-Arrays statt einer Schleife je Jahr. Wie
+    bisher wird Jahr 1 dem letzten Listeneintrag zugeordnet.
 
-            slope_value = df.iloc[iteration]["slope"]
-            intercept_value = df.iloc[iteration]["intercept"]
-            bias_value = df.iloc[iteration]["yearly_bias"]
+    Parameters:
+        df (pd.DataFrame): MC-Ergebnisse mit yearly_gross_energy, yearly_wind_speeds,
+            slope, intercept, yearly_bias
+        dataset_name (str): Name für die Statusausgabe
 
-            num_years = len(energy_values)
+    Returns:
+        pd.DataFrame: Iteration, year, energy, wind, slope, intercept, yearly_bias
+    """
+    energy_flat, energy_starts, energy_counts = parse_nested_float_lists(df["yearly_gross_energy"])
+    wind_flat, wind_starts, wind_counts = parse_nested_float_lists(df["yearly_wind_speeds"])
 
-            for year_index in range(num_years):
-                wind_speed = wind_values[num_years - 1 - year_index]
-                if isinstance(wind_speed, (list, np.ndarray)):
-                    wind_speed = wind_speed[0]
+    # Zeilen wie im bisherigen Loop überspringen, wenn sie nicht lesbar sind
+    invalid = (energy_counts < 0) | (wind_counts < 0) | (wind_counts < energy_counts)
+    for iteration in np.flatnonzero(invalid):
+        print(f"Fehler bei Iteration {iteration}: Energie-/Windliste fehlt oder ist zu kurz")
 
-                data.append({
-                    "Iteration": iteration,
-                    "year": year_index + 1,
-                    "energy": energy_values[num_years - 1 - year_index],
-                    "wind": float(wind_speed),
-                    "slope": slope_value,
-                    "intercept": intercept_value,
-                    "yearly_bias": bias_value,
-                })
+    num_years = np.where(invalid, 0, energy_counts)
+    iteration = np.repeat(np.arange(len(df), dtype=np.int64), num_years)
 
-        except Exception as e:
-            print(f"Fehler bei Iteration {iteration}: {e}")
-            continue  
+    # Position innerhalb der Iteration (0-basiert) -> Jahr 1 = letzter Listeneintrag
+    row_start = np.concatenate([[0], np.cumsum(num_years)[:-1]]).astype(np.int64)
+    year_index = np.arange(len(iteration), dtype=np.int64) - row_start[iteration]
+    reversed_index = num_years[iteration] - 1 - year_index
 
-    transformed_df = pd.DataFrame(data)
+    transformed_df = pd.DataFrame({
+        "Iteration": iteration,
+        "year": year_index + 1,
+        "energy": energy_flat[energy_starts[iteration] + reversed_index],
+        "wind": wind_flat[wind_starts[iteration] + reversed_index],
+        "slope": df["slope"].to_numpy()[iteration],
+        "intercept": df["intercept"].to_numpy()[iteration],
+        "yearly_bias": df["yearly_bias"].to_numpy()[iteration],
+    }, columns=LT_COLUMNS)
 
     if dataset_name:
         print(f"Transformation für {dataset_name} abgeschlossen. {len(transformed_df)} Zeilen erstellt.")
 
-    return transformed_df
\ No newline at end of file
+    return transformed_df
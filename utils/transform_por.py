@@ -1,12 +1,132 @@
+import os
+import time
+
+import numpy as np
 import pandas as pd
 
+from utils.bootstrap_store import SOURCE_LABELS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+SCATTER_METRICS = ["slope", "intercept", "mse", "r2", "yearly_bias"]
+FULL_METRICS = ["slope", "intercept", "r2", "mse", "yearly_bias"]
+
+
+def _scatter_from_store(df, bootstrap_store, start=0, stop=None):
+    n_iterations = min(len(df), bootstrap_store.n_iterations)
+    stop = n_iterations if stop is None else min(stop, n_iterations)
+    points = bootstrap_store.slice(start, stop)
+    iteration = np.asarray(points["iteration"], dtype=np.int64)
+
+    scatter_df = pd.DataFrame({
+        "time": np.asarray(points["time"]),
+        "wind_speed": np.asarray(points["wind_speed"]),
+        "energy": np.asarray(points["energy"]),
+        "iteration": iteration,
+    })
+    for metric in SCATTER_METRICS:
+        scatter_df[metric] = df[metric].reindex(iteration).to_numpy()
+    scatter_df["source"] = SOURCE_LABELS[np.asarray(points["source"])]
+
+    return scatter_df
+
+
+def _scatter_from_lists(df, bootstrap_list, non_bootstrap_list, start=0, stop=None):
+    frames = []
+    stop = len(df) if stop is None else min(stop, len(df))
+
+    for i in range(start, stop):
+        try:
+            b_raw = bootstrap_list[i].reset_index()
+            nb_raw = non_bootstrap_list[i].reset_index()
+
+            b_raw.columns = ['time', 'wind_speed', 'energy']
+            nb_raw.columns = ['time', 'wind_speed', 'energy']
+
+            metrics = {
+                "iteration": i,
+                "slope": df.loc[i, "slope"],
+                "intercept": df.loc[i, "intercept"],
+                "mse": df.loc[i, "mse"],
+                "r2": df.loc[i, "r2"],
+                "yearly_bias": df.loc[i, "yearly_bias"]
+            }
+
+            for key, value in metrics.items():
+                b_raw[key] = value
+                nb_raw[key] = value
+
+            b_raw["source"] = "bootstrap"
+            nb_raw["source"] = "non-bootstrap"
+
+            frames.extend([b_raw, nb_raw])
+        except Exception as e:
+            print(f"Fehler in Iteration {i} (scatter): {e}")
+            continue
+
+    return frames
+
+
+def predict_energy_matrix(slope, intercept, wind_speed, dtype=np.float64):
+    """
+    Modellvorhersage aller Iterationen für alle Zeitpunkte als äußeres Produkt.
+
+    Parameters:
+        slope (array-like): Steigung je Iteration (Länge n_iterations)
+        intercept (array-like): Achsenabschnitt je Iteration
+        wind_speed (array-like): Windgeschwindigkeit je Zeitpunkt (Länge n_times)
+        dtype (np.dtype): Ergebnistyp; float32 halbiert den Speicher großer Matrizen
+
+    Returns:
+        np.ndarray: Matrix (n_iterations x n_times) mit slope * wind + intercept
+    """
+    slope = np.asarray(slope, dtype=dtype)
+    intercept = np.asarray(intercept, dtype=dtype)
+    wind_speed = np.asarray(wind_speed, dtype=dtype)
+
+    prediction = np.multiply.outer(slope, wind_speed)
+    prediction += intercept[:, None]
+    return prediction
+
+
+def _full_from_broadcast(df, aggregate_df, wind_column):
+    if wind_column not in aggregate_df.columns:
+        raise ValueError(f"Spalte '{wind_column}' nicht in aggregate_df gefunden!")
+
+    iterations = np.arange(len(df), dtype=np.int64)
+    params = {metric: df[metric].reindex(iterations).to_numpy(np.float64) for metric in FULL_METRICS}
+    n_times = len(aggregate_df)
+    wind_speed = aggregate_df[wind_column].to_numpy(np.float64)
+
+    # Iterationsweise untereinander, wie zuvor beim Anhängen je Iteration
+    full_df = pd.DataFrame({
+        "time": np.tile(pd.to_datetime(aggregate_df["time"]).to_numpy(), len(df)),
+        "gross_energy_gwh": np.tile(aggregate_df["gross_energy_gwh"].to_numpy(), len(df)),
+        "wind_speed": np.tile(wind_speed, len(df)),
+        "pred_energy": predict_energy_matrix(params["slope"], params["intercept"], wind_speed).ravel(),
+        "iteration": np.repeat(iterations, n_times),
+    })
+    for metric in FULL_METRICS:
+        full_df[metric] = np.repeat(params[metric], n_times)
+
+    return full_df
+
+
 def transform_reg_data_combined(df, aggregate_df, wind_column,
                                  bootstrap_list=None, non_bootstrap_list=None,
-                                 dataset_name=None, mode="scatter"):
+                                 dataset_name=None, mode="scatter",
+                                 bootstrap_store=None):
     """
     Kombinierte Transformationsfunktion für:
     - scatter: Bootstrap & Non-Bootstrap Punkte je Iteration
-    - full: Anwendung des Modells auf komplette Zeitreihe
+    - full: Anwendung des Modells auf komplette Zeitreihe (alle Iterationen als äußeres
+      Produkt, siehe predict_energy_matrix)
 
     Parameters:
         df (pd.DataFrame): Regressionsmetriken mit slope, intercept etc.
@@ -14,6 +134,7 @@ def transform_reg_data_combined(df, aggregate_df, wind_column,
         wind_column (str): Name der Windspalte im aggregate_df (z. B. "era5")
         bootstrap_list (List[pd.DataFrame]): Liste mit Bootstrap-DFs (nur bei mode="scatter")
         non_bootstrap_list (List[pd.DataFrame]): Liste mit Non-Bootstrap-DFs
+        bootstrap_store (BootstrapStore): Alternative zu den Listen (flache, memory-mapped Punkte)
         dataset_name (str): Für Logging und Rückverfolgung
         mode (str): "scatter" oder "full"
 
@@ -25,76 +146,116 @@ def transform_reg_data_combined(df, aggregate_df, wind_column,
     if mode not in ["scatter", "full"]:
         raise ValueError("Ungültiger Modus: 'mode' muss 'scatter' oder 'full' sein.")
 
-    if mode == "scatter":
-        if not bootstrap_list or not non_bootstrap_list:
-            raise ValueError("Für 'scatter' müssen bootstrap_list & non_bootstrap_list übergeben werden.")
-
-        for i in range(len(df)):
-            try:
-                b_raw = bootstrap_list[i].reset_index()
-                nb_raw = non_bootstrap_list[i].reset_index()
-
-                b_raw.columns = ['time', 'wind_speed', 'energy']
-                nb_raw.columns = ['time', 'wind_speed', 'energy']
+    if mode == "scatter" and bootstrap_store is not None:
+        all_data.append(_scatter_from_store(df, bootstrap_store))
 
-                metrics = {
-                    "iteration": i,
-                    "slope": df.loc[i, "slope"],
-                    "intercept": df.loc[i, "intercept"],
-                    "mse": df.loc[i, "mse"],
-                    "r2": df.loc[i, "r2"],
-                    "yearly_bias": df.loc[i, "yearly_bias"]
-                }
-
-                for key, value in metrics.items():
-                    b_raw[key] = value
-                    nb_raw[key] = value
-
-                b_raw["source"] = "bootstrap"
-                nb_raw["source"] = "non-bootstrap"
+    elif mode == "scatter":
+        if not bootstrap_list or not non_bootstrap_list:
+            raise ValueError("Für 'scatter' müssen bootstrap_store oder bootstrap_list & non_bootstrap_list übergeben werden.")
 
-                all_data.extend([b_raw, nb_raw])
-            except Exception as e:
-                print(f"Fehler in Iteration {i} (scatter): {e}")
-                continue
+        all_data.extend(_scatter_from_lists(df, bootstrap_list, non_bootstrap_list))
 
     elif mode == "full":
-        if wind_column not in aggregate_df.columns:
-            raise ValueError(f"Spalte '{wind_column}' nicht in aggregate_df gefunden!")
-
-        for i in range(len(df)):
-            try:
-                slope = df.loc[i, "slope"]
-                intercept = df.loc[i, "intercept"]
-
-                metrics = {
-                    "iteration": i,
-                    "slope": slope,
-                    "intercept": intercept,
-                    "r2": df.loc[i, "r2"],
-                    "mse": df.loc[i, "mse"],
-                    "yearly_bias": df.loc[i, "yearly_bias"]
-                }
-
-                iter_df = aggregate_df[["time", "gross_energy_gwh", wind_column]].copy()
-                iter_df = iter_df.rename(columns={wind_column: "wind_speed"})
-                iter_df["pred_energy"] = slope * iter_df["wind_speed"] + intercept
-
-                for key, value in metrics.items():
-                    iter_df[key] = value
-
-                all_data.append(iter_df)
-            except Exception as e:
-                print(f"Fehler in Iteration {i} (full): {e}")
-                continue
+        all_data.append(_full_from_broadcast(df, aggregate_df, wind_column))
 
     if not all_data:
         raise ValueError("Keine gültigen Daten zum Zusammenführen gefunden.")
 
-    full_df = pd.concat(all_data, ignore_index=True)
+    # Vektorisierte Pfade liefern bereits einen einzigen Frame (keine weitere Kopie)
+    full_df = all_data[0] if len(all_data) == 1 else pd.concat(all_data, ignore_index=True)
     full_df["time"] = pd.to_datetime(full_df["time"])
     full_df["dataset"] = dataset_name
 
     print(f"Transformation ({mode}) für {dataset_name} abgeschlossen. {len(full_df)} Zeilen erstellt.")
     return full_df
 
+
+# --- Streaming-Ausgabe (scatter) ---
+def write_scatter_streaming(df, output_path, bootstrap_store=None,
+                            bootstrap_list=None, non_bootstrap_list=None,
+                            dataset_name=None, chunk_size=250, file_format=None,
+                            start_iteration=0, stop_iteration=None):
+    """
+    Schreibt die Scatter-Daten blockweise, statt alle Iterationen im Speicher zu sammeln.
+
+    Je Block von `chunk_size` Iterationen wird die Scatter-Tabelle erzeugt und sofort an
+    die Ausgabedatei angehängt (CSV) bzw. als eigene Row Group geschrieben (Parquet).
+    Der Speicherbedarf hängt damit nur von der Blockgröße ab. Die Datei entsteht zunächst
+    unter `<output_path>.tmp` und ersetzt das Ziel erst nach vollständigem Schreiben.
+
+    Parameters:
+        df (pd.DataFrame): Regressionsmetriken mit slope, intercept etc.
+        output_path (str): Zieldatei (.csv oder .parquet)
+        bootstrap_store (BootstrapStore): Punkte je Iteration (bevorzugt)
+        bootstrap_list / non_bootstrap_list (List[pd.DataFrame]): Alternative zum Store
+        dataset_name (str): Wert der Spalte `dataset`, für Logging
+        chunk_size (int): Iterationen je Block
+        file_format (str): "csv" oder "parquet" (None = aus der Dateiendung)
+        start_iteration / stop_iteration (int): Nur diesen Iterationsbereich schreiben
+            (z. B. als Teilaufgabe in utils/parallel_transform.py)
+
+    Returns:
+        dict: rows, chunks, seconds
+    """
+    file_format = file_format or ("parquet" if output_path.endswith(".parquet") else "csv")
+    if file_format not in ["csv", "parquet"]:
+        raise ValueError("Ungültiges Format: 'file_format' muss 'csv' oder 'parquet' sein.")
+    if file_format == "parquet" and not HAS_PYARROW:
+        raise ValueError("Für Parquet-Ausgabe wird pyarrow benötigt.")
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' muss mindestens 1 sein.")
+
+    if bootstrap_store is not None:
+        n_iterations = min(len(df), bootstrap_store.n_iterations)
+    elif bootstrap_list and non_bootstrap_list:
+        n_iterations = len(df)
+    else:
+        raise ValueError("Für 'scatter' müssen bootstrap_store oder bootstrap_list & non_bootstrap_list übergeben werden.")
+    if stop_iteration is not None:
+        n_iterations = min(n_iterations, stop_iteration)
+
+    tmp_path = f"{output_path}.tmp"
+    writer = None
+    rows = chunks = 0
+    start_time = time.perf_counter()
+
+    try:
+        for start in range(start_iteration, n_iterations, chunk_size):
+            stop = min(start + chunk_size, n_iterations)
+
+            if bootstrap_store is not None:
+                chunk_df = _scatter_from_store(df, bootstrap_store, start, stop)
+            else:
+                frames = _scatter_from_lists(df, bootstrap_list, non_bootstrap_list, start, stop)
+                if not frames:
+                    continue
+                chunk_df = pd.concat(frames, ignore_index=True)
+
+            chunk_df["time"] = pd.to_datetime(chunk_df["time"])
+            chunk_df["dataset"] = dataset_name
+
+            if file_format == "csv":
+                chunk_df.to_csv(tmp_path, mode="w" if chunks == 0 else "a", header=chunks == 0, index=False)
+            else:
+                table = pa.Table.from_pandas(chunk_df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema)
+                writer.write_table(table)
+
+            rows += len(chunk_df)
+            chunks += 1
+            print(
+                f"  {dataset_name}: {stop}/{n_iterations} Iterationen, "
+                f"{rows} Zeilen ({time.perf_counter() - start_time:.1f} s)"
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if chunks == 0:
+        raise ValueError("Keine gültigen Daten zum Schreiben gefunden.")
+
+    os.replace(tmp_path, output_path)
+    seconds = time.perf_counter() - start_time
+    print(f"Transformation (scatter, gestreamt) für {dataset_name} abgeschlossen. {rows} Zeilen in {chunks} Blöcken.")
+    return {"rows": rows, "chunks": chunks, "seconds": seconds}